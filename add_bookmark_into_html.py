@@ -1,30 +1,82 @@
 import os
-import fitz
+import shutil
+import threading
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import fitz
+
+# 동시에 실행할 pdf2htmlEX 변환 수
+PDF2HTML_JOBS = 4
+# 변환 하나의 제한 시간 (초). 넘으면 WSL 안의 pdf2htmlEX 를 종료하고 다시 시도
+PDF2HTML_TIMEOUT = 600
+# 제한 시간에 보낸 종료 신호 (SIGTERM) 로 끝나지 않으면 강제 종료 (SIGKILL) 할 때까지 기다리는 시간 (초)
+PDF2HTML_KILL_AFTER = 10
+# WSL 의 timeout 이 끝내지 못한 경우를 대비해 wsl 프로세스를 기다리는 추가 시간 (초)
+PDF2HTML_WSL_GRACE = 30
+# timeout 명령의 종료 코드 (제한 시간 초과, 강제 종료)
+TIMEOUT_EXIT_CODES = (124, 128 + 9)
+# 실패하거나 시간을 넘긴 변환을 다시 시도하는 횟수
+PDF2HTML_RETRIES = 1
+# 책갈피를 넣을 때 HTML 파일을 읽는 단위 (한 줄이 매우 길어도 이만큼씩만 읽음)
+READ_CHUNK_SIZE = 1024 * 1024
+
+log_lock = threading.Lock()
 
 
 def extract_bookmarks(pdf_path):
-    doc = fitz.open(pdf_path)
-    toc = doc.get_toc(simple=False)
+    with fitz.open(pdf_path) as doc:
+        toc = doc.get_toc(simple=False)
     return toc
 
 
 # def pdf2html()
 # wsl ~/pdf2htmlEX-0.18.8.rc1-master-20200630-Ubuntu-focal-x86_64.AppImage 커맨드 사용
-def pdf2html(pdf_path, html_path, pdf_alphabet, html_alphabet):
+def pdf2html_command(pdf_path, html_path, pdf_alphabet, html_alphabet, timeout=PDF2HTML_TIMEOUT):
     pdf_path = pdf_path.replace(f'{pdf_alphabet}:\\', '')
     html_path = html_path.replace(f'{html_alphabet}:\\', '')
     pdf_path = pdf_path.replace('\\', '/')
     html_path = html_path.replace('\\', '/')
     pdf_alphabet = pdf_alphabet.lower()
     html_alphabet = html_alphabet.lower()
-    html_result = subprocess.run(
-        ['wsl', '~/pdf2htmlEX-0.18.8.rc1-master-20200630-Ubuntu-focal-x86_64.AppImage', '--process-outline', '0', f'/mnt/{pdf_alphabet}/'+pdf_path, '--dest-dir', f'/mnt/{html_alphabet}/'+html_path])
-    print(html_result.stdout)
-    if (html_result.returncode == 0):
-        print(f"[변환 완료] {pdf_path}")
-    else:
-        print(f"[변환 실패] {pdf_path}")
+    # wsl.exe 만 종료하면 WSL 안의 pdf2htmlEX 가 계속 실행되므로, WSL 안에서 timeout 으로 실행하여 프로세스 그룹째 종료
+    return ['wsl', 'timeout', '--kill-after', str(PDF2HTML_KILL_AFTER), str(timeout),
+            '~/pdf2htmlEX-0.18.8.rc1-master-20200630-Ubuntu-focal-x86_64.AppImage', '--process-outline', '0', f'/mnt/{pdf_alphabet}/'+pdf_path, '--dest-dir', f'/mnt/{html_alphabet}/'+html_path]
+
+
+def pdf2html(pdf_path, html_path, pdf_alphabet, html_alphabet, timeout=PDF2HTML_TIMEOUT, retries=PDF2HTML_RETRIES):
+    """
+    pdf2htmlEX 로 PDF 를 HTML 로 변환합니다. 실패하거나 timeout 초를 넘기면 retries 번까지 다시 시도합니다.
+    여러 변환이 동시에 실행되므로 출력은 모아 두었다가 실패한 경우에만 보여줍니다.
+    wsl 프로세스 자체가 응답하지 않으면 WSL 안의 변환이 끝났는지 알 수 없으므로 다시 시도하지 않습니다.
+
+    Returns:
+        bool: 변환 성공 여부.
+    """
+    command = pdf2html_command(pdf_path, html_path, pdf_alphabet, html_alphabet, timeout)
+    for attempt in range(retries + 1):
+        try:
+            html_result = subprocess.run(command, capture_output=True,
+                                         timeout=timeout + PDF2HTML_KILL_AFTER + PDF2HTML_WSL_GRACE)
+        except subprocess.TimeoutExpired:
+            # 같은 HTML 에 두 변환이 동시에 쓰지 않도록 다시 시도하지 않음
+            print(f"[변환 시간 초과] {pdf_path} (wsl 응답 없음, 다시 시도하지 않음)")
+            return False
+        except OSError as e:
+            print(f"[변환 실패] {pdf_path} ({e})")
+            return False
+
+        if html_result.returncode == 0:
+            print(f"[변환 완료] {pdf_path}")
+            return True
+        if html_result.returncode in TIMEOUT_EXIT_CODES:
+            # WSL 안의 timeout 이 pdf2htmlEX 를 종료한 뒤이므로 다시 시도해도 됨
+            print(f"[변환 시간 초과] {pdf_path} ({attempt + 1}/{retries + 1}회, {timeout}초)")
+            continue
+        output = (html_result.stderr or html_result.stdout or b'').decode('utf-8', errors='replace').strip()
+        print(f"[변환 실패] {pdf_path} ({attempt + 1}/{retries + 1}회, 종료 코드 {html_result.returncode})")
+        if output:
+            print(output[-2000:])
+    return False
 
 
 def convert_to_html(bookmarks):
@@ -33,28 +85,43 @@ def convert_to_html(bookmarks):
     for item in bookmarks:
         level, title, page, _ = item
         blank = "    "*(level-1)
-        html_content += f'{blank}<Level ID="{level}", Page="{page -
-                                                             1}">{title}</Level>\n'
+        html_content += f'{blank}<Level ID="{level}", Page="{page - 1}">{title}</Level>\n'
     return html_content
 
 
 def change_html(html_content, html_path):
-    with open(html_path, 'r', encoding='utf-8') as file:
-        existing_file = file.readlines()
-    head_index = None
-    for i, line in enumerate(existing_file):
-        if '</head>' in line.lower():
-            head_index = i
-            break
-
-    if head_index is not None:
-        updated_file = existing_file[:head_index + 1] + \
-            [html_content] + existing_file[head_index + 1:]
-    else:
-        updated_file = existing_file + [html_content]
-
-    with open(html_path, 'w', encoding='utf-8') as file:
-        file.writelines(updated_file)
+    """
+    </head> 가 있는 줄 다음에 책갈피를 넣습니다. (</head> 가 없으면 파일 끝에 추가)
+    HTML 파일 전체를 메모리에 올리지 않도록 READ_CHUNK_SIZE 씩 임시 파일에 옮겨 쓴 뒤 교체합니다.
+    """
+    tmp_path = html_path + '.tmp'
+    try:
+        with open(html_path, 'r', encoding='utf-8') as src, \
+                open(tmp_path, 'w', encoding='utf-8') as dst:
+            found = False
+            inserted = False
+            # 읽는 단위 경계에 걸친 </head> 를 찾기 위해 앞 조각의 끝부분을 남겨 둠
+            tail = ''
+            while True:
+                piece = src.readline(READ_CHUNK_SIZE)
+                if not piece:
+                    break
+                dst.write(piece)
+                if not found:
+                    found = '</head>' in (tail + piece).lower()
+                    tail = piece[-(len('</head>') - 1):]
+                if found and piece.endswith('\n'):
+                    dst.write(html_content)
+                    inserted = True
+                    shutil.copyfileobj(src, dst, READ_CHUNK_SIZE)
+                    break
+            if not inserted:
+                dst.write(html_content)
+        os.replace(tmp_path, html_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
 
 
 def save_html(html_content, output_path, pdf_name):
@@ -71,24 +138,79 @@ def save_html(html_content, output_path, pdf_name):
 
 def log_missing_file(file_name, output_path):
     log_file_path = os.path.join(output_path, 'log.txt')
-    with open(log_file_path, 'a', encoding='utf-8') as log_file:
-        log_file.write(file_name + '\n')
-
-
-def process_files(src_dir, dst_dir, src_alphabet, dst_alphabet):
+    with log_lock:
+        with open(log_file_path, 'a', encoding='utf-8') as log_file:
+            log_file.write(file_name + '\n')
+
+
+def process_file(file_path, src_dir, dst_dir, src_alphabet, dst_alphabet, timeout, retries):
+    """
+    PDF 하나를 HTML 로 변환하고 책갈피를 넣습니다.
+    변환에 실패하면 (시간 초과 포함) 책갈피만 있는 HTML 을 만들지 않고 log.txt 에 기록합니다.
+
+    Returns:
+        bool: 변환과 책갈피 추가 성공 여부.
+    """
+    pdf_name = os.path.basename(file_path)
+    if not pdf2html(file_path, dst_dir, src_alphabet, dst_alphabet, timeout, retries):
+        log_missing_file(os.path.splitext(pdf_name)[0], dst_dir)
+        return False
+
+    relative_path = os.path.relpath(file_path, src_dir)
+    new_file_path = os.path.join(dst_dir, relative_path)
+
+    os.makedirs(os.path.dirname(new_file_path), exist_ok=True)
+
+    save_html(convert_to_html(
+        extract_bookmarks(file_path)), dst_dir, pdf_name)
+    return True
+
+
+def process_group(file_paths, src_dir, dst_dir, src_alphabet, dst_alphabet, timeout, retries):
+    """
+    같은 HTML 파일 (dst_dir/파일명.html) 로 변환되는 PDF 들을 순서대로 처리합니다. 작업 스레드에서 실행됩니다.
+    한 파일의 실패 (손상된 PDF 등)가 같은 그룹의 나머지 파일 처리를 멈추지 않습니다.
+
+    Returns:
+        list: 처리하지 못한 PDF 경로 리스트.
+    """
+    failed = []
+    for file_path in file_paths:
+        try:
+            converted = process_file(file_path, src_dir, dst_dir, src_alphabet, dst_alphabet, timeout, retries)
+        except Exception as e:
+            print(f"[책갈피 추가 실패] {file_path} ({e})")
+            converted = False
+        if not converted:
+            failed.append(file_path)
+    return failed
+
+
+def process_files(src_dir, dst_dir, src_alphabet, dst_alphabet,
+                  max_jobs=PDF2HTML_JOBS, timeout=PDF2HTML_TIMEOUT, retries=PDF2HTML_RETRIES):
+    """
+    src_dir 의 PDF 들을 max_jobs 개씩 동시에 pdf2htmlEX 로 변환하고 책갈피를 넣습니다.
+    HTML 은 모두 dst_dir 바로 아래에 만들어지므로, 파일명이 같은 PDF 들은 한 작업에서 탐색 순서대로 처리합니다.
+    (같은 HTML 파일과 임시 파일을 동시에 쓰지 않도록)
+
+    Returns:
+        list: 변환하지 못한 PDF 경로 리스트.
+    """
+    # {HTML 파일명 (Windows 는 대소문자를 구분하지 않음): PDF 경로 리스트}
+    groups = {}
     for root, _, files in os.walk(src_dir):
         for file in files:
             if file.lower().endswith('.pdf'):
-                file_path = os.path.join(root, file)
-                pdf2html(file_path, dst_dir, src_alphabet, dst_alphabet)
-                relative_path = os.path.relpath(file_path, src_dir)
-                new_file_path = os.path.join(dst_dir, relative_path)
+                groups.setdefault(os.path.splitext(file)[0].lower(), []).append(os.path.join(root, file))
 
-                os.makedirs(os.path.dirname(new_file_path), exist_ok=True)
-
-                pdf_name = os.path.basename(file_path)
-                save_html(convert_to_html(
-                    extract_bookmarks(file_path)), dst_dir, pdf_name)
+    failed = []
+    with ThreadPoolExecutor(max_workers=max_jobs) as executor:
+        futures = [executor.submit(process_group, file_paths, src_dir, dst_dir,
+                                   src_alphabet, dst_alphabet, timeout, retries)
+                   for file_paths in groups.values()]
+        for future in as_completed(futures):
+            failed.extend(future.result())
+    return failed
 
 
 def main():
@@ -102,8 +224,11 @@ def main():
         return
     if not os.path.exists(output_path):
         os.makedirs(output_path)
-    process_files(pdf_path, output_path, pdf_alphabet, html_alphabet)
-    print("모든 작업이 정상적으로 완료되었습니다.")
+    failed = process_files(pdf_path, output_path, pdf_alphabet, html_alphabet)
+    if failed:
+        print(f"변환하지 못한 파일 {len(failed)}개 (log.txt 참고)")
+    else:
+        print("모든 작업이 정상적으로 완료되었습니다.")
 
 
 if __name__ == "__main__":
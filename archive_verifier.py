@@ -0,0 +1,103 @@
+import zlib
+import zipfile
+
+from read_egg_filelist import EggFile, BadEggFile
+from read_zip_filelist import ZipFileList, zipinfo_member_names
+
+# 내부 파일을 압축 해제하며 읽는 단위 (압축 해제한 내용은 CRC 확인 후 버림)
+VERIFY_CHUNK_SIZE = 1024 * 1024
+
+# '압축파일 확인필요' 열에 적는 내부 파일 오류 사유
+ERROR_CRC = 'CRC 오류'
+ERROR_ENCRYPTED = '암호 설정'
+ERROR_UNSUPPORTED = '지원하지 않는 압축 방식'
+ERROR_CORRUPT = '압축파일 오류'
+
+
+def read_through(member):
+    """
+    파일 객체를 끝까지 읽습니다. zipfile 과 EggFile 은 끝까지 읽을 때 CRC32 를 확인합니다.
+    """
+    while member.read(VERIFY_CHUNK_SIZE):
+        pass
+
+
+def member_error(e):
+    """
+    내부 파일을 읽다 발생한 예외를 '압축파일 확인필요' 사유로 변환합니다.
+    """
+    if isinstance(e, (zipfile.BadZipFile, BadEggFile)) and 'CRC' in str(e):
+        return ERROR_CRC
+    if isinstance(e, NotImplementedError):
+        return ERROR_UNSUPPORTED
+    return ERROR_CORRUPT
+
+
+def verify_zip(zip_path):
+    try:
+        with ZipFileList(zip_path) as zip_list:
+            # 분할 압축은 zipfile 로 내부 파일을 읽을 수 없으므로 확인하지 않음
+            if len(zip_list.volumes) > 1:
+                return None
+        zip_file = zipfile.ZipFile(zip_path)
+    except Exception:
+        # 목록을 읽을 수 없는 압축 파일은 목록 읽기에서 '압축파일 확인필요' 로 기록
+        return None
+
+    failures = {}
+    with zip_file:
+        infolist = zip_file.infolist()
+        for name, info in zip(zipinfo_member_names(infolist), infolist):
+            if info.is_dir():
+                continue
+            name = name.replace('/', '\\')
+            if info.flag_bits & 0x1:
+                failures[name] = ERROR_ENCRYPTED
+                continue
+            try:
+                with zip_file.open(info) as member:
+                    read_through(member)
+            except (zipfile.BadZipFile, NotImplementedError, zlib.error, EOFError, OSError, ValueError) as e:
+                failures[name] = member_error(e)
+    return failures
+
+
+def verify_egg(egg_path):
+    try:
+        egg_file = EggFile(egg_path)
+    except Exception:
+        return None
+
+    failures = {}
+    with egg_file:
+        for info in egg_file.infolist():
+            if info.is_dir():
+                continue
+            name = info.filename.replace('/', '\\')
+            if info.encrypted:
+                failures[name] = ERROR_ENCRYPTED
+                continue
+            try:
+                with egg_file.open(info.filename) as member:
+                    read_through(member)
+            except (BadEggFile, NotImplementedError, zlib.error, EOFError, OSError, ValueError) as e:
+                failures[name] = member_error(e)
+    return failures
+
+
+# 내부 파일 CRC 를 확인할 수 있는 압축 형식
+VERIFIERS = {
+    '.zip': verify_zip,
+    '.egg': verify_egg,
+}
+
+
+def verify_archive(archive_path, extension):
+    """
+    워커 프로세스에서 실행됩니다. 압축 파일의 모든 내부 파일을 압축 해제하여 CRC32 를 확인합니다.
+    압축 해제한 내용은 저장하지 않습니다.
+
+    Returns:
+        dict: {내부 파일 경로 ('\\' 구분): 오류 사유}. 압축 파일 자체를 열 수 없으면 None (목록 읽기에서 따로 기록).
+    """
+    return VERIFIERS[extension](archive_path)
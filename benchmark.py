@@ -0,0 +1,187 @@
+import os
+import gc
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import tracemalloc
+
+from read_egg_filelist import EggFile
+from metadata_generator import MetadataGenerator
+from metadata_writer import ExcelMetadataWriter
+from metadata_manifest import ARCHIVE_EXTENSIONS
+from synthetic_corpus import build_corpus
+
+# 기본 합성 데이터 크기 (파일 수)
+DEFAULT_SIZES = [1000, 10000]
+
+
+class BenchmarkCase:
+    """
+    합성 데이터 하나에 대해 단계별 작업을 실행합니다. 각 run_* 메서드는 처리한 항목 수를 반환합니다.
+    단계 사이의 입력 (dir_to_dic 결과, 메타데이터 행 등)은 prepare() 에서 미리 만들어 측정에서 제외합니다.
+
+    Attributes:
+        root (str): 합성 데이터 폴더.
+        work_dir (str): 엑셀 등 출력 파일을 만들 폴더.
+    """
+
+    def __init__(self, root, work_dir):
+        self.root = root
+        self.work_dir = work_dir
+        self.generator = MetadataGenerator(root_folder=root, tmp_zip_folder=os.path.join(work_dir, 'tmp_zip'))
+        self.egg_paths = []
+        self.zip_rows = []
+        self.df = None
+        self.metadata_rows = []
+
+    def prepare(self):
+        generator = self.generator
+        self.df = generator.dir_to_dic()
+        df = generator.classify_rows(self.df.copy())
+        self.egg_paths = list(df['전체 경로'][df['확장자'] == '.egg'])
+        self.zip_rows = df[df['확장자'] == '.zip'].to_dict('records')
+
+        listings = generator.list_archives(df)
+        try:
+            for row in df.to_dict('records'):
+                listing = next(listings) if row['확장자'] in ARCHIVE_EXTENSIONS else None
+                self.metadata_rows.extend(generator.metadata_rows(row, listing))
+        finally:
+            listings.close()
+
+    def run_egg_parse(self):
+        entries = 0
+        for egg_path in self.egg_paths:
+            egg_file = EggFile(egg_path)
+            try:
+                entries += len(egg_file.namelist())
+            finally:
+                egg_file.close()
+        return entries
+
+    def run_dir_to_dic(self):
+        return len(self.generator.dir_to_dic())
+
+    def run_classify(self):
+        df = self.generator.classify_rows(self.df.copy())
+        df = self.generator.classify_filetypes(df)
+        return len(df)
+
+    def run_read_zip_file(self):
+        generator = self.generator
+        rows = 0
+        for row in self.zip_rows:
+            rows += len(generator.read_zip_file(row, generator.list_archive_file(row['전체 경로'])))
+        return rows
+
+    def run_excel_writer(self):
+        writer = ExcelMetadataWriter(os.path.join(self.work_dir, 'benchmark.xlsx'))
+        for metadata_row in self.metadata_rows:
+            writer.append(metadata_row)
+        writer.close()
+        return len(self.metadata_rows)
+
+
+# (이름, BenchmarkCase 메서드, 처리 단위)
+BENCHMARKS = [
+    ('egg_parse', BenchmarkCase.run_egg_parse, 'egg 내부 파일'),
+    ('dir_to_dic', BenchmarkCase.run_dir_to_dic, '파일'),
+    ('classify', BenchmarkCase.run_classify, '파일'),
+    ('read_zip_file', BenchmarkCase.run_read_zip_file, '메타데이터 행'),
+    ('excel_writer', BenchmarkCase.run_excel_writer, '메타데이터 행'),
+]
+
+
+def measure(func, case, trace_memory=True):
+    """
+    func(case) 를 실행하여 (초, 처리 항목 수, 최대 메모리 bytes) 를 반환합니다.
+    시간은 tracemalloc 없이 측정하고, 최대 메모리는 tracemalloc 을 켠 두 번째 실행에서 측정합니다. (끄면 None)
+    """
+    gc.collect()
+    started = time.perf_counter()
+    count = func(case)
+    seconds = time.perf_counter() - started
+
+    peak = None
+    if trace_memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            func(case)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return seconds, count, peak
+
+
+def run_benchmarks(sizes, corpus_dir=None, names=None, trace_memory=True, seed=0):
+    """
+    크기별로 합성 데이터를 만들어 (또는 corpus_dir 에 있으면 재사용) 단계별 시간을 측정합니다.
+
+    Returns:
+        list: 결과 딕셔너리 리스트.
+    """
+    results = []
+    base_dir = corpus_dir or tempfile.mkdtemp(prefix='metadata_benchmark_')
+    try:
+        for size in sizes:
+            root = os.path.join(base_dir, f'corpus_{size}_{seed}')
+            if not os.path.isdir(root):
+                started = time.perf_counter()
+                stats = build_corpus(root, size, seed=seed)
+                print(f"합성 데이터 생성: {root} {stats} ({time.perf_counter() - started:.1f}초)")
+            work_dir = os.path.join(base_dir, f'work_{size}_{seed}')
+            os.makedirs(work_dir, exist_ok=True)
+
+            case = BenchmarkCase(root, work_dir)
+            case.prepare()
+            for name, func, unit in BENCHMARKS:
+                if names and name not in names:
+                    continue
+                seconds, count, peak = measure(func, case, trace_memory)
+                result = {
+                    'size': size, 'benchmark': name, 'seconds': seconds, 'count': count, 'unit': unit,
+                    'per_second': count / seconds if seconds > 0 else None, 'peak_bytes': peak,
+                }
+                results.append(result)
+                print(format_result(result))
+    finally:
+        if corpus_dir is None:
+            shutil.rmtree(base_dir, ignore_errors=True)
+    return results
+
+
+def format_result(result):
+    per_second = result['per_second']
+    text = (f"{result['size']:>8} {result['benchmark']:<14} {result['seconds']:>8.3f}초 "
+            f"{result['count']:>9} {result['unit']:<10} "
+            f"{per_second if per_second is not None else 0:>12,.0f}/초")
+    if result['peak_bytes'] is not None:
+        text += f" {result['peak_bytes'] / (1024 * 1024):>8.1f} MB"
+    return text
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='메타데이터 생성 단계별 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help=f'합성 데이터 파일 수 (기본 {DEFAULT_SIZES})')
+    parser.add_argument('--corpus-dir', help='합성 데이터를 만들어 두고 재사용할 폴더 (없으면 임시 폴더)')
+    parser.add_argument('--only', nargs='+', choices=[name for name, _, _ in BENCHMARKS],
+                        help='실행할 벤치마크')
+    parser.add_argument('--no-memory', action='store_true', help='최대 메모리 측정 생략')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='결과를 저장할 JSON 파일 경로')
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.sizes, args.corpus_dir, args.only, not args.no_memory, args.seed)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
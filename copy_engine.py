@@ -0,0 +1,84 @@
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# 동시에 복사할 파일 수 (드라이브/네트워크 지연을 겹치기 위함)
+COPY_WORKERS = 8
+
+
+def plan_copies(copy_pairs):
+    """
+    (원본 파일, 대상 파일) 쌍 목록을 {대상 파일: 원본 파일} 딕셔너리로 정리합니다.
+    같은 대상 파일이 여러 번 나오면 순차 복사와 같이 마지막 원본을 사용합니다.
+    """
+    plan = {}
+    for src_file, dst_file in copy_pairs:
+        plan.pop(dst_file, None)
+        plan[dst_file] = src_file
+    return plan
+
+
+def make_target_dirs(dst_files):
+    """
+    대상 파일들의 폴더를 한 번씩만 생성합니다.
+
+    Returns:
+        dict: {생성하지 못한 폴더: 발생한 예외}
+    """
+    dir_errors = {}
+    for target_dir in sorted({os.path.dirname(dst_file) for dst_file in dst_files}):
+        try:
+            os.makedirs(target_dir, exist_ok=True)
+        except OSError as e:
+            dir_errors[target_dir] = e
+    return dir_errors
+
+
+def copy_files(copy_pairs, max_workers=COPY_WORKERS, on_result=None):
+    """
+    파일들을 스레드 풀에서 동시에 복사합니다.
+    대상 폴더는 미리 한 번씩 생성하고, 한 파일의 복사 실패가 나머지 복사를 멈추지 않습니다.
+    복사는 shutil.copy2 를 사용하므로 OS 가 지원하면 sendfile/fcopyfile/CopyFile2 로 커널에서 전송됩니다.
+
+    Args:
+        copy_pairs (list): (원본 파일, 대상 파일) 튜플 리스트.
+        max_workers (int): 동시에 복사할 파일 수.
+        on_result (callable): 파일마다 메인 스레드에서 on_result(원본, 대상, 예외 또는 None) 으로 호출됩니다.
+            on_result 가 예외를 발생시키면 아직 시작하지 않은 복사를 취소하고 그 예외를 그대로 발생시킵니다.
+
+    Returns:
+        list: 실패한 (원본 파일, 대상 파일, 예외) 리스트.
+    """
+    plan = plan_copies(copy_pairs)
+    dir_errors = make_target_dirs(plan)
+    failures = []
+
+    def report(src_file, dst_file, error):
+        if error is not None:
+            failures.append((src_file, dst_file, error))
+        if on_result:
+            on_result(src_file, dst_file, error)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for dst_file, src_file in plan.items():
+            dir_error = dir_errors.get(os.path.dirname(dst_file))
+            if dir_error is not None:
+                report(src_file, dst_file, dir_error)
+                continue
+            future = executor.submit(shutil.copy2, src_file, dst_file)
+            futures[future] = (src_file, dst_file)
+
+        try:
+            for future in as_completed(futures):
+                src_file, dst_file = futures[future]
+                report(src_file, dst_file, future.exception())
+        except BaseException:
+            # on_result 에서 예외로 중단한 경우 (작업 취소 등) 아직 시작하지 않은 복사는 하지 않음
+            # (shutdown 의 cancel_futures 는 Python 3.9 부터 지원하므로 직접 취소)
+            for future in futures:
+                future.cancel()
+            executor.shutdown()
+            raise
+
+    return failures
@@ -0,0 +1,74 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# 동시에 읽을 폴더 수 (네트워크 드라이브의 폴더 목록 지연을 겹치기 위함)
+WALK_WORKERS = 16
+
+
+def scan_dir(path):
+    """
+    폴더 하나를 os.scandir 로 읽습니다. DirEntry 에 캐시된 종류 정보를 사용하므로 파일마다 stat 하지 않습니다.
+
+    Returns:
+        tuple: (하위 폴더 이름 리스트, 들어갈 하위 폴더 이름 리스트, 파일 이름 리스트). 읽을 수 없으면 None.
+    """
+    subdirs = []
+    walk_into = []
+    files = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+
+                if not is_dir:
+                    files.append(entry.name)
+                    continue
+                subdirs.append(entry.name)
+                # os.walk 와 같이 심볼릭 링크 폴더는 따라가지 않음
+                try:
+                    is_symlink = entry.is_symlink()
+                except OSError:
+                    is_symlink = False
+                if not is_symlink:
+                    walk_into.append(entry.name)
+    except OSError:
+        # os.walk 와 같이 읽을 수 없는 폴더는 건너뜀
+        return None
+    return subdirs, walk_into, files
+
+
+def parallel_walk(top, max_workers=WALK_WORKERS):
+    """
+    os.walk(top) 과 같은 순서로 (폴더, 하위 폴더 리스트, 파일 리스트)를 반환하는 제너레이터.
+    폴더를 방문할 때 하위 폴더들의 scandir 를 스레드 풀에 미리 넣어 두어 목록 읽기 지연을 겹칩니다.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {top: executor.submit(scan_dir, top)}
+        stack = [top]
+        while stack:
+            path = stack.pop()
+            result = pending.pop(path).result()
+            if result is None:
+                continue
+            subdirs, walk_into, files = result
+
+            children = [os.path.join(path, name) for name in walk_into]
+            for child in children:
+                pending[child] = executor.submit(scan_dir, child)
+
+            yield path, subdirs, files
+            # 깊이 우선, 하위 폴더는 목록 순서대로
+            stack.extend(reversed(children))
+
+
+def file_suffix(name):
+    """
+    pathlib.PurePath(name).suffix 와 같은 확장자를 반환합니다.
+    """
+    i = name.rfind('.')
+    if 0 < i < len(name) - 1:
+        return name[i:]
+    return ''
@@ -1,10 +1,25 @@
 import os
+import sys
+import shutil
 import zipfile
 import subprocess
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import pandas as pd
 
+from read_egg_filelist import EggFile
+from read_zip_filelist import zipinfo_member_names
 
-def extract_zip(zip_path, extract_to_folder):
+# 압축 해제 시 쓰기 버퍼 크기
+WRITE_BUFFER_SIZE = 1024 * 1024
+# 하나의 작업(배치)에 묶는 항목 수 / 원본 크기 상한
+BATCH_MAX_ENTRIES = 256
+BATCH_MAX_BYTES = 32 * 1024 * 1024
+
+NATIVE_EXTENSIONS = ('.zip', '.egg')
+BANDIZIP_EXTENSIONS = ('.7z', '.alz')
+
+
+def extract_zip(zip_path, extract_to_folder, log_dir):
     """주어진 zip 파일을 지정된 폴더로 압축 해제합니다."""
     try:
         # 압축 해제할 폴더 생성
@@ -29,11 +44,11 @@ def extract_zip(zip_path, extract_to_folder):
         return file_list, zip_folder
     except Exception as e:
         print(f"zip 압축해제 오류 : {e}")
-        except_log(zip_path, e)
+        except_log(zip_path, e, log_dir)
         return [], ""
 
 
-def extract_egg(egg_path):
+def extract_egg(egg_path, log_dir):
     """주어진 egg 파일을 Bandizip을 사용하여 압축 해제합니다."""
     try:
         # 압축 해제할 폴더 생성
@@ -54,43 +69,185 @@ def extract_egg(egg_path):
         return [os.path.join(egg_folder, f) for f in os.listdir(egg_folder)], egg_folder
     except Exception as e:
         print(f"압축 해제 중 오류 발생: {e}")
-        except_log(egg_path, e)
+        except_log(egg_path, e, log_dir)
         return [], ""
 
 
-def process_folder(folder_path):
-    """지정된 폴더를 순회하면서 zip 파일 조각을 결합하고 처리하며 egg 파일도 처리합니다."""
+def open_archive(archive_path):
+    """확장자에 맞는 압축 파일 객체(zipfile.ZipFile 또는 EggFile)를 반환합니다."""
+    if archive_path.lower().endswith('.egg'):
+        return EggFile(archive_path)
+    return zipfile.ZipFile(archive_path, 'r')
+
+
+def member_names(archive, infolist):
+    """
+    항목 이름을 메타데이터 엑셀과 같은 방식으로 복원합니다. (zip 은 zipinfo_member_names 로 다시 해석)
+    """
+    if isinstance(archive, zipfile.ZipFile):
+        return zipinfo_member_names(infolist)
+    return [info.filename for info in infolist]
+
+
+def safe_member_path(dst_folder, filename):
+    """압축 파일 내부 경로를 dst_folder 아래의 안전한 경로로 변환합니다 (../ 및 드라이브 제거)."""
+    parts = [part for part in filename.replace('\\', '/').split('/')
+             if part not in ('', '.', '..')]
+    parts = [os.path.splitdrive(part)[1] or '_' for part in parts]
+    if not parts:
+        return None
+    return os.path.join(dst_folder, *parts)
+
+
+def plan_archive(archive_path):
+    """
+    압축 파일 하나의 압축 해제 계획을 세웁니다.
+    필요한 폴더를 미리 모두 만들고, 항목들을 워커에 넘길 배치로 나눕니다.
+
+    Returns:
+        tuple: (압축 해제 폴더, 배치 리스트). 배치는 (압축 파일 경로, [(항목 이름, 저장 경로), ...]).
+    """
+    dst_folder = os.path.join(os.path.dirname(
+        archive_path), os.path.splitext(os.path.basename(archive_path))[0])
+
+    archive = open_archive(archive_path)
+    try:
+        infolist = archive.infolist()
+        entries = []
+        dirs = {dst_folder}
+        for info, filename in zip(infolist, member_names(archive, infolist)):
+            dst_path = safe_member_path(dst_folder, filename)
+            if dst_path is None:
+                continue
+            if info.filename.endswith('/'):
+                dirs.add(dst_path)
+                continue
+            dirs.add(os.path.dirname(dst_path))
+            entries.append((info.filename, dst_path, info.file_size))
+    finally:
+        archive.close()
+
+    for folder in sorted(dirs):
+        os.makedirs(folder, exist_ok=True)
+
+    batches = []
+    batch = []
+    batch_bytes = 0
+    for name, dst_path, file_size in entries:
+        batch.append((name, dst_path))
+        batch_bytes += file_size
+        if len(batch) >= BATCH_MAX_ENTRIES or batch_bytes >= BATCH_MAX_BYTES:
+            batches.append((archive_path, batch))
+            batch = []
+            batch_bytes = 0
+    if batch:
+        batches.append((archive_path, batch))
+
+    return dst_folder, batches
+
+
+def extract_batch(archive_path, members, log_dir):
+    """
+    워커 프로세스에서 실행됩니다. 배치의 항목들을 큰 버퍼로 스트리밍하여 저장합니다.
+    실패한 항목은 log_dir/log.txt 에 기록한 뒤 예외를 그대로 발생시킵니다.
+    (Windows 의 워커 프로세스는 모듈을 새로 import 하므로 로그 폴더를 인자로 받음)
+
+    Returns:
+        list: 저장한 파일 경로 리스트.
+    """
+    extracted = []
+    archive = open_archive(archive_path)
+    try:
+        for name, dst_path in members:
+            try:
+                with archive.open(name) as src, \
+                        open(dst_path, 'wb', buffering=WRITE_BUFFER_SIZE) as dst:
+                    shutil.copyfileobj(src, dst, WRITE_BUFFER_SIZE)
+            except Exception as e:
+                except_log(f'{archive_path} : {name}', e, log_dir)
+                raise
+            extracted.append(dst_path)
+    finally:
+        archive.close()
+    return extracted
+
+
+def extract_archives(archive_paths, log_dir, max_workers=None):
+    """
+    zip/egg 파일들을 프로세스 풀에서 항목 단위 배치로 병렬 압축 해제합니다.
+    압축 파일의 모든 항목이 정상적으로 풀리면 원본 압축 파일을 삭제합니다.
+    오류는 log_dir/log.txt 에 기록합니다.
+
+    Returns:
+        tuple: ({'File Name': 압축 파일 경로, 'Extracted File': 저장 경로} 딕셔너리 리스트,
+            직접 풀지 못한 압축 파일 경로 리스트 (분할, 암호, 지원하지 않는 압축 방식 등)).
+    """
     results = []
+    extracted = {}
+    failed = set()
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for archive_path in archive_paths:
+            try:
+                _, batches = plan_archive(archive_path)
+            except Exception as e:
+                print(f"압축 해제 중 오류 발생: {e}")
+                except_log(archive_path, e, log_dir)
+                failed.add(archive_path)
+                continue
+            extracted[archive_path] = []
+            for batch_archive, members in batches:
+                future = executor.submit(extract_batch, batch_archive, members, log_dir)
+                futures[future] = archive_path
+
+        for future in as_completed(futures):
+            archive_path = futures[future]
+            try:
+                extracted[archive_path].extend(future.result())
+            except Exception as e:
+                # 실패한 항목은 워커에서 기록
+                if archive_path not in failed:
+                    print(f"압축 해제 중 오류 발생: {e}")
+                failed.add(archive_path)
+
+    for archive_path in archive_paths:
+        if archive_path in failed:
+            continue
+        for file in sorted(extracted[archive_path]):
+            results.append({'File Name': archive_path, 'Extracted File': file})
+        print(f"{archive_path}을/를 압축 해제했습니다.")
+        os.remove(archive_path)
+
+    return results, [archive_path for archive_path in archive_paths if archive_path in failed]
+
+
+def process_folder(folder_path, max_workers=None):
+    """
+    지정된 폴더를 순회하면서 zip/egg 파일은 직접 병렬로, 7z/alz 파일은 Bandizip으로 압축 해제합니다.
+    직접 풀지 못한 zip/egg 파일 (분할, 암호, 지원하지 않는 압축 방식, 코멘트/솔리드 EGG 등) 도 Bandizip 으로 다시 시도합니다.
+    (AlzFile 은 목록만 읽을 수 있으므로 alz 는 Bandizip 으로만 압축 해제)
+    """
+    native_files = []
+    bandizip_files = []
     for root, _, files in os.walk(folder_path):
-        zip_files = [f for f in files if f.lower().endswith('.zip')]
-        egg_files = [f for f in files if f.lower().endswith('.egg')]
-        sevenzip_files = [f for f in files if f.lower().endswith('.7z')]
-        alz_files = [f for f in files if f.lower().endswith('.alz')]
-
-        for zip_file in zip_files:
-            zip_path = os.path.join(root, zip_file)
-            file_list, folder_path = extract_egg(zip_path)
-            for file in file_list:
-                results.append({'File Name': zip_path, 'Extracted File': file})
-
-        for egg_file in egg_files:
-            egg_path = os.path.join(root, egg_file)
-            file_list, folder_path = extract_egg(egg_path)
-            for file in file_list:
-                results.append({'File Name': egg_path, 'Extracted File': file})
-
-        for sevenzip_file in sevenzip_files:
-            sevenzip_path = os.path.join(root, sevenzip_file)
-            file_list, folder_path = extract_egg(sevenzip_path)
-            for file in file_list:
-                results.append(
-                    {'File Name': sevenzip_path, 'Extracted File': file})
-
-        for alz_file in alz_files:
-            alz_path = os.path.join(root, alz_file)
-            file_list, folder_path = extract_egg(alz_path)
-            for file in file_list:
-                results.append({'File Name': alz_path, 'Extracted File': file})
+        for file in files:
+            extension = os.path.splitext(file)[1].lower()
+            if extension in NATIVE_EXTENSIONS:
+                native_files.append(os.path.join(root, file))
+            elif extension in BANDIZIP_EXTENSIONS:
+                bandizip_files.append(os.path.join(root, file))
+
+    results, failed_files = extract_archives(native_files, folder_path, max_workers)
+
+    for archive_path in failed_files + bandizip_files:
+        if sys.platform != 'win32':
+            print(f"Bandizip 없음 - 건너뜀: {archive_path}")
+            except_log(archive_path, 'Bandizip is only available on Windows', folder_path)
+            continue
+        file_list, _ = extract_egg(archive_path, folder_path)
+        for file in file_list:
+            results.append({'File Name': archive_path, 'Extracted File': file})
 
     # 결과를 엑셀 파일로 저장
     df = pd.DataFrame(results)
@@ -99,15 +256,20 @@ def process_folder(folder_path):
     print("엑셀 파일이 생성되었습니다: extraction_report.xlsx")
 
 
-def except_log(dst, e):
-    log_dir = os.path.join(folder_path, "log.txt")
-    with open(log_dir, 'a') as file:
+def except_log(dst, e, log_dir):
+    log_path = os.path.join(log_dir, "log.txt")
+    with open(log_path, 'a') as file:
         file.write(f'Error ({e}) , Source File ({dst})\n')
 
 
-if __name__ == "__main__":
+def main():
     folder_path = input("폴더 경로를 입력하세요 : ")
-    folder_path = os.path.join("\\\\?\\", folder_path)
+    if sys.platform == 'win32':
+        folder_path = os.path.join("\\\\?\\", folder_path)
     print("진행중...")
     process_folder(folder_path)
     print("모든 압축파일 해제가 완료되었습니다")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import re
+
+
+class KeywordMatcher:
+    """
+    키워드 목록(분류)별 정규표현식을 한 번만 컴파일해 두고 재사용하는 검색기.
+
+    각 분류는 기존의 '|'.join(re.escape(...)) 패턴과 같은 규칙으로 검색합니다.
+    가장 왼쪽 위치의 매치를 찾고, 같은 위치에서는 목록에서 먼저 나온 키워드를 선택합니다.
+
+    Attributes:
+        patterns (dict): {분류 이름: 컴파일된 정규표현식}
+    """
+
+    def __init__(self, keyword_classes=None):
+        self.patterns = {}
+        if keyword_classes:
+            for name, keywords in keyword_classes.items():
+                self.add_class(name, keywords)
+
+    def add_class(self, name, keywords, prefix='', suffix=''):
+        """
+        분류를 추가합니다. prefix/suffix 는 각 키워드 앞뒤에 붙는 고정 문자열입니다.
+        (예: prefix='\\\\', suffix='\\\\' 는 경로 중간의 폴더명으로만 매치)
+        """
+        pattern = '|'.join(
+            rf'{re.escape(prefix)}{re.escape(keyword)}{re.escape(suffix)}' for keyword in keywords)
+        self.patterns[name] = re.compile(pattern)
+
+    def search(self, name, text):
+        """
+        분류 name 의 키워드를 text 에서 검색합니다.
+
+        Returns:
+            str: 매치된 문자열. 없으면 None.
+        """
+        matches = self.patterns[name].search(text)
+        if matches:
+            return matches[0]
+        return None
+
+    def search_all(self, text, names):
+        """
+        여러 분류를 같은 text 에 대해 한 번에 검색합니다.
+
+        Returns:
+            dict: {분류 이름: 매치된 문자열 또는 None}
+        """
+        return {name: self.search(name, text) for name in names}
+
+    def longest_class(self, text, names):
+        """
+        각 분류의 첫 매치 길이를 비교하여 가장 긴 매치를 가진 분류를 반환합니다.
+        길이가 같으면 names 에서 앞선 분류를 선택합니다.
+
+        Returns:
+            str: 분류 이름. 어느 분류도 매치되지 않으면 None.
+        """
+        result = None
+        result_len = 0
+        for name, matched in self.search_all(text, names).items():
+            if matched is not None and len(matched) > result_len:
+                result = name
+                result_len = len(matched)
+        return result
+
+    def search_series(self, name, series):
+        """
+        search() 를 pandas Series 전체에 대해 열 단위로 수행합니다.
+
+        Returns:
+            Series: 각 값에서 매치된 문자열. 매치되지 않으면 결측값.
+        """
+        return series.str.extract(f'({self.patterns[name].pattern})', expand=False)
@@ -0,0 +1,304 @@
+import os
+import sys
+import time
+import argparse
+
+from metadata_generator import MetadataGenerator
+from nested_archive import NESTED_MAX_DEPTH, NESTED_MAX_SIZE
+from metadata_manifest import MetadataManifest, manifest_path_for
+from metadata_writer import (
+    MetadataWriterGroup, JsonLinesMetadataWriter, columnar_output_path, read_json_lines_rows)
+from run_report import report_path_for, profile_path_for
+
+# 감시 모드에서 폴더를 다시 확인하는 간격 (초)
+POLL_INTERVAL = 2.0
+# 크기와 수정 시각이 이 시간 동안 그대로여야 복사가 끝난 파일로 봄 (초)
+SETTLE_SECONDS = 3.0
+# 감시 모드에서 조각 파일에 모아 둔 행을 엑셀/열 기반 매니페스트에 합치는 간격 (초)
+CONSOLIDATE_INTERVAL = 60.0
+
+
+def pending_dir_for(output_excel):
+    """
+    감시 모드에서 아직 엑셀에 합치지 않은 행의 조각 파일 (.jsonl) 을 보관할 폴더 경로를 반환합니다.
+    """
+    return output_excel + '.pending'
+
+
+class SettlingManifest(MetadataManifest):
+    """
+    아직 복사 중인 파일을 건너뛰는 증분 매니페스트.
+    처음 발견한 파일은 크기와 수정 시각을 기억해 두었다가, settle_seconds 이상 그대로인 것이 확인된 뒤에 처리합니다.
+    (탐색기 복사처럼 원본 수정 시각을 유지하며 복사하는 경우에도 크기 변화로 감지)
+
+    Attributes:
+        settle_seconds (float): 파일이 그대로여야 하는 시간 (초).
+        observed (dict): {전체 경로: ((크기, 수정 시각(ns)), 처음 확인한 시각)}
+    """
+
+    def __init__(self, path, settle_seconds=SETTLE_SECONDS):
+        super().__init__(path)
+        self.settle_seconds = settle_seconds
+        self.observed = {}
+
+    def is_pending(self, file_path):
+        if not super().is_pending(file_path):
+            return False
+        if self.settle_seconds <= 0:
+            return True
+
+        stat = self.pending_stats[file_path]
+        now = time.monotonic()
+        observed = self.observed.get(file_path)
+        if observed is not None and observed[0] == stat:
+            if now - observed[1] >= self.settle_seconds:
+                del self.observed[file_path]
+                return True
+        else:
+            self.observed[file_path] = (stat, now)
+
+        # 다음 확인 때 다시 보도록 이번에는 제외
+        self.defer(file_path)
+        return False
+
+
+class MetadataDaemon:
+    """
+    GUI 없이 메타데이터를 생성합니다. 감시 모드에서는 root_folder 를 주기적으로 확인하여
+    새로 들어온 파일만 엑셀/열 기반 매니페스트에 이어서 기록합니다.
+    엑셀/Parquet 파일은 이어서 기록할 때도 기존 행을 모두 다시 써야 하므로, 감시 모드의 각 확인에서는
+    새 행만 조각 파일에 기록하고 CONSOLIDATE_INTERVAL 마다 (그리고 종료할 때) 한 번에 합칩니다.
+
+    Attributes:
+        generator (MetadataGenerator): 메타데이터 생성 작업.
+        output_excel (str): 엑셀 파일 경로 (.xlsx).
+        write_excel (bool): 엑셀 파일 기록 여부.
+        write_columnar (bool): 열 기반 매니페스트 (.parquet 또는 .csv) 기록 여부.
+        write_report (bool): 엑셀 파일 옆에 실행 보고서 (.report.json) 저장 여부.
+        profile (bool): 실행 보고서와 함께 cProfile 결과 (.prof) 저장 여부.
+    """
+
+    def __init__(self, generator, write_excel=True, write_columnar=False, write_report=False, profile=False):
+        self.generator = generator
+        self.write_report = write_report
+        self.profile = profile
+        output_excel = generator.output_excel
+        if not output_excel.endswith('.xlsx'):
+            output_excel += '.xlsx'
+        self.output_excel = output_excel
+        self.write_excel = write_excel
+        self.write_columnar = write_columnar
+        self.pending_dir = pending_dir_for(output_excel)
+        self.manifest = None
+
+    def is_new_output(self):
+        """
+        기록할 출력 파일과 아직 합치지 않은 조각 파일이 하나도 없으면 True 입니다.
+        """
+        if self.pending_parts():
+            return False
+        if self.write_excel and os.path.exists(self.output_excel):
+            return False
+        if self.write_columnar and os.path.exists(columnar_output_path(self.output_excel)):
+            return False
+        return True
+
+    def open_manifest(self, settle_seconds):
+        manifest_path = manifest_path_for(self.output_excel)
+        if self.is_new_output():
+            self.manifest = SettlingManifest(manifest_path, settle_seconds)
+        else:
+            self.manifest = SettlingManifest.load(manifest_path)
+            self.manifest.settle_seconds = settle_seconds
+
+    def pending_parts(self):
+        """
+        아직 합치지 않은 조각 파일 경로를 기록한 순서대로 반환합니다.
+        """
+        if not os.path.isdir(self.pending_dir):
+            return []
+        return [os.path.join(self.pending_dir, name)
+                for name in sorted(os.listdir(self.pending_dir)) if name.endswith('.jsonl')]
+
+    def open_pending_writer(self):
+        os.makedirs(self.pending_dir, exist_ok=True)
+        # 파일 이름 순서가 기록 순서가 되도록 자릿수를 맞춘 시각을 사용
+        part_path = os.path.join(self.pending_dir, f'{time.time_ns():020d}.jsonl')
+        return MetadataWriterGroup([JsonLinesMetadataWriter(part_path)])
+
+    def consolidate(self):
+        """
+        조각 파일의 행을 엑셀/열 기반 매니페스트에 한 번에 이어서 기록하고 조각 파일을 지웁니다.
+        (매니페스트에는 조각 파일에 기록할 때 이미 저장되어 있음)
+
+        Returns:
+            int: 합친 행 수.
+        """
+        parts = self.pending_parts()
+        if not parts:
+            return 0
+
+        writer = self.generator.open_writers(
+            self.output_excel, self.write_excel and os.path.exists(self.output_excel),
+            self.write_excel, self.write_columnar)
+        for part_path in parts:
+            for row in read_json_lines_rows(part_path):
+                writer.append(row)
+        writer.close()
+        for part_path in parts:
+            os.remove(part_path)
+        # 실패한 확인에서 남은 임시 파일 정리
+        for name in os.listdir(self.pending_dir):
+            try:
+                os.remove(os.path.join(self.pending_dir, name))
+            except OSError:
+                pass
+        try:
+            os.rmdir(self.pending_dir)
+        except OSError:
+            pass
+        return writer.row_count
+
+    def run_once(self, incremental=False, pending=False):
+        """
+        메타데이터를 한 번 생성합니다. 증분 모드에서는 처리할 파일이 없으면 출력 파일을 건드리지 않습니다.
+
+        Args:
+            incremental (bool): 매니페스트에 없는 파일만 기록할지 여부.
+            pending (bool): 엑셀/열 기반 매니페스트 대신 새 조각 파일에 기록할지 여부 (consolidate 로 합침).
+
+        Returns:
+            int: 기록한 행 수.
+        """
+        generator = self.generator
+        manifest = self.manifest if incremental else None
+        df = None
+        if manifest is not None:
+            # 처리할 파일이 있을 때만 출력 파일을 엶 (이 경우 보고서에는 폴더 탐색 시간이 포함되지 않음)
+            df = generator.dir_to_dic(manifest)
+            if df.empty:
+                return 0
+
+        if pending:
+            writer = self.open_pending_writer()
+        else:
+            writer = generator.open_writers(
+                self.output_excel, self.write_excel and os.path.exists(self.output_excel),
+                self.write_excel, self.write_columnar)
+        if self.write_report:
+            profile_path = profile_path_for(self.output_excel) if self.profile else None
+            generator.run_with_report(lambda: generator.generate(writer, manifest, df),
+                                      report_path_for(self.output_excel), profile_path)
+        else:
+            generator.generate(writer, manifest, df)
+        return writer.row_count
+
+    def try_consolidate(self):
+        try:
+            row_count = self.consolidate()
+        except Exception as e:
+            # 엑셀 파일이 열려 있는 경우 등: 조각 파일을 남겨 두고 다음에 다시 합침
+            print(f"메타데이터 합치기 오류: {e}")
+            return
+        if row_count:
+            print(f"{time.strftime('%H:%M:%S')} {row_count}행 기록")
+
+    def watch(self, interval=POLL_INTERVAL, settle_seconds=SETTLE_SECONDS,
+              consolidate_interval=CONSOLIDATE_INTERVAL):
+        """
+        Ctrl+C 로 중지할 때까지 interval 초마다 새로 들어온 파일을 조각 파일에 기록하고,
+        consolidate_interval 초마다 (그리고 종료할 때) 엑셀/열 기반 매니페스트에 합칩니다.
+        """
+        # 이전 실행에서 합치지 못한 조각 파일이 있으면 먼저 합침
+        self.try_consolidate()
+        self.open_manifest(settle_seconds)
+        print(f"{self.generator.root_folder} 감시 시작 (간격 {interval}초, 대기 {settle_seconds}초, "
+              f"합치기 {consolidate_interval}초)")
+        consolidated = time.monotonic()
+        try:
+            while True:
+                started = time.monotonic()
+                try:
+                    row_count = self.run_once(incremental=True, pending=True)
+                except Exception as e:
+                    # 엑셀 파일이 열려 있는 경우 등: 저장된 매니페스트로 되돌려 다음 확인 때 다시 처리
+                    print(f"메타데이터 기록 오류: {e}")
+                    observed = self.manifest.observed
+                    self.open_manifest(settle_seconds)
+                    self.manifest.observed = observed
+                    row_count = 0
+                if row_count:
+                    print(f"{time.strftime('%H:%M:%S')} {row_count}행 확인")
+                if started - consolidated >= consolidate_interval:
+                    self.try_consolidate()
+                    consolidated = time.monotonic()
+                time.sleep(max(0.0, interval - (time.monotonic() - started)))
+        except KeyboardInterrupt:
+            self.try_consolidate()
+            print("감시 종료")
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description='국정감사 메타데이터 생성기 (GUI 없이 실행)')
+    parser.add_argument('root_folder', help='메타데이터를 만들 폴더 경로')
+    parser.add_argument('output_excel', help='저장할 엑셀 파일 경로')
+    parser.add_argument('tmp_zip_folder', help='수작업으로 확인할 압축 파일을 복사할 폴더 경로')
+    parser.add_argument('--watch', action='store_true',
+                        help='폴더를 감시하여 새로 들어온 파일만 이어서 기록')
+    parser.add_argument('--interval', type=float, default=POLL_INTERVAL,
+                        help=f'감시 간격 (초, 기본 {POLL_INTERVAL})')
+    parser.add_argument('--settle', type=float, default=SETTLE_SECONDS,
+                        help=f'복사가 끝났다고 볼 때까지 파일이 그대로여야 하는 시간 (초, 기본 {SETTLE_SECONDS})')
+    parser.add_argument('--consolidate', type=float, default=CONSOLIDATE_INTERVAL,
+                        help=f'감시 모드에서 새 행을 엑셀/매니페스트에 합치는 간격 (초, 기본 {CONSOLIDATE_INTERVAL})')
+    parser.add_argument('--incremental', action='store_true',
+                        help='이전 실행 이후 추가/변경된 파일만 기록 (감시 모드는 항상 증분)')
+    parser.add_argument('--nested', action='store_true',
+                        help='압축파일 안의 압축파일 목록 포함')
+    parser.add_argument('--nested-depth', type=int, default=NESTED_MAX_DEPTH,
+                        help=f'--nested 에서 열어볼 최대 중첩 단계 (기본 {NESTED_MAX_DEPTH})')
+    parser.add_argument('--nested-max-size', type=int, default=NESTED_MAX_SIZE,
+                        help=f'--nested 에서 메모리로 읽을 내부 압축파일의 최대 크기 (bytes, 기본 {NESTED_MAX_SIZE})')
+    parser.add_argument('--verify', action='store_true',
+                        help='zip, egg 내부 파일을 모두 압축 해제하여 CRC 확인 (오류는 압축파일 확인필요 열에 기록)')
+    parser.add_argument('--no-excel', dest='write_excel', action='store_false',
+                        help='엑셀 파일을 만들지 않음')
+    parser.add_argument('--columnar', dest='write_columnar', action='store_true',
+                        help='Parquet 매니페스트 생성 (pyarrow 가 없으면 CSV)')
+    parser.add_argument('--report', action='store_true',
+                        help='엑셀 파일 옆에 실행 보고서 (.report.json) 저장')
+    parser.add_argument('--profile', action='store_true',
+                        help='실행 보고서와 함께 cProfile 결과 (.prof) 저장')
+    args = parser.parse_args(argv)
+    if not args.write_excel and not args.write_columnar:
+        parser.error('엑셀 또는 Parquet 매니페스트 중 하나 이상 선택하세요.')
+    if not os.path.isdir(args.root_folder):
+        parser.error('유효하지 않은 폴더 경로입니다.')
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    generator = MetadataGenerator(
+        root_folder=os.path.abspath(args.root_folder), output_excel=args.output_excel,
+        tmp_zip_folder=args.tmp_zip_folder, nested_listing=args.nested,
+        verify_archives=args.verify, nested_max_depth=args.nested_depth,
+        nested_max_size=args.nested_max_size)
+    daemon = MetadataDaemon(generator, args.write_excel, args.write_columnar,
+                            args.report or args.profile, args.profile)
+
+    if args.watch:
+        daemon.watch(args.interval, args.settle, args.consolidate)
+        return 0
+
+    # 감시 모드에서 합치지 못한 조각 파일이 있으면 먼저 합침
+    daemon.consolidate()
+    if args.incremental:
+        daemon.open_manifest(0)
+    row_count = daemon.run_once(incremental=args.incremental)
+    print(f"{row_count}행 기록")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
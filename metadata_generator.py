@@ -0,0 +1,908 @@
+import os
+import time
+import shutil
+import pathlib
+import functools
+from natsort import natsorted
+import pandas as pd
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+
+from read_egg_filelist import EggFile
+from read_zip_filelist import ZipFileList
+from read_alz_filelist import AlzFile
+from read_sevenzip_filelist import SevenZipFile, Bad7zFile
+from nested_archive import NestedArchiveLister, NESTED_MAX_DEPTH, NESTED_MAX_SIZE
+from archive_verifier import verify_archive, VERIFIERS
+from dir_walker import parallel_walk, file_suffix
+from keyword_matcher import KeywordMatcher
+from metadata_writer import (
+    ExcelMetadataWriter, MetadataWriterGroup, new_metadata_row,
+    columnar_output_path, open_columnar_writer
+)
+from metadata_manifest import MetadataManifest, manifest_path_for, ARCHIVE_EXTENSIONS
+from copy_engine import copy_files
+from run_progress import RunProgress, RunCancelled, STAGE_WALK, STAGE_WRITE, STAGE_COPY
+from run_report import RunReport, profile_call
+
+# 압축 파일 목록을 동시에 읽을 스레드 수 (네트워크 드라이브의 열기/탐색 지연을 겹치기 위함)
+LIST_ARCHIVE_WORKERS = 8
+# 압축 파일 목록/CRC 확인 결과를 기다리는 동안 취소 요청을 확인하는 간격 (초)
+CANCEL_CHECK_INTERVAL = 0.2
+# 문서 종류 분류에서 폴더 경로별 결과를 기억해 둘 폴더 수
+DIR_FILETYPE_CACHE_SIZE = 4096
+# 문서 종류 키워드 분류 (search_in_row 의 결과 순서)
+FILETYPE_CLASSES = ('file_attach', 'file_answer', 'file_require')
+
+
+def to_object_column(series):
+    """
+    결측값을 None 으로 바꾼 object 열을 반환합니다. (엑셀 셀에 NaN 이 쓰이지 않도록)
+    """
+    return series.astype(object).where(series.notna(), None)
+
+
+class MetadataGenerator:
+    """
+    국정감사 메타데이터 생성 작업 (폴더 탐색 → 분류 → 압축파일 목록 → 기록).
+    PyQt6 를 사용하지 않으므로 GUI (gui_create_metadata4.pyw) 와 헤드리스 실행 (metadata_daemon.py) 에서 함께 사용합니다.
+
+    Attributes:
+        root_folder (str): 사용자가 선택한 폴더 경로.
+        output_excel (str): 생성할 엑셀 파일 경로.
+        output_folder (str): 파일을 이동할 폴더 경로.
+        tmp_zip_folder (str): 수작업으로 확인할 압축 파일을 복사할 폴더 경로.
+        nested_listing (bool): 압축 파일 안의 압축 파일 목록 포함 여부.
+        nested_max_depth (int): 압축 파일 안의 압축 파일을 열어볼 최대 중첩 단계.
+        nested_max_size (int): 메모리로 읽을 내부 압축 파일의 최대 크기 (bytes).
+        verify_archives (bool): zip, egg 내부 파일을 모두 압축 해제하여 CRC 를 확인할지 여부.
+            오류가 있는 내부 파일은 '압축파일 확인필요' 열에 사유를 적습니다.
+        progress (RunProgress): 진행 상황과 취소 요청. 작업마다 새로 지정할 수 있습니다.
+        report (RunReport): 단계별 시간을 기록할 실행 보고서. None 이면 기록하지 않습니다. (run_with_report 참고)
+        organizations (list): 조직명을 저장하는 리스트.
+        names_21 (list): 21대 국회의원 이름을 저장하는 리스트.
+        file_attach (list): 첨부파일 관련 키워드 리스트.
+        file_answer (list): 답변서 관련 키워드 리스트.
+        file_require (list): 요구자료 관련 키워드 리스트.
+    """
+
+    def __init__(self, root_folder='', output_excel='', output_folder='', tmp_zip_folder='',
+                 nested_listing=False, verify_archives=False,
+                 nested_max_depth=NESTED_MAX_DEPTH, nested_max_size=NESTED_MAX_SIZE):
+        """
+        초기화 함수. 경로와 키워드 목록, 검색기를 초기화합니다.
+        """
+        self.root_folder = root_folder
+        self.output_excel = output_excel
+        self.output_folder = output_folder
+        self.tmp_zip_folder = tmp_zip_folder
+        self.nested_listing = nested_listing
+        self.nested_max_depth = nested_max_depth
+        self.nested_max_size = nested_max_size
+        self.verify_archives = verify_archives
+        self.verify_futures = {}
+        self.progress = RunProgress()
+        self.report = None
+        self.organizations = ['과학기술사업화진흥원', '한국항공우주연구원', '국가안보실', '국가인권위원회', '국회도서관', '국회미래연구원', '국회사무처', '국회예산정책처', '국회입법조사처', '대통령경호처', '대통령비서실', '감사원', '고위공직자범죄수사처', '광주고등검찰청', '광주지방검찰청', '군사법원', '대검찰청', '대구고등검찰청', '대구지방검찰청', '대법원', '대전고등검찰청', '대전지방검찰청', '법무부', '법제처', '부산고등검찰청', '국가녹색기술연구소', '부산지방검찰청', '서울고등검찰청', '수원고등검찰청', '수원지방검찰청', '울산지방검찰청', '전주지방검찰청', '제주지방검찰청', '창원지방검찰청', '청주지방검찰청', '헌법재판소', '88관광개발주식회사', '개인정보보호위원회', '경제ㆍ인문사회연구회', '공정거래위원회', '국가보훈처', '국무조정실국무총리비서실', '국민권익위원회', '금융감독원', '금융위원회', '독립기념관', '서민금융진흥원', '신용보증기금', '예금보험공사', '중소기업은행', '한국공정거래조정원', '한국보훈복지의료공단', '한국산업은행', '한국소비자원', '한국자산관리공사', '한국주택금융공사', '관세청', '광주본부세관', '광주지방국세청', '국세청', '국제원산지정보원', '기획재정부', '대구본부세관', '대구지방국세청', '대전지방국세청', '부산본부세관', '부산지방국세청', '서울지방국세청', '인천지방국세청', '조달청', '중부지방국세청', '통계청', '한국수출입은행', '한국은행', '한국재정정보원', '한국조폐공사', '한국투자공사', '강릉원주대학교치과병원', '강원대학교', '강원대학교병원', '강원도교육청', '경기도교육청', '경북대학교', '경북대학교병원', '경북대학교치과병원', '경상국립대학교', '경상국립대학교병원', '경상남도교육청', '경상북도교육청', '광주광역시교육청', '교원소청심사위원회', '교육부', '국가교육위원회', '국가평생교육진흥원', '국립국제교육원', '국립특수교육원', '국사편찬위원회', '대구광역시교육청', '대전광역시교육청', '대한민국학술원사무국', '동북아역사재단', '부산광역시교육청', '부산대학교', '부산대학교병원', '부산대학교치과병원', '사립학교교직원연금공단', '서울과학기술대학교', '서울교육대학교', '서울대학교', '서울대학교병원', '서울대학교치과병원', '서울특별시교육청', '세종특별자치시교육청', '울산광역시교육청', '인천광역시교육청', '인천대학교', '전남대학교', '전남대학교병원', '전라남도교육청', '전라북도교육청', '전북대학교', '전북대학교병원', '제주대학교', '제주대학교병원', '제주특별자치도교육청', '중앙교육연수원', '충남대학교', '충남대학교병원', '충북대학교', '충북대학교병원', '충청남도교육청', '충청북도교육청', '한국고전번역원', '한국교원대학교', '한국교육시설안전원', '한국교육학술정보원', '한국교직원공제회', '한국대학교육협의회', '한국방송통신대학교', '한국사학진흥재단', '한국연구재단', '한국장학재단', '한국전문대학교육협의회', '한국학중앙연구원', '고등과학원', '과학기술연합대학원대학교', '과학기술인공제회', '과학기술일자리진흥원', '과학기술정보통신부', '광주과학기술원', '국가과학기술연구회', '국가과학기술인력개발원', '국가보안기술연구소', '국가수리과학연구소', '국립과천과학관', '국립광주과학관', '국립대구과학관', '국립부산과학관', '국립전파연구원', '국립중앙과학관', '기초과학연구원', '나노종합기술원', '녹색기술센터', '대구경북과학기술원', '방송문화진흥회', '방송통신심의위원회', '방송통신위원회', '별정우체국연금관리단', '세계김치연구소', '시청자미디어재단', '안전성평가연구소', '연구개발특구진흥재단', '우정사업본부', '우체국금융개발원', '우체국물류지원단', '우체국시설관리단', '울산과학기술원', '원자력안전위원회', '정보통신기획평가원', '정보통신산업진흥원', '중앙전파관리소', '한국건설기술연구원', '한국과학기술기획평가원', '한국과학기술단체총연합회', '한국과학기술연구원', '한국과학기술원', '한국과학기술정보연구원', '한국과학기술한림원', '한국과학영재학교', '한국과학창의재단', '한국교육방송공사', '한국기계연구원', '한국기초과학지원연구원', '한국나노기술원', '한국뇌연구원', '한국데이터산업진흥원', '한국방송공사', '한국방송광고진흥공사', '한국방송통신전파진흥원', '한국생명공학연구원', '한국생명기술연구원', '한국수력원자력', '한국식품연구원', '한국에너지기술연구원', '한국여성과학기술인육성재단', '한국연구재단', '한국우편사업진흥원', '한국원자력안전기술원', '한국원자력안전재단', '한국원자력연구원', '한국원자력의학원', '한국원자력통제기술원', '한국인터넷진흥원', '한국재료연구원', '한국전기연구원', '한국전자통신연구원', '한국지능정보사회진흥원', '한국지질자원연구원', '한국천문연구원', '한국철도기술연구원', '한국표준과학연구원', '한국한의학연구원', '한국공항우주연구원', '한국핵융합에너지연구원', '한국화학연구원', '남북교류협력지원협회', '민주평화통일자문회의', '북한이탈주민지원재단', '외교부', '재외동포재단', '통일부', '한ㆍ아프리카재단', '한국국제교류재단', '한국국제협력단', '5ㆍ18민주화운동진상규명조사위원회', '공군본부', '국방부', '방위사업청', '병무청', '육군본부', '지상군구성군사령부', '지방작전사령부', '합동참모본부', '해군본부', 'MG새마을금고중앙회', '경기남부경찰청', '경기도', '경기북부경찰청', '경상남도', '경상남도경찰청', '경상북도', '경상북도경찰청', '경찰공제회', '경찰청', '공무원연금공단', '광주광역시', '광주광역시경찰청', '대전광역시', '대전광역시경찰청', '대한소방공제회', '대한지방행정공제회', '도로교통공단', '민주화운동기념사업회', '바르게살기운동중앙협의회', '새마을운동중앙회', '서울경찰청', '서울특별시', '세종경찰청', '세종특별자치시', '소방산업공제조합', '소방청', '울산경찰청', '울산광역시', '인사혁신처', '일제강제동원피해자지원재단', '제주특별자치도', '제주특별자치도경찰청', '중앙선거관리위원회', '지방공기업평가원', '진실ㆍ화해를위한과거사정리위원회', '충청북도', '충청북도경찰청', '특수법인총포화약안전기술협회', '한국섬진흥원', '한국소방산업기술원', '한국소방시설협회', '한국소방안전원', '한국승강기안전공단', '한국자유총연맹', '한국지능정보사회진흥원', '한국지방세연구원', '한국지방재정공제회', '한국지방행정연구원', '한국지역정보개발원', '행정안전부',
+                              '(재)국립극단', '(재)국립발레단', '한국생산기술연구원', '(재)국립심포니오케스트라', '(재)예술경영지원센터', '(재)한국공예ㆍ디자인문화진흥원', '(재)한국장애인문화예술원', '게임물관리위원회', '국립고궁박물관', '국립국악원', '국립국악중ㆍ고등학교', '국립국어원', '국립무형유산원', '국립문화재연구원', '국립민속박물관', '국립박물관문화재단', '국립아시아문화전당', '국립장애인도서관', '국립중앙극장', '국립중앙도서관', '국립중앙박물관', '국립한글박물관', '국립합창단', '국립해양문화재연구소', '국립현대미술관', '국외소재문화재재단', '국제방송교류재단', '궁능유적본부', '그랜드코리아레저㈜', '대한민국역사박물관', '대한장애인체육회', '대한체육회', '문화재정', '문화체육관광부', '사행산업통합감독위원회', '서울올림픽기념국민체육진흥공단', '세종장학재단', '스포츠윤리센터', '언론중재위원회', '영상물등급위원회', '영화진흥위원회', '예술원사무국', '예술의전당', '재단법인국악방송', '전통공연예술진흥재단', '태권도진흥재단', '한국관광공사', '한국도박문제예방치유원', '한국문학번역원', '한국문화관광연구원', '한국문화예술교육진흥원', '한국문화예술위원회', '한국문화예술회관연합회', '한국문화재재단', '한국문화정보원', '한국문화진흥주식회사', '한국언론진흥재단', '한국영상자료원', '한국예술인복지재단', '한국예술종합학교', '한국저작권보호원', '한국저작권위원회', '한국전통문화대학교', '한국정책방송원', '한국체육산업개발㈜', '한국출판문화산업진흥원', '한국콘텐츠진흥원', '해외문화홍보원', '현충사관리소', '가축위생방역지원본부', '극지연구소', '농림수산식품교육문화정보원', '농림식품기술기획평가원', '농림축산식품부', '농업정책보험금융원', '농업협동조합중앙회', '농촌진흥청', '부산항만공사', '산림조합중앙회', '산림청', '선박해양플랜트연구소', '수산업협동조합중앙회', '수협은행', '여수광양항만공사', '울산항만공사', '인천항만공사', '축산물품질평가원', '축산환경관리원', '한국농수산식품유통공사', '한국농어촌공사', '한국농업기술진흥원', '한국마사회', '한국산림복지진흥원', '한국수목원정원관리원', '한국수산자원공단', '한국식품산업클러스터진흥원', '한국어촌어항공단', '한국임업진흥원', '한국해양과학기술원', '한국해양교통안전공단', '한국해양수산연수원', '한국해양진흥공사', '해양경찰청', '해양수산과학기술진흥원', '해양수산부', '해양환경공단', '공영홈쇼핑', '기술보증기금', '대한무역투자진흥공사', '대한석탄공사', '산업통상자원부', '소상공인시장진흥공단', '신용보증재단중앙회', '재단법인장애인기업종합지원센터', '전략물자관리원', '전력거래소', '주식회사강원랜드', '중소기업기술정보진흥원', '중소기업유통센터', '중소벤처기업부', '중소벤처기업연구원', '중소벤처기업진흥공단', '창업진흥원', '특허청', '한국가스공사', '한국가스기술공사', '한국가스안전공사', '한국광해광업공단', '한국남동발전', '한국남부발전㈜', '한국동서발전', '한국디자인진흥원', '한국로봇산업진흥원', '한국무역보험공사', '한국발명진흥회', '한국벤처투자', '한국산업기술시험원', '한국산업기술진흥원', '한국산업기술평가관리원', '한국산업단지공단', '한국서부발전', '한국석유공사', '한국석유관리원', '한국세라믹기술원', '한국수력원자력㈜', '한국에너지공단', '한국에너지기술평가원', '한국에너지재단', '한국에너지정보문화재단', '한국원자력환경공단', '한국전기안전공사', '한국전력공사', '한국전력국제원자력대학원대학교', '한국전력기술주식회사', '한국제품안전관리원', '한국중부발전㈜', '한국지식재산보호원', '한국지식재산연구원', '한국지역난방공사', '한국탄소산업진흥원', '한국특허전략개발원', '한국특허정보원', '한전KDN㈜', '한전KPS', '한전엠씨에스㈜', '한전원자력연료㈜', '건강보험심사평가원', '국립암센터', '국립중앙의료원', '국민건강보험공단', '국민연금공단', '대구경북첨단의료산업진흥재단', '대학결핵협회', '대한적십자사', '보건복지부', '사회복지공동모금회', '식품안전정보원', '식품의약품안전처', '아동권리보장원', '오송첨단의료산업진흥재단', '의료기관평가인증원', '인구보건복지협회', '재단법인국가생명윤리정책원', '질병관리청', '한국건강증진개발원', '한국공공조직은행', '한국국제보건의료재단', '한국노인인력개발원', '한국마약퇴치운동본부', '한국보건복지인재원', '한국보건산업진흥원', '한국보건의료연구원', '한국보건의료인국가시험원', '한국보건의료정보원', '한국보육진흥원', '한국사회보장정보원', '한국사회복지협의회', '한국식품안전관리인증원', '한국의료기기안전정보원', '한국의료분쟁조정중재원', '한국의약품안전관리원', '한국자활복지개발원', '한국장기조직기증원', '한국장애인개발원', '한국한의약진흥원', '한국희귀필수의약품센터', '(재)차세대수치예보모델개발사업단', 'APEC기후센터', '건설근로자공제회', '경제사회노동위원회', '고용노동부', '고용노동부고객상담센터', '고용보험심사위원회', '광주지방고용노동청', '국가기상위성센터', '국가미세먼지정보센터', '국립공원공단', '국립기상과학원', '국립낙동강생물자원관', '국립생물자원관', '국립생태원', '국립야생동물질병관리원', '국립호남권생물자원관', '국립환경과학원', '국립환경인재개발원', '근로복지공단', '금강유역환경청', '금강홍수통제소', '기상기후인재개발원', '기상레이더센터', '기상청', '낙동강유역환경청', '노사발전재단', '대구지방고용노동청', '대구지방기상청', '대구지방환경청', '대전지방고용노동청', '부산지방고용노동청', '산업재해보상보험재심사위원회', '서울지방고용노동청', '수도권기상청', '수도권대기환경청', '수도권매립지관리공사', '수자원환경산업진흥㈜', '수치모델링센터', '영산강유역환경청', '영산강홍수통제소', '온실가스종합정보센터', '원주지방환경청', '전북지방환경청', '중부지방고용노동청', '중앙노동위원회', '중앙환경분쟁조정위원회', '최저임금위원회', '학교법인한국폴리텍', '한강유역환경청', '한강홍수통제소', '한국고용노동교육원', '한국고용정보원', '한국기상산업기술원', '한국기술교육대학교', '한국사회적기업진흥원', '한국산업안전보건공단', '한국산업인력공단', '한국상하수도협회', '한국수자원공사', '한국수자원조사기술원', '한국잡월드', '한국장애인고용공단', '한국환경공단', '한국환경산업기술원', '항공기상청', '화학물질안전원', '환경보전협회', '환경부', '건설기술교육원', '경기도', '공간정보품질관리원', '국가철도공단', '국립항공박물관', '국토교통과학기술진흥원', '국토교통부', '국토안전관리원', '대한건설기계안전관리원', '새만금개발공사', '새만금개발청', '서울특별시', '인천국제공항공사', '제주국제자유도시개발센터', '주식회사에스알', '주택관리공단㈜', '주택도시보증공사', '코레일관광개발㈜', '코레일네트웍스㈜', '코레일로지스㈜', '코레일유통㈜', '코레일테크㈜', '한국공항공사', '한국교통안전공단', '한국국토정보공사', '한국도로공사', '한국도로공사서비스', '한국부동산원', '한국철도공사', '한국해외인프라도시개발지원공사', '항공안전기술원', '행정중심복합도시건설청', '여성가족부', '한국건강가정진흥원', '한국양성평등교육진흥원', '한국여성인권진흥원', '한국청소년상담복지개발원', '한국청소년활동진흥원']
+        self.names_21 = ['강기윤', '강대식', '강득구', '강민국', '강민정', '강병원', '강선우', '강성희', '강은미', '강준현', '강훈식', '고민정', '고영인', '고용진', '곽상도', '구자근', '권명호', '권성동', '권영세', '권은희', '권인숙', '권칠승', '기동민', '김경만', '김경협', '김교흥', '김근태', '김기현', '김남국', '김도읍', '김두관', '김미애', '김민기', '김민석', '김민철', '김병기', '김병욱', '김병욱', '김병주', '김상훈', '김상희', '김석기', '김선교', '김성원', '김성주', '김성환', '김수흥', '김승남', '김승수', '김승원', '김영배', '김영선', '김영식', '김영주', '김영진', '김영호', '김예지', '김용민', '김용판', '김웅', '김원이', '김윤덕', '김은혜', '김은희', '김의겸', '김정재', '김정호', '김종민', '김주영', '김진애', '김진표', '김철민', '김태년', '김태호', '김태흠', '김학용', '김한규', '김한정', '김형동', '김홍걸', '김회재', '김희곤', '김희국', '남인순', '노용호', '노웅래', '도종환', '류성걸', '류호정', '맹성규', '문정복', '문진석', '민병덕', '민형배', '민홍철', '박광온', '박대수', '박대출', '박덕흠', '박범계', '박병석', '박상혁', '박성민', '박성준', '박성중', '박수영', '박영순', '박완수', '박완주', '박용진', '박재호', '박정', '박정하', '박주민', '박진', '박찬대', '박형수', '박홍근', '배준영', '배진교', '배현진', '백종헌', '백혜련', '변재일', '서동용', '서범수', '서병수', '서삼석', '서영교', '서영석', '서일준', '서정숙', '설훈', '성일종', '소병철', '소병훈', '송갑석', '송기헌', '송석준', '송언석', '송영길', '송옥주', '송재호', '신동근', '신영대', '신원식', '신정훈', '신현영', '심상정', '안규백', '안민석', '안병길', '안철수', '안호영', '양경규', '양경숙', '양금희', '양기대', '양이원영', '양정숙',
+                         '양향자', '어기구', '엄태영', '오기형', '오영환', '오영훈', '용혜인', '우상호', '우신구', '우원식', '위성곤', '유경준', '유기홍', '유동수', '유상범', '유의동', '유정주', '윤건영', '윤관석', '윤두현', '윤미향', '윤상현', '윤영덕', '윤영석', '윤영찬', '윤재갑', '윤재옥', '윤주경', '윤준병', '윤창현', '윤한홍', '윤호중', '윤후덕', '윤희숙', '이개호', '이광재', '이규민', '이낙연', '이달곤', '이동주', '이만희', '이명수', '이병훈', '이상민', '이상직', '이상헌', '이성만', '이소영', '이수진', '이수진', '이양수', '이영', '이용', '이용빈', '이용선', '이용우', '이용호', '이원욱', '이원택', '이은주', '이인선', '이인영', '이자스민', '이장섭', '이재명', '이재정', '이정문', '이종배', '이종성', '이주환', '이채익', '이철규', '이탄희', '이태규', '이학영', '이해식', '이헌승', '이형석', '인재근', '임병헌', '임오경', '임이자', '임종성', '임호선', '장경태', '장동혁', '장제원', '장철민', '장혜영', '전봉민', '전용기', '전재수', '전주혜', '전해철', '전혜숙', '정경희', '정동만', '정성호', '정우택', '정운천', '정일영', '정점식', '정정순', '정진석', '정찬민', '정청래', '정춘숙', '정태호', '정필모', '정희용', '조경태', '조명희', '조수진', '조승래', '조오섭', '조은희', '조응천', '조정식', '조정훈', '조태용', '조해진', '주철현', '주호영', '지성호', '진선미', '진성준', '천준호', '최강욱', '최기상', '최승재', '최연숙', '최영희', '최인호', '최재형', '최종윤', '최춘식', '최형두', '최혜영', '추경호', '태영호', '하영제', '하태경', '한기호', '한무경', '한병도', '한정애', '한준호', '허숙정', '허영', '허은아', '허종식', '홍기원', '홍문표', '홍석준', '홍성국', '홍영표', '홍익표', '홍정민', '홍준표', '황보승희', '황운하', '황희']
+        self.file_attach = ['붙임', '별도', '별첨', '별도제출', '별도 제출', '별첨자료']
+        self.file_answer = ['답변서', '답변자료', '질의 답변',
+                            '질의답변', '요구답변', '요구자료 답변서', '답변서']
+        self.file_require = ['공통요구', '요구자료', '자료요구', '위원 요구', '감사 요구', '감사요구']
+        self.matcher = self.build_matcher()
+        self.nested_lister = None
+        # 같은 폴더의 파일들은 폴더 경로에 대한 분류 결과를 함께 사용 (hits/misses 는 cache_info() 로 확인)
+        self.directory_filetype = functools.lru_cache(maxsize=DIR_FILETYPE_CACHE_SIZE)(
+            self.search_directory_filetype)
+
+    def build_matcher(self):
+        """
+        피감기관, 위원, 문서 종류 키워드 목록을 한 번만 컴파일한 검색기를 생성합니다.
+        """
+        matcher = KeywordMatcher({
+            'organizations': self.organizations,
+            'names_21': self.names_21,
+            'file_attach': self.file_attach,
+            'file_answer': self.file_answer,
+            'file_require': self.file_require,
+        })
+        # 경로 중간의 폴더명 전체가 키워드인 경우 (\\붙임\\)
+        matcher.add_class('dir_attach', self.file_attach, '\\', '\\')
+        matcher.add_class('dir_answer', self.file_answer, '\\', '\\')
+        matcher.add_class('dir_require', self.file_require, '\\', '\\')
+        # 파일명이 [붙임 또는 (붙임 으로 표시된 경우
+        matcher.add_class('bracket_attach', self.file_attach, '[')
+        matcher.add_class('paren_attach', self.file_attach, '(')
+        return matcher
+
+    def search_organization(self, org_dirname):
+        """
+        피감기관 폴더명에서 기관명을 검색합니다. 없으면 폴더명을 그대로 반환합니다.
+        """
+        return self.matcher.search('organizations', org_dirname) or org_dirname
+
+    def copy_by_filetype(self):
+        """
+        root_folder 내의 파일을 분류하여 output_folder 아래 위원회/피감기관/문서 종류 폴더로 복사합니다.
+
+        Raises:
+            RunCancelled: 작업이 취소된 경우. 이미 시작한 복사는 끝까지 진행합니다.
+        """
+        df = self.dir_to_dic()
+        df = self.classify_rows(df)
+        df = self.classify_filetypes(df)
+
+        # 모든 대상 경로를 먼저 정한 뒤 한 번에 동시 복사
+        copy_pairs = []
+        error_dirs = {}
+        for row in df.to_dict('records'):
+            com_dirname = row['분류 위원회']
+            org_dirname = row['분류 피감기관']
+            file_dirname = row['전체 경로']
+            result_filetype = row['분류 문서 종류']
+
+            if result_filetype == 1:
+                folder_name = '별도제출자료'
+            elif result_filetype == 2:
+                folder_name = '서면질의답변자료'
+            elif result_filetype == 3:
+                folder_name = '국정감사요구자료'
+            else:
+                folder_name = '기타'
+
+            dst_file = self.generate_destination(
+                com_dirname, org_dirname, file_dirname, folder_name)
+            copy_pairs.append((file_dirname, dst_file))
+            error_dirs[dst_file] = os.path.join(self.output_folder, com_dirname)
+
+        progress = self.progress
+        progress.set_stage(STAGE_COPY, len(error_dirs))
+
+        copied_bytes = 0
+
+        def on_result(file_dirname, dst_file, error):
+            nonlocal copied_bytes
+            size = 0
+            if error is None:
+                try:
+                    size = os.path.getsize(dst_file)
+                except OSError:
+                    pass
+            else:
+                self.write_copy_error(error_dirs[dst_file], file_dirname, error)
+                if self.report is not None:
+                    self.report.count_error(type(error).__name__)
+            copied_bytes += size
+            progress.file_done(size=size)
+            if self.report is not None:
+                self.report.count_file(0)
+            # 취소하면 아직 시작하지 않은 복사는 하지 않음
+            progress.check_cancelled()
+
+        started = time.perf_counter()
+        try:
+            copy_files(copy_pairs, on_result=on_result)
+        finally:
+            self.record_stage('copy_files', started, len(error_dirs), copied_bytes)
+
+    def generate_destination(self, com_dirname, org_dirname, file_dirname, folder_name):
+        """
+        파일을 복사할 대상 파일 경로를 반환합니다. (output_folder/위원회/피감기관/문서 종류/파일명)
+        """
+        output_dir = os.path.join(
+            self.output_folder, com_dirname, org_dirname, folder_name)
+        return os.path.join(output_dir, os.path.basename(file_dirname))
+
+    def write_copy_error(self, error_dir, file_dirname, error):
+        """
+        복사에 실패한 파일을 위원회 폴더의 log.txt 에 기록합니다. 같은 파일로의 복사는 무시합니다.
+        """
+        if isinstance(error, shutil.SameFileError):
+            return
+        error_message = str(error) + ' ' + file_dirname
+        try:
+            os.makedirs(error_dir, exist_ok=True)
+            with open(error_dir + '/log.txt', 'a') as file:
+                file.write(error_message + '\n')
+        except OSError as e:
+            print(e, error_message)
+
+    def open_writers(self, output_excel, append, write_excel=True, write_columnar=False):
+        """
+        선택한 출력 형식의 writer 들을 MetadataWriterGroup 으로 묶어 반환합니다.
+
+        Args:
+            output_excel (str): 엑셀 파일 경로. 열 기반 매니페스트는 같은 이름의 .parquet 또는 .csv 입니다.
+            append (bool): 기존 엑셀 파일의 행을 먼저 옮겨 적은 뒤 이어서 기록할지 여부.
+            write_excel (bool): 엑셀 파일 기록 여부.
+            write_columnar (bool): 열 기반 매니페스트 기록 여부 (기존 파일이 있으면 이어서 기록).
+        """
+        writers = []
+        if write_excel:
+            if append:
+                # 기존 파일의 행을 먼저 옮겨 적은 뒤 이어서 기록
+                writers.append(ExcelMetadataWriter(
+                    output_excel, existing_excel=output_excel))
+            else:
+                writers.append(ExcelMetadataWriter(output_excel))
+        if write_columnar:
+            writers.append(open_columnar_writer(columnar_output_path(output_excel)))
+        return MetadataWriterGroup(writers)
+
+    def open_manifest(self, output_excel, is_new_output):
+        """
+        증분 모드 매니페스트를 엽니다. 새 출력 파일이면 빈 매니페스트로 시작합니다.
+        """
+        manifest_path = manifest_path_for(output_excel)
+        if is_new_output:
+            return MetadataManifest(manifest_path)
+        return MetadataManifest.load(manifest_path)
+
+    def generate(self, writer, manifest=None, df=None):
+        """
+        root_folder 의 메타데이터를 writer 에 기록하고 저장합니다.
+
+        Args:
+            writer: open_writers 가 반환한 출력 객체.
+            manifest (MetadataManifest): 증분 모드일 때 이전 실행에서 기록한 파일 목록.
+            df (DataFrame): 이미 탐색한 dir_to_dic 결과. 없으면 새로 탐색합니다.
+
+        Raises:
+            RunCancelled: 작업이 취소된 경우. 그때까지 기록한 행과 매니페스트는 저장한 뒤 발생합니다.
+        """
+        try:
+            if df is None:
+                df = self.dir_to_dic(manifest)
+            self.write_to_excel(df, writer, manifest)
+        except RunCancelled:
+            self.save_outputs(writer, manifest, cancelled=True)
+            raise
+
+        self.save_outputs(writer, manifest)
+
+    def save_outputs(self, writer, manifest=None, cancelled=False):
+        """
+        출력 파일들을 저장하고, 저장에 성공한 뒤에만 매니페스트를 갱신합니다.
+        취소된 경우 기록하지 못한 파일은 다음 증분 실행에서 다시 처리하도록 남겨 둡니다.
+        """
+        for output in writer.writers:
+            started = time.perf_counter()
+            output.close()
+            self.record_stage(f'save {type(output).__name__}', started)
+        if manifest is not None:
+            if cancelled:
+                manifest.defer_pending()
+            manifest.save()
+
+    def run_with_report(self, job, report_path, profile_path=None):
+        """
+        job() 을 실행하며 단계별 시간을 기록하고, 끝나면 (취소/실패 포함) report_path 에 JSON 보고서를 저장합니다.
+        profile_path 를 주면 job() 을 cProfile 로 실행하여 결과를 저장합니다.
+        """
+        self.report = RunReport()
+        self.report.profile_path = profile_path
+        status = 'failed'
+        try:
+            if profile_path:
+                profile_call(job, profile_path)
+            else:
+                job()
+            status = 'completed'
+        except RunCancelled:
+            status = 'cancelled'
+            raise
+        finally:
+            self.report.finish(status)
+            try:
+                self.report.write(report_path)
+            except OSError as e:
+                print(f"실행 보고서 저장 오류 ({report_path}): {e}")
+            self.report = None
+
+    def record_stage(self, stage, started, items=0, size=0):
+        """
+        실행 보고서가 있으면 started (time.perf_counter()) 부터 지금까지를 stage 의 시간으로 기록합니다.
+        """
+        if self.report is not None:
+            self.report.add(stage, time.perf_counter() - started, items, size)
+
+    def write_to_excel(self, df, writer, manifest=None):
+        """
+        DataFrame의 각 행(압축 파일은 내부 파일 목록)을 메타데이터 행으로 만들어 순서대로 기록합니다.
+
+        Args:
+            df (DataFrame): dir_to_dic 결과.
+            writer: append(row) 를 제공하는 출력 객체 (ExcelMetadataWriter 등).
+            manifest (MetadataManifest): 증분 모드일 때 이미 기록한 압축파일 내부 파일을 건너뛰고,
+                처리한 파일을 기록합니다.
+        """
+        if df.empty:
+            return
+        progress = self.progress
+        progress.set_stage(STAGE_WRITE, len(df))
+        # 위원회, 피감기관, 위원을 열 단위로 미리 계산
+        df = self.classify_rows(df)
+        # 압축 파일 내부 목록을 미리 동시에 읽기 시작 (행 순서대로 받아서 기록)
+        listings = self.list_archives(df)
+
+        try:
+            for row in df.to_dict('records'):
+                progress.check_cancelled()
+                self.write_row(row, listings, writer, manifest)
+        finally:
+            listings.close()
+
+    def write_row(self, row, listings, writer, manifest=None):
+        """
+        DataFrame 한 행의 메타데이터 행들을 기록합니다. 압축 파일이면 listings 에서 다음 목록을 받습니다.
+        """
+        listing = None
+        if row['확장자'] in ARCHIVE_EXTENSIONS:
+            # 스레드 풀에서 아직 목록을 읽고 있으면 기다림
+            started = time.perf_counter()
+            listing = next(listings)
+            self.record_stage('wait_listing', started)
+        member_errors = self.verify_result(row['전체 경로'])
+        if manifest is None:
+            new_listing = listing
+        elif isinstance(listing, list):
+            # 변경된 압축 파일은 새로 추가된 내부 파일만 기록
+            recorded = manifest.recorded_members(row['전체 경로'])
+            new_listing = [file for file in listing if file not in recorded]
+        else:
+            new_listing = listing
+
+        started = time.perf_counter()
+        metadata_rows = self.metadata_rows(row, new_listing, member_errors)
+        self.record_stage('build_rows', started, len(metadata_rows))
+        started = time.perf_counter()
+        for metadata_row in metadata_rows:
+            writer.append(metadata_row)
+        self.record_stage('append_rows', started, len(metadata_rows))
+        self.progress.file_done(rows=len(metadata_rows))
+        if self.report is not None:
+            self.report.count_file(len(metadata_rows))
+
+        if manifest is not None:
+            manifest.record(row['전체 경로'],
+                            listing if isinstance(listing, list) else None)
+
+    def metadata_rows(self, row, listing=None, member_errors=None):
+        """
+        DataFrame 한 행에 대한 메타데이터 행 리스트를 반환합니다.
+        zip, egg, alz, 7z 파일은 내부 파일마다 한 행씩 만들고, 내부 파일이 없으면 빈 리스트입니다.
+        member_errors 는 CRC 확인 결과 {내부 파일 경로: 오류 사유} 입니다. (verify_archives)
+        """
+        if row['확장자'] == '.zip':
+            return self.read_zip_file(row, listing, member_errors)
+        if row['확장자'] == '.egg':
+            return self.read_egg_file(row, listing, member_errors)
+        if row['확장자'] == '.alz':
+            return self.read_alz_file(row, listing)
+        if row['확장자'] == '.7z':
+            return self.read_sevenzip_file(row, listing)
+
+        return [self.base_metadata_row(row)]
+
+    def base_metadata_row(self, row):
+        """
+        위원회, 피감기관, 위원 열을 채운 메타데이터 행을 반환합니다.
+        """
+        metadata_row = new_metadata_row()
+        metadata_row['위원회'] = row['분류 위원회']
+        metadata_row['피감기관'] = row['분류 피감기관']
+        # 실제 경로 폴더명에서 위원명이 검출되지 않을경우 공백
+        metadata_row['위원'] = row['분류 위원']
+        return metadata_row
+
+    def archive_metadata_rows(self, row, file_list, member_errors=None):
+        """
+        압축 파일 내부 파일 목록을 메타데이터 행 리스트로 변환합니다.
+        CRC 확인에서 오류가 난 내부 파일은 '압축파일 확인필요' 열에 사유만 적습니다. (압축 파일은 복사하지 않음)
+        """
+        metadata_rows = []
+        tmp_path = pathlib.Path(row['실제 경로']).with_suffix('')
+        for file in file_list:
+            if os.path.basename(file):
+                metadata_row = self.base_metadata_row(row)
+                metadata_row['압축파일 이름'] = row['FILE_NAME']
+                metadata_row['REALFILE_NAME'] = os.path.basename(file)
+                metadata_row['실제 경로'] = os.path.join(tmp_path, file)
+                if member_errors and file in member_errors:
+                    metadata_row['압축파일 확인필요'] = member_errors[file]
+                    if self.report is not None:
+                        self.report.count_error(member_errors[file])
+                metadata_rows.append(metadata_row)
+        return metadata_rows
+
+    def error_metadata_row(self, row, message):
+        """
+        압축 파일을 읽을 수 없을 때 '압축파일 확인필요' 열에 사유를 적은 행을 반환합니다.
+        """
+        if self.report is not None:
+            self.report.count_error(message)
+        metadata_row = self.base_metadata_row(row)
+        metadata_row['압축파일 확인필요'] = message
+        metadata_row['REALFILE_NAME'] = row['FILE_NAME']  # 파일명
+        metadata_row['실제 경로'] = row['실제 경로']  # 실제 경로
+        return metadata_row
+
+    def copy_to_tmp_zip_folder(self, row, copy_file=True):
+        """
+        수작업으로 확인할 압축 파일을 tmp_zip_folder 아래 같은 상대 경로로 복사합니다.
+        """
+        alz_egg_dst_dir = os.path.join(
+            self.tmp_zip_folder, row['파일명 제외 경로'])
+        alz_egg_dst_file_dir = os.path.join(
+            self.tmp_zip_folder, row['실제 경로'])
+        if not os.path.exists(alz_egg_dst_dir):
+            os.makedirs(alz_egg_dst_dir)
+        if copy_file:
+            started = time.perf_counter()
+            shutil.copy(row['전체 경로'], alz_egg_dst_file_dir)
+            if self.report is not None:
+                self.record_stage('copy_tmp_zip', started, 1, os.path.getsize(alz_egg_dst_file_dir))
+
+    def list_archives(self, df):
+        """
+        zip, egg, alz, 7z 파일의 내부 파일 목록을 스레드 풀에서 동시에 읽습니다.
+        모든 압축 파일을 미리 스레드 풀에 넣어 두고, 결과는 df 의 압축 파일 순서대로 반환합니다.
+        제너레이터를 닫으면 (작업 취소 등) 아직 시작하지 않은 목록 읽기는 취소합니다.
+
+        Yields:
+            자연 정렬된 파일 목록 또는 목록을 읽다 발생한 예외.
+        """
+        if df.empty:
+            return
+        archive_paths = [full_path for full_path, extension in zip(df['전체 경로'], df['확장자'])
+                         if extension in ARCHIVE_EXTENSIONS]
+        # 압축파일 안의 압축파일은 메모리에서 열어 목록을 펼침
+        self.nested_lister = NestedArchiveLister(
+            self.nested_max_depth, self.nested_max_size) if self.nested_listing else None
+
+        executor = ThreadPoolExecutor(max_workers=LIST_ARCHIVE_WORKERS)
+        verify_executor = None
+        if self.verify_archives:
+            # CRC 확인은 압축 해제 (CPU) 작업이므로 프로세스 풀에 모두 미리 넣어 둠
+            verify_executor = ProcessPoolExecutor()
+            for archive_path in archive_paths:
+                extension = pathlib.Path(archive_path).suffix.lower()
+                if extension in VERIFIERS:
+                    self.verify_futures[archive_path] = verify_executor.submit(
+                        verify_archive, archive_path, extension)
+        futures = [executor.submit(self.list_archive, archive_path) for archive_path in archive_paths]
+        try:
+            for future in futures:
+                yield self.wait_future(future)
+        finally:
+            # 멈춘 압축 파일을 기다리지 않도록 읽고 있는 목록은 끝나기를 기다리지 않고, 시작하지 않은 작업은 취소
+            # (shutdown 의 cancel_futures 는 Python 3.9 부터 지원하므로 직접 취소)
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+            if verify_executor is not None:
+                for future in self.verify_futures.values():
+                    future.cancel()
+                verify_executor.shutdown(wait=False)
+                self.verify_futures = {}
+
+    def wait_future(self, future):
+        """
+        future 의 결과를 기다립니다. 멈춘 압축 파일을 기다리는 중에도 취소할 수 있도록 주기적으로 취소 요청을 확인합니다.
+
+        Raises:
+            RunCancelled: 기다리는 중에 작업이 취소된 경우.
+        """
+        while True:
+            try:
+                return future.result(timeout=CANCEL_CHECK_INTERVAL)
+            except FutureTimeoutError:
+                self.progress.check_cancelled()
+
+    def verify_result(self, archive_path):
+        """
+        list_archives 에서 시작한 압축 파일의 CRC 확인 결과를 기다려 반환합니다.
+
+        Returns:
+            dict: {내부 파일 경로: 오류 사유}. CRC 를 확인하지 않았거나 압축 파일을 열 수 없으면 None.
+        """
+        future = self.verify_futures.pop(archive_path, None)
+        if future is None:
+            return None
+        started = time.perf_counter()
+        try:
+            member_errors = self.wait_future(future)
+        except RunCancelled:
+            raise
+        except Exception as e:
+            # 워커 프로세스가 비정상 종료된 경우 등: 목록은 그대로 기록
+            print(f"CRC 확인 오류 ({archive_path}): {e}")
+            member_errors = None
+        self.record_stage('wait_verify', started, len(member_errors or ()))
+        return member_errors
+
+    def list_archive(self, archive_path):
+        self.progress.archive_started(archive_path)
+        started = time.perf_counter()
+        try:
+            file_list = self.list_archive_file(archive_path)
+        finally:
+            seconds = time.perf_counter() - started
+            # 처리량은 진행 상황을 표시하거나 보고서를 기록할 때만 계산 (네트워크 드라이브의 stat 을 줄이기 위함)
+            size = 0
+            if self.progress.callback is not None or self.report is not None:
+                try:
+                    size = os.path.getsize(archive_path)
+                except OSError:
+                    pass
+            self.progress.archive_finished(archive_path, size)
+        if self.report is not None:
+            is_error = isinstance(file_list, Exception)
+            self.report.add(f'list {pathlib.Path(archive_path).suffix.lower()}', seconds,
+                            0 if is_error else len(file_list), size)
+            self.report.add_archive(archive_path, seconds, size, 0 if is_error else len(file_list),
+                                    file_list if is_error else None)
+        return file_list
+
+    def list_archive_file(self, archive_path):
+        try:
+            if archive_path.lower().endswith('.egg'):
+                file_list = self.list_egg_file(archive_path)
+            elif archive_path.lower().endswith('.alz'):
+                file_list = self.list_alz_file(archive_path)
+            elif archive_path.lower().endswith('.7z'):
+                file_list = self.list_sevenzip_file(archive_path)
+            else:
+                file_list = self.list_zip_file(archive_path)
+        except Exception as e:
+            return e
+
+        if self.nested_lister is not None:
+            started = time.perf_counter()
+            extension = pathlib.Path(archive_path).suffix.lower()
+            file_list = natsorted(self.nested_lister.expand(
+                archive_path, extension, file_list))
+            self.record_stage('nested_expand', started, len(file_list))
+        return file_list
+
+    def list_egg_file(self, egg_path):
+        started = time.perf_counter()
+        egg_file = EggFile(egg_path)
+        self.record_stage('egg_parse', started)
+        try:
+            return natsorted(self.get_alz_filelist(egg_file))
+        finally:
+            egg_file.close()
+
+    def list_alz_file(self, alz_path):
+        with AlzFile(alz_path) as alz_file:
+            return natsorted(self.get_alz_filelist(alz_file))
+
+    def list_sevenzip_file(self, sevenzip_path):
+        # 파일 끝의 헤더만 읽음 (압축 해제 없음)
+        with SevenZipFile(sevenzip_path) as sevenzip_file:
+            return natsorted(self.get_alz_filelist(sevenzip_file))
+
+    def list_zip_file(self, zip_path):
+        # 중앙 디렉터리만 읽음 (분할 압축은 .z01 ... .zip 을 하나로 보고 그대로 나열)
+        started = time.perf_counter()
+        zip_ref = ZipFileList(zip_path)
+        self.record_stage('zip_central_dir', started)
+        with zip_ref:
+            zip_file_list = []
+
+            # 인코딩 처리 (UTF-8 플래그가 없는 이름은 압축 파일 단위로 인코딩을 정해 해석)
+            started = time.perf_counter()
+            namelist = zip_ref.namelist()
+            self.record_stage('zip_name_decode', started, len(namelist))
+            for filename in namelist:
+                # 경로에서 '/'를 '\\'로 변환하고, 디렉토리 제외
+                if not filename.endswith('/'):
+                    filename = filename.replace('/', '\\')
+                    zip_file_list.append(filename)
+
+        # natsort를 사용하여 파일 목록을 자연스럽게 정렬
+        return natsorted(zip_file_list)
+
+    def get_alz_filelist(self, egg_file):
+        file_paths = []
+
+        try:
+            namelist = egg_file.namelist()
+            for name in namelist:
+                if not name.endswith('/'):
+                    name = name.replace('/', '\\')
+                    file_paths.append(name)
+        except Exception as e:
+            print(f"An error occurred: {e}")
+
+        return file_paths
+
+    def read_egg_file(self, row, egg_file_list, member_errors=None):
+        if isinstance(egg_file_list, Exception):
+            print(egg_file_list)
+            if isinstance(egg_file_list, FileNotFoundError):
+                metadata_row = self.error_metadata_row(row, '파일 찾을수 없음')
+                self.copy_to_tmp_zip_folder(row, copy_file=False)
+            else:
+                # 헤더를 읽을 수 없는 egg (손상, 알 수 없는 헤더, 코멘트 헤더 등)는 수작업 확인을 위해 복사
+                metadata_row = self.error_metadata_row(row, '압축파일 오류')
+                self.copy_to_tmp_zip_folder(row)
+            return [metadata_row]
+        return self.archive_metadata_rows(row, egg_file_list, member_errors)
+
+    def read_alz_file(self, row, alz_file_list):
+        if isinstance(alz_file_list, Exception):
+            # 헤더를 읽을 수 없는 alz (분할 압축 등)는 수작업 확인을 위해 복사
+            print(alz_file_list)
+            metadata_row = self.error_metadata_row(row, 'alz 파일')
+            self.copy_to_tmp_zip_folder(row)
+            return [metadata_row]
+        return self.archive_metadata_rows(row, alz_file_list)
+
+    def read_sevenzip_file(self, row, sevenzip_file_list):
+        try:
+            if isinstance(sevenzip_file_list, Exception):
+                raise sevenzip_file_list
+            return self.archive_metadata_rows(row, sevenzip_file_list)
+        except Bad7zFile as e:
+            # 손상되었거나 헤더가 암호화된 7z
+            print(e)
+            metadata_row = self.error_metadata_row(row, '압축파일 오류')
+            self.copy_to_tmp_zip_folder(row)
+        except FileNotFoundError as e:
+            print(e)
+            metadata_row = self.error_metadata_row(row, '파일 찾을수 없음')
+            self.copy_to_tmp_zip_folder(row, copy_file=False)
+        return [metadata_row]
+
+    def read_zip_file(self, row, zip_file_list, member_errors=None):
+        try:
+            if isinstance(zip_file_list, Exception):
+                raise zip_file_list
+            return self.archive_metadata_rows(row, zip_file_list, member_errors)
+        except zipfile.BadZipFile:
+            # 볼륨이 빠졌거나 손상된 분할 압축만 수작업 확인 대상
+            if os.path.exists(str(row['전체 경로']).replace('.zip', '.z01')):
+                metadata_row = self.error_metadata_row(row, '분할압축')
+            else:
+                metadata_row = self.error_metadata_row(row, '압축파일 오류')
+            self.copy_to_tmp_zip_folder(row)
+        except UnicodeDecodeError:
+            metadata_row = self.error_metadata_row(row, '인코딩 에러')
+            self.copy_to_tmp_zip_folder(row)
+        except FileNotFoundError as e:
+            print(e)
+            metadata_row = self.error_metadata_row(row, '파일 찾을수 없음')
+            self.copy_to_tmp_zip_folder(row, copy_file=False)
+        return [metadata_row]
+
+    def dir_to_dic(self, manifest=None):
+        # 최상위 폴더명 가져오기
+        top_level_folder = os.path.basename(self.root_folder)
+        grandparent_folder = os.path.dirname(self.root_folder)
+
+        # 열별 리스트 초기화
+        columns = {'위원회': [], '피감기관': [], 'FILE_NAME': [], '실제 경로': [],
+                   '파일명 제외 경로': [], '2단계 서브 폴더': [], '전체 경로': [], '확장자': []}
+
+        # parent_folder를 기준으로 모든 파일을 탐색 (증분 모드에서는 새 파일, 변경된 압축 파일만)
+        started = time.perf_counter()
+        walk = manifest.walk if manifest is not None else parallel_walk
+        progress = self.progress
+        progress.set_stage(STAGE_WALK)
+        for root, _, files in walk(self.root_folder):
+            progress.check_cancelled()
+            if not files:
+                continue
+            progress.walked(len(files))
+            # 폴더 단위로 한 번만 계산하는 경로 정보
+            relative_except_filename_path = os.path.relpath(
+                root, grandparent_folder)  # 파일명 제외 경로이름
+            dir_components = relative_except_filename_path.split(os.sep)
+            if len(dir_components) > 1:
+                two_depth_path = os.path.join(
+                    dir_components[0], dir_components[1])
+                first_folder_name = dir_components[1]  # 첫 번째 서브폴더명
+            else:
+                two_depth_path = None
+                first_folder_name = None
+
+            # 파일을 자연 정렬하여 순회
+            files = natsorted(files)
+            count = len(files)
+            columns['위원회'].extend([top_level_folder] * count)
+            if first_folder_name is None:
+                # 최상위 폴더 바로 아래의 파일은 파일명이 피감기관 자리에 옴
+                columns['피감기관'].extend(files)
+            else:
+                columns['피감기관'].extend([first_folder_name] * count)
+            columns['FILE_NAME'].extend(files)  # 파일명
+            columns['실제 경로'].extend(
+                [os.path.join(relative_except_filename_path, file) for file in files])
+            columns['파일명 제외 경로'].extend(
+                [relative_except_filename_path] * count)
+            columns['2단계 서브 폴더'].extend([two_depth_path] * count)
+            columns['전체 경로'].extend(
+                [os.path.join(root, file) for file in files])
+            columns['확장자'].extend(
+                [file_suffix(file).lower() for file in files])  # zip, alz, egg
+
+        self.record_stage('dir_to_dic', started, len(columns['FILE_NAME']))
+
+        # DataFrame 생성
+        if not columns['FILE_NAME']:
+            return pd.DataFrame()
+        return pd.DataFrame(columns)
+
+    def classify_rows(self, df):
+        """
+        위원회, 피감기관, 위원을 열 단위(pandas 문자열 연산)로 계산하여 df 에 추가합니다.
+
+        추가되는 열:
+            분류 위원회: 위원회 폴더명에서 앞의 번호를 제외한 이름
+            분류 피감기관: 피감기관 폴더명에서 검색한 기관명 (없으면 폴더명)
+            검색 위원: 실제 경로에서 검색한 위원 이름 (없으면 None)
+            분류 위원: '위원' 열에 쓸 값 ('이름 위원', 없으면 None)
+        """
+        if df.empty:
+            return df
+        started = time.perf_counter()
+
+        committee = df['위원회'].astype(str)
+        has_blank = committee.str.contains(' ', regex=False)
+        df['분류 위원회'] = to_object_column(
+            committee.str.partition(' ')[2].where(has_blank, df['위원회']))
+
+        # 피감기관 폴더명은 종류가 적으므로 고유값만 검색
+        org_dirnames = df['피감기관'].unique()
+        df['분류 피감기관'] = to_object_column(df['피감기관'].map(
+            {org_dirname: self.search_organization(org_dirname) for org_dirname in org_dirnames}))
+
+        member = self.matcher.search_series('names_21', df['실제 경로'])
+        # '이용' 은 다른 단어의 일부로 자주 등장하므로 문화체육관광위원회에서만 인정
+        excluded = (member == '이용') & (df['분류 위원회'] != '문화체육관광위원회')
+        df['검색 위원'] = to_object_column(member)
+        df['분류 위원'] = to_object_column(
+            (member + ' 위원').where(member.notna() & ~excluded))
+        self.record_stage('classify_rows', started, len(df))
+        return df
+
+    def classify_filetypes(self, df):
+        """
+        processing_search_in_row 로 문서 종류(1~4)를 계산하여 '분류 문서 종류' 열로 추가합니다.
+        같은 폴더의 파일들은 폴더 경로에 대한 검색 결과를 함께 사용하므로 파일마다 파일명 부분만 검색합니다.
+        """
+        if df.empty:
+            return df
+        started = time.perf_counter()
+        cache_before = self.directory_filetype.cache_info()
+        search_filetype = self.search_filetype
+        df['분류 문서 종류'] = [
+            search_filetype(full_path, real_path, except_filename_path, depth2_path, file_name)
+            for full_path, real_path, except_filename_path, depth2_path, file_name in zip(
+                df['전체 경로'], df['실제 경로'], df['파일명 제외 경로'], df['2단계 서브 폴더'], df['FILE_NAME'])]
+        self.record_stage('classify_filetypes', started, len(df))
+        if self.report is not None:
+            cache_after = self.directory_filetype.cache_info()
+            self.report.count('dir_filetype_cache_hits', cache_after.hits - cache_before.hits)
+            self.report.count('dir_filetype_cache_misses', cache_after.misses - cache_before.misses)
+        return df
+
+    def processing_search_in_row(self, row):
+        return self.search_filetype(row['전체 경로'], row['실제 경로'], row['파일명 제외 경로'],
+                                    row['2단계 서브 폴더'], row['FILE_NAME'])
+
+    def search_filetype(self, full_path, real_path, except_filename_path, depth2_path, file_name):
+        """
+        processing_search_in_row_uncached 와 같은 결과를 반환합니다.
+        경로 중 폴더 부분에 대한 검색 결과는 directory_filetype 에 폴더 경로별로 기억해 두고,
+        파일명 부분만 파일마다 검색합니다.
+        """
+        full_name = os.path.basename(full_path)
+        real_name = os.path.basename(real_path)
+        # dir_* 키워드는 '\\' 로 둘러싸인 폴더명이므로 파일명에 '\\' 가 없으면 폴더 부분에서만 매치됨
+        if '\\' in full_name or '\\' in real_name:
+            return self.processing_search_in_row_uncached({
+                '전체 경로': full_path, '실제 경로': real_path, '파일명 제외 경로': except_filename_path,
+                '2단계 서브 폴더': depth2_path, 'FILE_NAME': file_name})
+
+        primary_result, depth2_result, path_result, real_dir_matches = self.directory_filetype(
+            full_path[:len(full_path) - len(full_name)],
+            depth2_path if pd.notna(depth2_path) else None,
+            except_filename_path,
+            real_path[:len(real_path) - len(real_name)])
+
+        if primary_result != 4:
+            return primary_result
+        secondary_result = self.secondary_search_in_row(file_name)
+        if secondary_result != 4:
+            return secondary_result
+        if depth2_result != 4:
+            return depth2_result
+        if path_result != 4:
+            return path_result
+
+        # 키워드에는 경로 구분자가 없으므로 분류별 첫 매치는 폴더 부분에 있으면 그것, 없으면 파일명에서 찾음
+        result = 4
+        result_len = 0
+        for filetype, (name, matched_len) in enumerate(zip(FILETYPE_CLASSES, real_dir_matches), 1):
+            if matched_len is None:
+                matched = self.matcher.search(name, real_name)
+                matched_len = len(matched) if matched is not None else 0
+            if matched_len > result_len:
+                result = filetype
+                result_len = matched_len
+        return result
+
+    def search_directory_filetype(self, full_dir_path, depth2_path, except_filename_path, real_dir_path):
+        """
+        processing_search_in_row 에서 파일명과 관계없이 폴더 경로만으로 정해지는 검색 결과를 반환합니다.
+
+        Returns:
+            tuple: (전체 경로 분류, 2단계 서브 폴더 분류, 파일명 제외 경로 분류,
+                    실제 경로 폴더 부분의 분류별 첫 매치 길이 (매치가 없으면 None) 튜플)
+        """
+        primary_result = self.primary_search_in_row(full_dir_path)
+        depth2_result = 4
+        if depth2_path is not None:
+            depth2_result = self.search_in_row(depth2_path)
+        path_result = self.search_in_row(except_filename_path)
+        real_dir_matches = tuple(
+            None if matched is None else len(matched)
+            for matched in self.matcher.search_all(real_dir_path, FILETYPE_CLASSES).values())
+        return primary_result, depth2_result, path_result, real_dir_matches
+
+    def processing_search_in_row_uncached(self, row):
+        depth2_result = 4
+
+        primary_search_in_row = self.primary_search_in_row(row['전체 경로'])
+        secondary_search_in_row = self.secondary_search_in_row(
+            row['FILE_NAME'])
+        if primary_search_in_row == 4:
+            if secondary_search_in_row == 4:
+                if pd.notna(row['2단계 서브 폴더']):
+                    depth2_result = self.search_in_row(row['2단계 서브 폴더'])
+                    path_result = self.search_in_row(row['파일명 제외 경로'])
+                else:
+                    path_result = self.search_in_row(row['파일명 제외 경로'])
+                if depth2_result == 4:
+                    if path_result == 4:
+                        result_filetype = self.search_in_row(row['실제 경로'])
+                    else:
+                        result_filetype = path_result
+                else:
+                    result_filetype = depth2_result
+            else:
+                result_filetype = secondary_search_in_row
+        else:
+            result_filetype = primary_search_in_row
+        return result_filetype
+
+    def primary_search_in_row(self, row):
+        if self.matcher.search('dir_attach', row):
+            return 1
+        if self.matcher.search('dir_answer', row):
+            return 2
+        if self.matcher.search('dir_require', row):
+            return 3
+        return 4
+
+    def secondary_search_in_row(self, row):
+        if self.matcher.search('bracket_attach', row):
+            return 1
+        if self.matcher.search('paren_attach', row):
+            return 1
+        return 4
+
+    def search_in_row(self, row):
+        result_class = self.matcher.longest_class(row, FILETYPE_CLASSES)
+        if result_class == 'file_attach':
+            return 1
+        if result_class == 'file_answer':
+            return 2
+        if result_class == 'file_require':
+            return 3
+        return 4
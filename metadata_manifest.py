@@ -0,0 +1,170 @@
+import os
+import json
+
+# 내용이 바뀌면 내부 파일 목록을 다시 읽어야 하는 확장자
+ARCHIVE_EXTENSIONS = ('.zip', '.egg', '.alz', '.7z')
+
+MANIFEST_VERSION = 1
+
+
+def manifest_path_for(output_excel):
+    """
+    엑셀 파일과 같은 폴더에 저장할 매니페스트 파일 경로를 반환합니다.
+    """
+    return output_excel + '.manifest.json'
+
+
+class MetadataManifest:
+    """
+    이전 실행에서 엑셀에 기록한 파일 목록. 증분 모드에서 새로 추가되었거나 변경된 파일만 처리하기 위해 사용합니다.
+
+    Attributes:
+        path (str): 매니페스트 파일 경로.
+        files (dict): {전체 경로: [크기, 수정 시각(ns), 기록한 압축파일 내부 파일 목록 또는 None]}
+        dirs (dict): {폴더 경로: [수정 시각(ns), 하위 폴더 이름 리스트, 파일 이름 리스트]}
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.files = {}
+        self.dirs = {}
+        # walk() 중 확인한 파일의 (크기, 수정 시각) - record() 에서 사용
+        self.pending_stats = {}
+
+    @classmethod
+    def load(cls, path):
+        """
+        매니페스트 파일을 읽습니다. 파일이 없거나 형식이 다르면 빈 매니페스트를 반환합니다.
+        """
+        manifest = cls(path)
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+            if data.get('version') == MANIFEST_VERSION:
+                manifest.files = data.get('files', {})
+                manifest.dirs = data.get('dirs', {})
+        except FileNotFoundError:
+            pass
+        except (ValueError, AttributeError) as e:
+            print(f"매니페스트 읽기 오류 ({path}): {e}")
+        return manifest
+
+    def save(self):
+        """
+        임시 파일에 쓴 뒤 교체하여, 중간에 실패해도 이전 매니페스트가 남도록 저장합니다.
+        """
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump({'version': MANIFEST_VERSION, 'files': self.files, 'dirs': self.dirs},
+                      file, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def walk(self, top):
+        """
+        os.walk 와 같은 순서로 (폴더, 하위 폴더 리스트, 파일 이름 리스트)를 반환하되,
+        파일 이름 리스트에는 처리할 파일(새 파일, 변경된 압축 파일)만 포함합니다.
+        수정 시각이 그대로인 폴더는 다시 읽지 않고 저장된 목록을 사용합니다.
+        """
+        try:
+            dir_mtime = os.stat(top).st_mtime_ns
+        except OSError as e:
+            print(e)
+            return
+
+        cached = self.dirs.get(top)
+        if cached and cached[0] == dir_mtime:
+            subdirs, files = cached[1], cached[2]
+            # 폴더가 그대로이면 새 파일은 없고, 압축 파일만 내용이 바뀌었을 수 있음
+            candidates = [file for file in files
+                          if os.path.splitext(file)[1].lower() in ARCHIVE_EXTENSIONS]
+        else:
+            subdirs = []
+            files = []
+            try:
+                with os.scandir(top) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            subdirs.append(entry.name)
+                        else:
+                            files.append(entry.name)
+            except OSError as e:
+                print(e)
+                return
+            self.dirs[top] = [dir_mtime, subdirs, files]
+            candidates = files
+
+        pending_files = []
+        for file in candidates:
+            file_path = os.path.join(top, file)
+            if self.is_pending(file_path):
+                pending_files.append(file)
+        yield top, subdirs, pending_files
+
+        for subdir in subdirs:
+            subdir_path = os.path.join(top, subdir)
+            # os.walk 와 같이 심볼릭 링크 폴더는 따라가지 않음
+            if not os.path.islink(subdir_path):
+                yield from self.walk(subdir_path)
+
+    def is_pending(self, file_path):
+        """
+        처리해야 할 파일인지 확인합니다.
+        기록되지 않은 파일이거나, 크기나 수정 시각이 바뀐 압축 파일이면 True 입니다.
+        (일반 파일의 메타데이터는 경로로만 정해지므로 내용이 바뀌어도 다시 기록하지 않습니다.)
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return False
+
+        record = self.files.get(file_path)
+        if record is not None:
+            if os.path.splitext(file_path)[1].lower() not in ARCHIVE_EXTENSIONS:
+                return False
+            if record[0] == stat.st_size and record[1] == stat.st_mtime_ns:
+                return False
+
+        self.pending_stats[file_path] = (stat.st_size, stat.st_mtime_ns)
+        return True
+
+    def defer(self, file_path):
+        """
+        walk() 에서 찾았지만 처리하지 않은 파일을 다음 walk() 에서 다시 확인하도록 폴더 목록 캐시를 지웁니다.
+        (캐시된 폴더에서는 압축 파일만 다시 확인하므로, 지우지 않으면 일반 파일이 누락됨)
+        """
+        self.pending_stats.pop(file_path, None)
+        self.dirs.pop(os.path.dirname(file_path), None)
+
+    def defer_pending(self):
+        """
+        walk() 에서 찾았지만 record() 하지 않은 모든 파일을 defer() 합니다. (작업을 중간에 취소한 경우)
+        """
+        for file_path in list(self.pending_stats):
+            self.defer(file_path)
+
+    def recorded_members(self, file_path):
+        """
+        압축 파일에 대해 이전에 기록한 내부 파일 목록을 set 으로 반환합니다.
+        """
+        record = self.files.get(file_path)
+        if record is None or not record[2]:
+            return set()
+        return set(record[2])
+
+    def record(self, file_path, members=None):
+        """
+        파일(압축 파일이면 기록한 내부 파일 목록 포함)을 매니페스트에 추가합니다.
+        members 가 None 이면 이전에 기록한 내부 파일 목록을 그대로 둡니다.
+        """
+        stat = self.pending_stats.pop(file_path, None)
+        if stat is None:
+            try:
+                st = os.stat(file_path)
+                stat = (st.st_size, st.st_mtime_ns)
+            except OSError:
+                return
+        if members is None:
+            members = sorted(self.recorded_members(file_path)) or None
+        else:
+            members = sorted(self.recorded_members(file_path) | set(members))
+        self.files[file_path] = [stat[0], stat[1], members]
@@ -0,0 +1,248 @@
+import os
+import csv
+import json
+
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import PatternFill
+
+# Parquet 출력은 pyarrow 가 있을 때만 사용 (없으면 CSV)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+# 메타데이터 엑셀 헤더 (열 순서)
+HEADERS = ['위원회', '피감기관', 'BOOK_ID', 'SEQNO', 'FILE_NAME',
+           '국정감사 파일명', '위원', '질의', '압축파일 이름', 'REALFILE_NAME', '실제 경로', '문서 종류', '압축파일 확인필요']
+
+HEADER_FILL_COLOR = '4f81bd'
+
+# Parquet row group 하나에 모아서 기록할 행 수
+PARQUET_ROW_GROUP_SIZE = 50000
+
+
+def new_metadata_row():
+    """
+    모든 열이 None 인 메타데이터 행 딕셔너리를 반환합니다. (키: HEADERS)
+    """
+    return dict.fromkeys(HEADERS)
+
+
+class ExcelMetadataWriter:
+    """
+    메타데이터 엑셀 파일에 한 행씩 순서대로 기록합니다.
+    새 파일은 openpyxl write-only 모드로 기록하므로 행 수와 관계없이 메모리 사용량이 일정합니다.
+    기존 파일에 이어서 기록할 때는 다른 시트, 열 너비, 셀 서식, 표시 형식을 그대로 두기 위해
+    워크북 전체를 열어 활성 시트 끝에 추가합니다. (이 경우 메모리 사용량은 기존 행 수에 비례)
+
+    Attributes:
+        output_excel (str): 저장할 엑셀 파일 경로.
+        row_count (int): 헤더를 제외하고 이번 실행에서 기록한 행 수.
+    """
+
+    def __init__(self, output_excel, existing_excel=None):
+        """
+        Args:
+            output_excel (str): 저장할 엑셀 파일 경로.
+            existing_excel (str): 이어서 기록할 기존 엑셀 파일 경로. 활성 시트의 마지막 행 뒤에 기록합니다.
+        """
+        self.output_excel = output_excel
+        self.row_count = 0
+
+        if existing_excel:
+            self.wb = load_workbook(existing_excel)
+            self.ws = self.wb.active
+        else:
+            self.wb = Workbook(write_only=True)
+            self.ws = self.wb.create_sheet()
+            self.write_header()
+
+    def write_header(self):
+        # 첫 번째 행의 셀 색상 설정
+        fill_color = PatternFill(start_color=HEADER_FILL_COLOR,
+                                 end_color=HEADER_FILL_COLOR, fill_type='solid')
+        header_cells = []
+        for header in HEADERS:
+            cell = WriteOnlyCell(self.ws, value=header)
+            cell.fill = fill_color
+            header_cells.append(cell)
+        self.ws.append(header_cells)
+
+    def append(self, row):
+        """
+        메타데이터 행 하나를 기록합니다.
+
+        Args:
+            row (dict): HEADERS 를 키로 하는 행 딕셔너리 (new_metadata_row 참고).
+        """
+        self.ws.append([row.get(header) for header in HEADERS])
+        self.row_count += 1
+
+    def close(self):
+        self.wb.save(self.output_excel)
+
+
+def columnar_output_path(output_excel):
+    """
+    엑셀 파일 경로에 대응하는 열 기반 매니페스트 경로를 반환합니다. (pyarrow 가 있으면 .parquet, 없으면 .csv)
+    """
+    stem = output_excel[:-len('.xlsx')] if output_excel.endswith('.xlsx') else output_excel
+    return stem + ('.parquet' if pq is not None else '.csv')
+
+
+def open_columnar_writer(output_path):
+    """
+    확장자에 맞는 열 기반 매니페스트 writer 를 반환합니다. 파일이 이미 있으면 이어서 기록합니다.
+    """
+    if output_path.endswith('.parquet'):
+        return ParquetMetadataWriter(output_path)
+    return CsvMetadataWriter(output_path)
+
+
+class ParquetMetadataWriter:
+    """
+    메타데이터 행을 Parquet 파일에 row group 단위로 나누어 기록합니다. (모든 열은 문자열)
+    행을 PARQUET_ROW_GROUP_SIZE 개씩만 메모리에 모았다가 기록하므로 행 수와 관계없이 메모리 사용량이 일정합니다.
+
+    Attributes:
+        output_path (str): 저장할 Parquet 파일 경로.
+        row_count (int): 이번 실행에서 기록한 행 수.
+    """
+
+    def __init__(self, output_path, row_group_size=PARQUET_ROW_GROUP_SIZE):
+        if pq is None:
+            raise ImportError('Parquet 출력에는 pyarrow 가 필요합니다.')
+        self.output_path = output_path
+        self.row_count = 0
+        self.row_group_size = row_group_size
+        self.schema = pa.schema([(header, pa.string()) for header in HEADERS])
+        self.columns = {header: [] for header in HEADERS}
+        self.buffered = 0
+
+        # 임시 파일에 쓴 뒤 close() 에서 교체 (기존 파일을 읽으면서 같은 경로에 쓰지 않도록)
+        self.tmp_path = output_path + '.tmp'
+        self.writer = pq.ParquetWriter(self.tmp_path, self.schema)
+        if os.path.exists(output_path):
+            self.copy_existing_rows(output_path)
+
+    def copy_existing_rows(self, existing_path):
+        """
+        기존 Parquet 파일의 행을 row group 단위로 읽어 그대로 옮겨 적습니다.
+        """
+        existing_file = pq.ParquetFile(existing_path)
+        for index in range(existing_file.num_row_groups):
+            table = existing_file.read_row_group(index, columns=HEADERS)
+            self.writer.write_table(table.cast(self.schema))
+
+    def append(self, row):
+        """
+        메타데이터 행 하나를 기록합니다.
+
+        Args:
+            row (dict): HEADERS 를 키로 하는 행 딕셔너리 (new_metadata_row 참고).
+        """
+        for header in HEADERS:
+            value = row.get(header)
+            self.columns[header].append(None if value is None else str(value))
+        self.buffered += 1
+        self.row_count += 1
+        if self.buffered >= self.row_group_size:
+            self.flush()
+
+    def flush(self):
+        if not self.buffered:
+            return
+        self.writer.write_table(pa.table(self.columns, schema=self.schema))
+        self.columns = {header: [] for header in HEADERS}
+        self.buffered = 0
+
+    def close(self):
+        self.flush()
+        self.writer.close()
+        os.replace(self.tmp_path, self.output_path)
+
+
+class CsvMetadataWriter:
+    """
+    메타데이터 행을 CSV 파일에 한 행씩 기록합니다. (pyarrow 가 없을 때의 열 기반 매니페스트)
+    엑셀에서 한글이 깨지지 않도록 UTF-8 BOM 을 붙이며, 파일이 이미 있으면 헤더 없이 이어서 기록합니다.
+
+    Attributes:
+        output_path (str): 저장할 CSV 파일 경로.
+        row_count (int): 이번 실행에서 기록한 행 수.
+    """
+
+    def __init__(self, output_path):
+        self.output_path = output_path
+        self.row_count = 0
+        is_exist = os.path.exists(output_path)
+        self.file = open(output_path, 'a' if is_exist else 'w',
+                         encoding='utf-8-sig', newline='')
+        self.writer = csv.writer(self.file)
+        if not is_exist:
+            self.writer.writerow(HEADERS)
+
+    def append(self, row):
+        self.writer.writerow([row.get(header) for header in HEADERS])
+        self.row_count += 1
+
+    def close(self):
+        self.file.close()
+
+
+class JsonLinesMetadataWriter:
+    """
+    메타데이터 행을 JSON Lines 파일에 한 행씩 기록합니다. (감시 모드에서 엑셀/열 기반 매니페스트에 합치기 전까지 보관하는 조각 파일)
+    임시 파일에 쓴 뒤 close() 에서 교체하므로, 도중에 실패한 실행의 행은 조각 파일로 남지 않습니다.
+
+    Attributes:
+        output_path (str): 저장할 .jsonl 파일 경로.
+        row_count (int): 이번 실행에서 기록한 행 수.
+    """
+
+    def __init__(self, output_path):
+        self.output_path = output_path
+        self.row_count = 0
+        self.tmp_path = output_path + '.tmp'
+        self.file = open(self.tmp_path, 'w', encoding='utf-8')
+
+    def append(self, row):
+        self.file.write(json.dumps([row.get(header) for header in HEADERS], ensure_ascii=False) + '\n')
+        self.row_count += 1
+
+    def close(self):
+        self.file.close()
+        os.replace(self.tmp_path, self.output_path)
+
+
+def read_json_lines_rows(path):
+    """
+    JsonLinesMetadataWriter 가 기록한 파일의 행을 순서대로 반환하는 제너레이터.
+    """
+    with open(path, encoding='utf-8') as file:
+        for line in file:
+            yield dict(zip(HEADERS, json.loads(line)))
+
+
+class MetadataWriterGroup:
+    """
+    같은 메타데이터 행을 여러 writer (엑셀, Parquet/CSV 등)에 함께 기록합니다.
+    """
+
+    def __init__(self, writers):
+        self.writers = writers
+
+    @property
+    def row_count(self):
+        return self.writers[0].row_count if self.writers else 0
+
+    def append(self, row):
+        for writer in self.writers:
+            writer.append(row)
+
+    def close(self):
+        for writer in self.writers:
+            writer.close()
@@ -0,0 +1,140 @@
+import os
+import io
+import zipfile
+
+from read_egg_filelist import EggFile
+from read_zip_filelist import ZipFileList, zipinfo_member_names
+from read_alz_filelist import AlzFile
+from read_sevenzip_filelist import SevenZipFile
+
+# 압축 파일 안의 압축 파일을 몇 단계까지 열지 (1 이면 바깥 압축 파일 바로 안의 압축 파일까지)
+NESTED_MAX_DEPTH = 2
+# 메모리로 읽을 내부 압축 파일의 최대 크기 (압축 해제 기준)
+NESTED_MAX_SIZE = 256 * 1024 * 1024
+
+# 내부 파일 목록을 읽을 수 있는 압축 파일 확장자와 목록 리더
+LISTERS = {
+    '.zip': ZipFileList,
+    '.egg': EggFile,
+    '.alz': AlzFile,
+    '.7z': SevenZipFile,
+}
+
+
+def archive_extension(name):
+    extension = os.path.splitext(name)[1].lower()
+    if extension in LISTERS:
+        return extension
+    return None
+
+
+def list_member_names(source, extension):
+    """
+    압축 파일(경로 또는 bytes)의 내부 파일 목록을 '\\' 구분 경로로 반환합니다. 폴더는 제외합니다.
+    """
+    with LISTERS[extension](source) as archive:
+        return [name.replace('/', '\\') for name in archive.namelist()
+                if not name.endswith('/')]
+
+
+def zip_member_reader(source):
+    """
+    zip 의 내부 파일을 읽는 (이름 → (크기, 읽기 함수)) 딕셔너리와 닫기 함수를 반환합니다.
+    이름은 ZipFileList 와 같은 방식으로 해석합니다.
+    """
+    zip_file = zipfile.ZipFile(source if isinstance(source, str) else io.BytesIO(source))
+    infolist = zip_file.infolist()
+
+    members = {}
+    for name, info in zip(zipinfo_member_names(infolist), infolist):
+        members[name.replace('/', '\\')] = (
+            info.file_size, lambda info=info: zip_file.read(info))
+    return members, zip_file.close
+
+
+def egg_member_reader(source):
+    egg_file = EggFile(source)
+    members = {}
+    for info in egg_file.infolist():
+        members[info.filename.replace('/', '\\')] = (
+            info.file_size, lambda name=info.filename: egg_file.read(name))
+    return members, egg_file.close
+
+
+# 내부 파일을 압축 해제해 읽을 수 있는 압축 형식 (alz, 7z 리더는 목록 전용)
+MEMBER_READERS = {
+    '.zip': zip_member_reader,
+    '.egg': egg_member_reader,
+}
+
+
+class NestedArchiveLister:
+    """
+    압축 파일 안의 압축 파일을 임시 파일 없이 메모리에서 열어 내부 파일 목록을 펼칩니다.
+    내부 압축 파일의 파일은 '바깥 내부경로\\안쪽 압축파일 이름(확장자 제외)\\파일' 형태의 경로로 추가됩니다.
+
+    Attributes:
+        max_depth (int): 열어볼 최대 중첩 단계.
+        max_size (int): 메모리로 읽을 내부 압축 파일의 최대 크기 (bytes).
+    """
+
+    def __init__(self, max_depth=NESTED_MAX_DEPTH, max_size=NESTED_MAX_SIZE):
+        self.max_depth = max_depth
+        self.max_size = max_size
+
+    def expand(self, source, extension, names, depth=1):
+        """
+        압축 파일의 내부 파일 목록에 내부 압축 파일의 파일들을 더해 반환합니다.
+
+        Args:
+            source: 압축 파일 경로 또는 bytes.
+            extension (str): 압축 파일 확장자 ('.zip' 등).
+            names (list): source 의 내부 파일 목록 ('\\' 구분).
+            depth (int): source 안의 압축 파일이 몇 번째 단계인지.
+
+        Returns:
+            list: names 에 내부 압축 파일의 파일 경로를 더한 리스트.
+        """
+        if depth > self.max_depth or extension not in MEMBER_READERS:
+            return names
+        nested_names = [name for name in names if archive_extension(name)]
+        if not nested_names:
+            return names
+
+        try:
+            members, close = MEMBER_READERS[extension](source)
+        except Exception as e:
+            print(f"Error opening nested archives: {e}")
+            return names
+
+        expanded = list(names)
+        try:
+            for nested_name in nested_names:
+                expanded.extend(self.expand_member(
+                    members, nested_name, depth))
+        finally:
+            close()
+        return expanded
+
+    def expand_member(self, members, nested_name, depth):
+        member = members.get(nested_name)
+        if member is None:
+            return []
+        file_size, read = member
+        if file_size > self.max_size:
+            print(f"Nested archive is too large: {nested_name} ({file_size} bytes)")
+            return []
+
+        nested_extension = archive_extension(nested_name)
+        try:
+            data = read()
+            if data is None:
+                return []
+            inner_names = list_member_names(data, nested_extension)
+            inner_names = self.expand(data, nested_extension, inner_names, depth + 1)
+        except Exception as e:
+            print(f"Error reading nested archive {nested_name}: {e}")
+            return []
+
+        prefix = os.path.splitext(nested_name)[0]
+        return [prefix + '\\' + inner_name for inner_name in inner_names]
@@ -1,22 +1,38 @@
 import os
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
 import fitz
 
+from dir_walker import parallel_walk
+
+# 하나의 작업(배치)에 묶는 PDF 수 (프로세스 간 전달 비용을 줄이기 위함)
+BATCH_SIZE = 32
+# 워커 하나당 미리 넣어 두는 배치 수 (폴더 탐색과 변환을 겹치되 대기열이 무한정 커지지 않도록)
+PENDING_BATCHES_PER_WORKER = 2
+
+PBM_HEADER = '<HTML><HEAD>\n<META NAME="PBM Ver 1.0", CONTENT="Bookmark exported by muhayu">\n</HEAD>\n'
+PBM_FOOTER = '</HTML>'
+
 
 def extract_bookmarks(pdf_path):
-    doc = fitz.open(pdf_path)
-    toc = doc.get_toc(simple=False)
+    with fitz.open(pdf_path) as doc:
+        toc = doc.get_toc(simple=False)
     return toc
 
 
-def convert_to_html(bookmarks):
-    html_content = '<HTML><HEAD>\n<META NAME="PBM Ver 1.0", CONTENT="Bookmark exported by muhayu">\n</HEAD>\n'
-
+def iter_pbm_lines(bookmarks):
+    """
+    PBM 파일 내용을 한 줄씩 반환하는 제너레이터.
+    """
+    yield PBM_HEADER
     for item in bookmarks:
         level, title, page, _ = item
         blank = "    "*(level-1)
-        html_content += f'{blank}<Level ID="{level}", Page="{page}">{title}</Level>\n'
-    html_content += '</HTML>'
-    return html_content
+        yield f'{blank}<Level ID="{level}", Page="{page}">{title}</Level>\n'
+    yield PBM_FOOTER
+
+
+def convert_to_html(bookmarks):
+    return ''.join(iter_pbm_lines(bookmarks))
 
 
 def save_pbm(html_content, output_path):
@@ -24,24 +40,135 @@ def save_pbm(html_content, output_path):
         file.write(html_content)
 
 
-def process_files(src_dir, dst_dir):
+def write_pbm(bookmarks, output_path):
+    """
+    책갈피를 임시 파일에 한 줄씩 쓴 뒤 교체합니다. 중간에 실패해도 쓰다 만 .PBM 파일이 남지 않습니다.
+    """
+    tmp_path = output_path + '.tmp'
     try:
-        for root, _, files in os.walk(src_dir):
-            for file in files:
-                file_path = os.path.join(root, file)
-                relative_path = os.path.relpath(file_path, src_dir)
-                new_file_path = os.path.join(dst_dir, relative_path)
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            file.writelines(iter_pbm_lines(bookmarks))
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
 
-                os.makedirs(os.path.dirname(new_file_path), exist_ok=True)
+def pbm_path_for(pdf_path, src_dir, dst_dir):
+    relative_path = os.path.relpath(pdf_path, src_dir)
+    return os.path.join(dst_dir, relative_path).rsplit('.', 1)[0] + '.PBM'
 
-                if file.lower().endswith('.pdf'):
-                    pdf_file_path = new_file_path.rsplit('.', 1)[0] + '.PBM'
-                    save_pbm(convert_to_html(
-                        extract_bookmarks(file_path)), pdf_file_path)
-                else:
-                    continue
-    except:
-        log_missing_file(file, dst_dir)
+
+def is_up_to_date(pdf_path, pbm_path):
+    """
+    .PBM 파일이 원본 PDF 보다 나중에 만들어졌으면 True 입니다.
+    """
+    try:
+        return os.stat(pbm_path).st_mtime_ns >= os.stat(pdf_path).st_mtime_ns
+    except OSError:
+        return False
+
+
+def convert_batch(jobs):
+    """
+    워커 프로세스에서 실행됩니다. 한 파일의 실패가 같은 배치의 나머지 파일 변환을 멈추지 않습니다.
+
+    Args:
+        jobs (list): (PDF 경로, .PBM 경로) 튜플 리스트.
+
+    Returns:
+        list: (PDF 경로, 오류 메시지 또는 None) 튜플 리스트.
+    """
+    results = []
+    for pdf_path, pbm_path in jobs:
+        try:
+            write_pbm(extract_bookmarks(pdf_path), pbm_path)
+            results.append((pdf_path, None))
+        except Exception as e:
+            results.append((pdf_path, f'{type(e).__name__}: {e}'))
+    return results
+
+
+def iter_batches(src_dir, dst_dir, force=False, skipped=None):
+    """
+    src_dir 를 탐색하면서 변환할 (PDF 경로, .PBM 경로) 배치를 반환하는 제너레이터.
+    대상 폴더는 원본 폴더 구조대로 미리 만들고, force 가 아니면 .PBM 이 원본보다 새로운 PDF 는 건너뜁니다.
+    같은 .PBM 으로 변환되는 PDF (x.pdf 와 x.PDF 등) 는 같은 배치에 넣어 한 워커에서 차례로 변환합니다.
+
+    Args:
+        skipped (list): 건너뛴 PDF 경로를 추가할 리스트.
+    """
+    batch = []
+    for root, _, files in parallel_walk(src_dir):
+        if not files:
+            continue
+        os.makedirs(os.path.join(dst_dir, os.path.relpath(root, src_dir)), exist_ok=True)
+        # {.PBM 경로 (대소문자 무시): [(PDF 경로, .PBM 경로), ...]}
+        groups = {}
+        for file in files:
+            if not file.lower().endswith('.pdf'):
+                continue
+            pdf_path = os.path.join(root, file)
+            pbm_path = pbm_path_for(pdf_path, src_dir, dst_dir)
+            if not force and is_up_to_date(pdf_path, pbm_path):
+                if skipped is not None:
+                    skipped.append(pdf_path)
+                continue
+            groups.setdefault(pbm_path.lower(), []).append((pdf_path, pbm_path))
+        for jobs in groups.values():
+            batch.extend(jobs)
+            if len(batch) >= BATCH_SIZE:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+def process_files(src_dir, dst_dir, max_workers=None, force=False):
+    """
+    src_dir 의 PDF 책갈피를 프로세스 풀에서 병렬로 .PBM 파일로 변환합니다.
+    폴더 탐색 중에 배치를 바로 넣고, 대기 중인 배치 수를 워커 수에 맞춰 제한합니다.
+    변환에 실패한 파일은 dst_dir/log.txt 에 기록합니다.
+
+    Returns:
+        dict: {'converted': 변환한 파일 수, 'skipped': 건너뛴 파일 수, 'failed': 실패한 파일 수}
+    """
+    stats = {'converted': 0, 'skipped': 0, 'failed': 0}
+    skipped = []
+
+    def collect(future):
+        try:
+            results = future.result()
+        except Exception as e:
+            # 워커 프로세스가 비정상 종료된 경우 등: 배치 전체를 실패로 기록
+            results = [(pdf_path, f'{type(e).__name__}: {e}') for pdf_path, _ in futures[future]]
+        for pdf_path, error in results:
+            if error is None:
+                stats['converted'] += 1
+            else:
+                stats['failed'] += 1
+                print(f"[PBM 변환 실패] {pdf_path} ({error})")
+                log_missing_file(os.path.relpath(pdf_path, src_dir), dst_dir)
+
+    # Windows 의 ProcessPoolExecutor 는 워커를 61개까지만 만들 수 있음
+    max_workers = max_workers or min(os.cpu_count() or 1, 61)
+    max_pending = max_workers * PENDING_BATCHES_PER_WORKER
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for batch in iter_batches(src_dir, dst_dir, force, skipped):
+            if len(futures) >= max_pending:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    collect(future)
+                    del futures[future]
+            futures[executor.submit(convert_batch, batch)] = batch
+
+        for future in list(futures):
+            collect(future)
+
+    stats['skipped'] = len(skipped)
+    return stats
 
 
 def log_missing_file(file_name, output_path):
@@ -59,7 +186,8 @@ def main():
         return
     if not os.path.exists(output_path):
         os.makedirs(output_path)
-    process_files(pdf_path, output_path)
+    stats = process_files(pdf_path, output_path)
+    print(f"변환 {stats['converted']}개, 건너뜀 {stats['skipped']}개, 실패 {stats['failed']}개")
     print("모든 작업이 정상적으로 완료되었습니다.")
 
 
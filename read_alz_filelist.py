@@ -0,0 +1,214 @@
+import os
+import mmap
+import struct
+
+# ALZ 압축 파일 관련 상수
+SIZE_ALZ_HEADER = 8
+SIZE_ENCRYPT_CHECK = 12
+
+COMPRESS_METHOD_STORE = 0
+COMPRESS_METHOD_BZIP2 = 1
+COMPRESS_METHOD_DEFLATE = 2
+
+# ALZ 헤더 Signature
+MAGIC_ALZ_HEADER = 0x015A4C41                 # 'ALZ\x01'
+MAGIC_LOCAL_FILE_HEADER = 0x015A4C42          # 'BLZ\x01'
+MAGIC_CENTRAL_DIRECTORY = 0x015A4C43          # 'CLZ\x01'
+MAGIC_END_OF_CENTRAL_DIRECTORY = 0x025A4C43   # 'CLZ\x02'
+
+# Local File Header 의 file attribute / file descriptor
+FILE_ATTRIBUTE_DIRECTORY = 0x10
+FILE_DESCRIPTOR_ENCRYPTED = 0x01
+
+SIZE_CENTRAL_DIRECTORY = 4 + 12
+
+# 미리 컴파일한 헤더 구조체 (mmap 에서 복사 없이 unpack_from 으로 읽음)
+STRUCT_MAGIC = struct.Struct('<I')
+# magic, 파일명 길이, attribute, 날짜/시간, descriptor, unknown
+STRUCT_LOCAL_FILE_HEADER = struct.Struct('<IHBIBB')
+# 압축 방식, unknown, crc (이어서 descriptor 상위 4비트 크기의 압축/원본 크기)
+STRUCT_LOCAL_FILE_SIZES = struct.Struct('<BBI')
+
+# descriptor 상위 4비트가 나타내는 크기 필드의 바이트 수
+SIZE_FIELD_FORMATS = {1: 'B', 2: 'H', 4: 'I', 8: 'Q'}
+
+
+class AlzInfo:
+    """
+    ALZ 압축 파일 내부 항목 하나의 정보.
+    zipfile.ZipInfo 와 같은 속성 이름을 사용합니다.
+
+    Attributes:
+        filename (str): 압축 파일 내부 경로 ('/' 구분, 폴더는 '/' 로 끝남).
+        compress_type (int): 압축 방식 (COMPRESS_METHOD_*).
+        compress_size (int): 압축된 크기.
+        file_size (int): 압축 해제 크기.
+        CRC (int): CRC32 값.
+        data_pos (int): 압축 데이터 오프셋.
+        encrypted (bool): 암호화 여부.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.compress_type = COMPRESS_METHOD_STORE
+        self.compress_size = 0
+        self.file_size = 0
+        self.CRC = 0
+        self.data_pos = 0
+        self.encrypted = False
+
+    def is_dir(self):
+        return self.filename.endswith('/')
+
+
+class AlzFile:
+    """
+    ALZ 압축 파일의 Local File Header 를 mmap 으로 순회하여 항목 목록을 만드는 목록 전용 리더.
+    압축 데이터는 읽지 않고 건너뜁니다.
+    """
+
+    def __init__(self, filename):
+        self.fp = None
+        self.mm = None
+        self.data_size = 0
+        self.filelist = []
+        self.name_to_info = {}
+
+        try:
+            if isinstance(filename, (bytes, bytearray, memoryview)):
+                # 메모리에 있는 ALZ (압축 파일 안의 압축 파일 등)
+                self.mm = bytes(filename)
+                self.data_size = len(self.mm)
+            else:
+                self.data_size = os.path.getsize(filename)
+                self.fp = open(filename, 'rb')
+                self.mm = mmap.mmap(self.fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except (IOError, ValueError):
+            print(f"Error opening file {filename}")
+            self.close()
+            raise
+
+        # Signature 별 헤더 처리 함수 (현재 위치를 받아 다음 헤더 위치를 반환, 끝이면 None)
+        self.header_procs = {
+            MAGIC_ALZ_HEADER: self.__ALZ_Header__,
+            MAGIC_LOCAL_FILE_HEADER: self.__ALZ_Local_File_Header__,
+            MAGIC_CENTRAL_DIRECTORY: self.__ALZ_Central_Directory__,
+            MAGIC_END_OF_CENTRAL_DIRECTORY: self.__ALZ_End_Of_Central_Directory__,
+        }
+
+        # 헤더를 한 번만 순회하여 항목 인덱스 생성
+        try:
+            self.__BuildIndex__()
+        except SystemError:
+            self.close()
+            raise
+
+    def close(self):
+        if isinstance(self.mm, mmap.mmap):
+            self.mm.close()
+        self.mm = None
+        if self.fp:
+            self.fp.close()
+            self.fp = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def namelist(self):
+        return [info.filename for info in self.filelist]
+
+    def infolist(self):
+        return list(self.filelist)
+
+    def getinfo(self, filename):
+        info = self.name_to_info.get(filename)
+        if info is None:
+            raise KeyError(f"There is no item named {filename!r} in the archive")
+        return info
+
+    def __BuildIndex__(self):
+        mm = self.mm
+        data_size = self.data_size
+        header_procs = self.header_procs
+        alz_pos = 0
+
+        try:
+            if data_size < SIZE_ALZ_HEADER or STRUCT_MAGIC.unpack_from(mm, 0)[0] != MAGIC_ALZ_HEADER:
+                raise SystemError
+            while alz_pos is not None and alz_pos + 4 <= data_size:
+                magic = STRUCT_MAGIC.unpack_from(mm, alz_pos)[0]
+                proc = header_procs.get(magic)
+                if proc is None:
+                    # 분할 압축 볼륨 등 지원하지 않는 헤더
+                    raise SystemError
+                alz_pos = proc(alz_pos)
+        except (SystemError, struct.error):
+            print("Error building archive index")
+            raise SystemError(f"Invalid ALZ header at offset {alz_pos}")
+
+    def __ALZ_Header__(self, alz_pos):
+        # signature(4) + version/id(4)
+        return alz_pos + SIZE_ALZ_HEADER
+
+    def __ALZ_Local_File_Header__(self, alz_pos):
+        _, fname_size, attribute, _, descriptor, _ = \
+            STRUCT_LOCAL_FILE_HEADER.unpack_from(self.mm, alz_pos)
+        pos = alz_pos + STRUCT_LOCAL_FILE_HEADER.size
+
+        method = COMPRESS_METHOD_STORE
+        crc = 0
+        compress_size = 0
+        uncompress_size = 0
+        size_field_len = descriptor >> 4
+        if size_field_len:
+            size_format = SIZE_FIELD_FORMATS.get(size_field_len)
+            if size_format is None:
+                print("Error reading ALZ size field")
+                raise SystemError
+            method, _, crc = STRUCT_LOCAL_FILE_SIZES.unpack_from(self.mm, pos)
+            pos += STRUCT_LOCAL_FILE_SIZES.size
+            compress_size, uncompress_size = struct.unpack_from(
+                '<' + size_format * 2, self.mm, pos)
+            pos += size_field_len * 2
+
+        # 파일명은 cp949, 경로 구분자는 '\'
+        fname = self.mm[pos:pos+fname_size].decode('cp949', 'replace')
+        pos += fname_size
+        fname = fname.replace('\\', '/')
+        if attribute & FILE_ATTRIBUTE_DIRECTORY and not fname.endswith('/'):
+            fname += '/'
+
+        info = AlzInfo(fname)
+        info.compress_type = method
+        info.compress_size = compress_size
+        info.file_size = uncompress_size
+        info.CRC = crc
+        if descriptor & FILE_DESCRIPTOR_ENCRYPTED:
+            info.encrypted = True
+            pos += SIZE_ENCRYPT_CHECK
+        info.data_pos = pos
+        if pos + compress_size > self.data_size:
+            print("Error reading ALZ file data")
+            raise SystemError
+
+        self.filelist.append(info)
+        self.name_to_info[fname] = info
+        return pos + compress_size
+
+    def __ALZ_Central_Directory__(self, alz_pos):
+        return alz_pos + SIZE_CENTRAL_DIRECTORY
+
+    def __ALZ_End_Of_Central_Directory__(self, alz_pos):
+        # 이후의 주석 등은 읽지 않음
+        return None
+
+
+if __name__ == '__main__':
+    # 사용 예시
+    alz_file_path = '/Users/nannada4/Downloads/test.alz'  # ALZ 파일 경로를 여기에 설정하세요
+    with AlzFile(alz_file_path) as alz_file:
+        for info in alz_file.infolist():
+            print(info.filename, info.file_size)
@@ -1,4 +1,6 @@
+import io
 import os
+import sys
 import mmap
 import zlib
 import bz2
@@ -11,250 +13,376 @@ COMPRESS_METHOD_STORE = 0
 COMPRESS_METHOD_DEFLATE = 1
 COMPRESS_METHOD_BZIP2 = 2
 
+# EGG 헤더 Magic ID
+MAGIC_EGG_HEADER = 0x41474745
+MAGIC_FILE_HEADER = 0x0A8590E3
+MAGIC_BLOCK_HEADER = 0x02B50C13
+MAGIC_ENCRYPT_HEADER = 0x08D1470F
+MAGIC_WINDOWS_FILE_INFO = 0x2C86950B
+MAGIC_POSIX_FILE_INFO = 0x1EE922E5
+MAGIC_DUMMY_HEADER = 0x07463307
+MAGIC_FILENAME_HEADER = 0x0A8591AC
+MAGIC_COMMENT_HEADER = 0x04C63672
+MAGIC_SPLIT_HEADER = 0x24F5A262
+MAGIC_SOLID_HEADER = 0x24E5A060
+MAGIC_END_OF_HEADER = 0x08E28222
+
+# Filename Header bit flag
+FILENAME_FLAG_AREA_CODE = 0x08
+FILENAME_FLAG_RELATIVE_PATH = 0x10
+
+# 미리 컴파일한 헤더 구조체 (mmap 에서 복사 없이 unpack_from 으로 읽음)
+STRUCT_MAGIC = struct.Struct('<I')
+STRUCT_EGG_HEADER = struct.Struct('<IHII')     # magic, version, header id, reserved
+STRUCT_BLOCK_HEADER = struct.Struct('<IBBIII')  # magic, method, hint, 원본 크기, 압축 크기, crc
+STRUCT_EXTRA_HEADER = struct.Struct('<IBH')     # magic, bit flag, size
+
+SIZE_BLOCK_HEADER = STRUCT_BLOCK_HEADER.size + 4  # End of Header 포함
+
+# 스트리밍 압축 해제 시 한 번에 처리하는 크기 (입력/출력 모두 이 크기로 제한)
+CHUNK_SIZE = 64 * 1024
+
+
+class BadEggFile(Exception):
+    """EGG 압축 파일 내용이 손상된 경우 (CRC 불일치 등) 발생합니다."""
+
+
+class EggInfo:
+    """
+    EGG 압축 파일 내부 항목 하나의 정보.
+    zipfile.ZipInfo 와 같은 속성 이름을 사용합니다.
+
+    Attributes:
+        filename (str): 압축 파일 내부 경로.
+        compress_type (int): 압축 방식 (COMPRESS_METHOD_*).
+        compress_size (int): 압축된 크기 (모든 블록의 합).
+        file_size (int): 압축 해제 크기 (모든 블록의 합).
+        CRC (int): 첫 번째 블록의 CRC32 값.
+        encrypted (bool): Encrypt 헤더가 있는 (암호가 설정된) 항목 여부.
+        blocks (list): (데이터 오프셋, 압축 방식, 압축 크기, 원본 크기, CRC) 튜플 리스트.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.compress_type = COMPRESS_METHOD_STORE
+        self.compress_size = 0
+        self.file_size = 0
+        self.CRC = 0
+        self.encrypted = False
+        self.blocks = []
+
+    def add_block(self, data_pos, method, compress_size, uncompress_size, crc):
+        if not self.blocks:
+            self.compress_type = method
+            self.CRC = crc
+        self.blocks.append(
+            (data_pos, method, compress_size, uncompress_size, crc))
+        self.compress_size += compress_size
+        self.file_size += uncompress_size
+
+    def is_dir(self):
+        return self.filename.endswith('/')
+
+
+def iter_block_data(view, info):
+    """
+    항목의 블록들을 CHUNK_SIZE 단위로 압축 해제하여 순서대로 반환하는 제너레이터.
+    블록이 끝날 때마다 CRC32 를 확인합니다.
+
+    Args:
+        view (memoryview): EGG 파일 전체에 대한 memoryview.
+        info (EggInfo): 압축 해제할 항목 정보.
+    """
+    for data_pos, method, compress_size, _, crc in info.blocks:
+        end = data_pos + compress_size
+        running_crc = 0
+
+        if method == COMPRESS_METHOD_STORE:
+            for pos in range(data_pos, end, CHUNK_SIZE):
+                data = view[pos:min(pos + CHUNK_SIZE, end)].tobytes()
+                running_crc = zlib.crc32(data, running_crc)
+                yield data
+        elif method == COMPRESS_METHOD_DEFLATE:
+            decompressor = zlib.decompressobj(-15)
+            for pos in range(data_pos, end, CHUNK_SIZE):
+                data = decompressor.decompress(
+                    view[pos:min(pos + CHUNK_SIZE, end)], CHUNK_SIZE)
+                while True:
+                    running_crc = zlib.crc32(data, running_crc)
+                    yield data
+                    if not decompressor.unconsumed_tail:
+                        break
+                    data = decompressor.decompress(
+                        decompressor.unconsumed_tail, CHUNK_SIZE)
+            data = decompressor.flush()
+            running_crc = zlib.crc32(data, running_crc)
+            yield data
+        elif method == COMPRESS_METHOD_BZIP2:
+            decompressor = bz2.BZ2Decompressor()
+            for pos in range(data_pos, end, CHUNK_SIZE):
+                data = decompressor.decompress(
+                    view[pos:min(pos + CHUNK_SIZE, end)], CHUNK_SIZE)
+                while True:
+                    running_crc = zlib.crc32(data, running_crc)
+                    yield data
+                    if decompressor.eof or decompressor.needs_input:
+                        break
+                    data = decompressor.decompress(b'', CHUNK_SIZE)
+        else:
+            raise NotImplementedError(
+                f"Unsupported compression method {method} ({info.filename})")
+
+        if running_crc != crc:
+            raise BadEggFile(f"Bad CRC-32 for file {info.filename!r}")
+
+
+class EggExtFile(io.BufferedIOBase):
+    """
+    EggFile.open() 이 반환하는 읽기 전용 파일 객체.
+    전체 항목을 메모리에 올리지 않고 CHUNK_SIZE 단위로 압축 해제합니다.
+    """
+
+    def __init__(self, view, info):
+        super().__init__()
+        self.name = info.filename
+        self._chunks = iter_block_data(view, info)
+        self._readbuffer = b''
+        self._offset = 0
+        self._eof = False
+
+    def readable(self):
+        return True
+
+    def read(self, n=-1):
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        if n is None or n < 0:
+            buf = [self._readbuffer[self._offset:]]
+            buf.extend(self._chunks)
+            self._readbuffer = b''
+            self._offset = 0
+            self._eof = True
+            return b''.join(buf)
+
+        buf = []
+        while n > 0:
+            data = self.read1(n)
+            if not data:
+                break
+            buf.append(data)
+            n -= len(data)
+        return b''.join(buf)
+
+    def read1(self, n=-1):
+        if n is None or n < 0:
+            n = CHUNK_SIZE
+        while self._offset >= len(self._readbuffer):
+            if self._eof:
+                return b''
+            data = next(self._chunks, None)
+            if data is None:
+                self._eof = True
+                return b''
+            self._readbuffer = data
+            self._offset = 0
+        data = self._readbuffer[self._offset:self._offset + n]
+        self._offset += len(data)
+        return data
+
+    def close(self):
+        self._chunks = iter(())
+        self._readbuffer = b''
+        super().close()
+
 
 class EggFile:
     def __init__(self, filename):
         self.fp = None
         self.mm = None
+        self.view = None
         self.data_size = 0
-        self.egg_pos = None
+        self.filelist = []
+        self.name_to_info = {}
 
         try:
-            self.data_size = os.path.getsize(filename)
-            self.fp = open(filename, 'rb')
-            self.mm = mmap.mmap(self.fp.fileno(), 0, access=mmap.ACCESS_READ)
-        except IOError:
+            if isinstance(filename, (bytes, bytearray, memoryview)):
+                # 메모리에 있는 EGG (압축 파일 안의 압축 파일 등)
+                self.mm = bytes(filename)
+                self.data_size = len(self.mm)
+            else:
+                self.data_size = os.path.getsize(filename)
+                self.fp = open(filename, 'rb')
+                self.mm = mmap.mmap(self.fp.fileno(), 0, access=mmap.ACCESS_READ)
+            self.view = memoryview(self.mm)
+        except (IOError, ValueError):
             print(f"Error opening file {filename}")
+            self.close()
+            raise
+
+        # Magic ID 별 헤더 처리 함수 (현재 위치를 받아 다음 헤더 위치를 반환)
+        self.header_procs = {
+            MAGIC_EGG_HEADER: self.__EGG_Header__,
+            MAGIC_FILE_HEADER: self.__EGG_File_Header__,
+            MAGIC_BLOCK_HEADER: self.__EGG_Block_Header__,
+            MAGIC_ENCRYPT_HEADER: self.__EGG_Encrypt_Header__,
+            MAGIC_WINDOWS_FILE_INFO: self.__EGG_Windows_File_Info__,
+            MAGIC_POSIX_FILE_INFO: self.__EGG_Posix_File_Info__,
+            MAGIC_DUMMY_HEADER: self.__EGG_Dummy_Header__,
+            MAGIC_FILENAME_HEADER: self.__EGG_Filename_Header__,
+            MAGIC_SPLIT_HEADER: self.__EGG_Split_Header__,
+            MAGIC_SOLID_HEADER: self.__EGG_Solid_Header__,
+            MAGIC_END_OF_HEADER: self.__EGG_End_Of_Header__,
+        }
+        self.current_info = None
+
+        # 헤더를 한 번만 순회하여 항목 인덱스 생성 (실패하면 파일을 닫아 잠금이 남지 않도록 함)
+        try:
+            self.__BuildIndex__()
+        except BaseException:
+            self.close()
             raise
 
     def close(self):
-        if self.mm:
+        if self.view:
+            self.view.release()
+        if isinstance(self.mm, mmap.mmap):
             self.mm.close()
         if self.fp:
             self.fp.close()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def read(self, filename):
         ret_data = None
 
+        if filename not in self.name_to_info:
+            return ret_data
+
         try:
-            fname = self.__FindFirstFileName__()
-            while fname:
-                if fname == filename:
-                    data, method, self.egg_pos = self.__ReadBlockData__()
-                    if method == COMPRESS_METHOD_STORE:
-                        ret_data = data
-                        break
-                    elif method == COMPRESS_METHOD_DEFLATE:
-                        ret_data = zlib.decompress(data, -15)
-                        break
-                    elif method == COMPRESS_METHOD_BZIP2:
-                        ret_data = bz2.decompress(data)
-                        break
-                    else:
-                        pass
-                fname = self.__FindNextFileName__()
+            with self.open(filename) as ext_file:
+                ret_data = ext_file.read()
+        except NotImplementedError:
+            return None
         except:
             print("Error reading file from archive")
             raise
 
         return ret_data
 
-    def namelist(self):
-        name_list = []
-
-        try:
-            fname = self.__FindFirstFileName__()
-            while fname:
-                name_list.append(fname)
-                fname = self.__FindNextFileName__()
-        except:
-            print("Error listing files from archive")
-            raise
-
-        return name_list
-
-    def __FindFirstFileName__(self):
-        self.egg_pos = 0
-        fname, self.egg_pos = self.__GetFileName__(self.egg_pos)
-        return fname
-
-    def __FindNextFileName__(self):
-        fname, self.egg_pos = self.__GetFileName__(self.egg_pos)
-        return fname
-
-    def __GetFileName__(self, egg_pos):
-        mm = self.mm
-        data_size = self.data_size
-
-        try:
-            while egg_pos < data_size:
-                magic = struct.unpack('<I', mm[egg_pos:egg_pos+4])[0]
-                if magic == 0x0A8591AC:  # Filename Header
-                    size, fname = self.__EGG_Filename_Header__(mm[egg_pos:])
-                    if size == -1:
-                        raise SystemError
-                    egg_pos += size
-                    return fname, egg_pos
-                else:
-                    egg_pos = self.__DefaultMagicIDProc__(magic, egg_pos)
-                    if egg_pos == -1:
-                        raise SystemError
-        except SystemError:
-            print("Error finding filename header")
-            raise
+    def open(self, filename):
+        """
+        항목을 스트리밍으로 읽는 파일 객체를 반환합니다.
+        여러 Block 헤더로 나뉜 항목도 순서대로 이어서 읽으며, 블록마다 CRC 를 검사합니다.
+        """
+        return EggExtFile(self.view, self.getinfo(filename))
 
-        return None, -1
-
-    def __ReadBlockData__(self):
-        egg_pos = self.egg_pos
-        mm = self.mm
-        data_size = self.data_size
+    def namelist(self):
+        return [info.filename for info in self.filelist]
 
-        try:
-            while egg_pos < data_size:
-                magic = struct.unpack('<I', mm[egg_pos:egg_pos+4])[0]
-                if magic == 0x02B50C13:  # Block Header
-                    size = self.__EGG_Block_Header_Size__(mm[egg_pos:])
-                    if size == -1:
-                        raise SystemError
-
-                    compress_method_m = mm[egg_pos+4]
-                    compress_size = struct.unpack(
-                        '<I', mm[egg_pos+10:egg_pos+14])[0]
-                    compressed_data = mm[egg_pos+18:egg_pos+18+compress_size]
-                    egg_pos += size
-                    return compressed_data, compress_method_m, egg_pos
-                else:
-                    egg_pos = self.__DefaultMagicIDProc__(magic, egg_pos)
-                    if egg_pos == -1:
-                        raise SystemError
-        except SystemError:
-            print("Error reading block data")
-            raise
+    def infolist(self):
+        return list(self.filelist)
 
-        return None, -1, -1
+    def getinfo(self, filename):
+        info = self.name_to_info.get(filename)
+        if info is None:
+            raise KeyError(f"There is no item named {filename!r} in the archive")
+        return info
 
-    def __DefaultMagicIDProc__(self, magic, egg_pos):
+    def __BuildIndex__(self):
         mm = self.mm
         data_size = self.data_size
+        header_procs = self.header_procs
+        egg_pos = 0
 
         try:
-            if egg_pos < data_size:
-                if magic == 0x41474745:  # EGG Header
-                    if self.__EGG_Header__(mm) == -1:
-                        raise SystemError
-                    egg_pos += SIZE_EGG_HEADER
-                elif magic == 0x0A8590E3:  # File Header
-                    egg_pos += 16
-                elif magic == 0x02B50C13:  # Block Header
-                    size = self.__EGG_Block_Header_Size__(mm[egg_pos:])
-                    if size == -1:
-                        raise SystemError
-                    egg_pos += size
-                elif magic == 0x08D1470F:  # Encrypt Header
-                    size = self.__EGG_Encrypt_Header_Size__(mm[egg_pos:])
-                    if size == -1:
-                        raise SystemError
-                    egg_pos += size
-                elif magic == 0x2C86950B:  # Windows File Information
-                    egg_pos += 16
-                elif magic == 0x1EE922E5:  # Posix File Information
-                    egg_pos += 27
-                elif magic == 0x07463307:  # Dummy Header
-                    size = self.__EGG_Dummy_Header_Size__(mm[egg_pos:])
-                    if size == -1:
-                        raise SystemError
-                    egg_pos += size
-                elif magic == 0x0A8591AC:  # Filename Header
-                    size, fname = self.__EGG_Filename_Header__(mm[egg_pos:])
-                    if size == -1:
-                        raise SystemError
-                    egg_pos += size
-                elif magic == 0x04C63672:  # Comment Header
-                    raise SystemError  # Not supported
-                elif magic == 0x24F5A262:  # Split Compression
-                    egg_pos += 15
-                elif magic == 0x24E5A060:  # Solid Compression
-                    egg_pos += 7
-                elif magic == 0x08E28222:  # End of File Header
-                    egg_pos += 4
-                else:
+            while egg_pos + 4 <= data_size:
+                magic = STRUCT_MAGIC.unpack_from(mm, egg_pos)[0]
+                proc = header_procs.get(magic)
+                if proc is None:
+                    # Comment Header 등 지원하지 않는 헤더
                     raise SystemError
-        except SystemError:
-            print("Error processing magic ID")
-            return -1
-
-        return egg_pos
-
-    def __EGG_Header__(self, data):
-        try:
-            magic = struct.unpack('<I', data[0:4])[0]
-            if magic != 0x41474745:
-                raise SystemError
-
-            version = struct.unpack('<H', data[4:6])[0]
-            if version != 0x0100:
-                raise SystemError
-
-            header_id = struct.unpack('<I', data[6:10])[0]
-            if header_id == 0:
-                raise SystemError
-
-            reserved = struct.unpack('<I', data[10:14])[0]
-            if reserved != 0:
-                raise SystemError
-
-            return 0
-        except SystemError:
+                egg_pos = proc(egg_pos)
+        except (SystemError, struct.error):
+            print("Error building archive index")
+            raise SystemError(f"Invalid EGG header at offset {egg_pos}")
+        finally:
+            self.current_info = None
+
+    def __EGG_Header__(self, egg_pos):
+        _, version, header_id, reserved = STRUCT_EGG_HEADER.unpack_from(
+            self.mm, egg_pos)
+        if version != 0x0100 or header_id == 0 or reserved != 0:
             print("Error reading EGG header")
-            return -1
-
-    def __EGG_Encrypt_Header_Size__(self, data):
-        try:
-            encrypt_method = data[7]
-            if encrypt_method == 0:
-                return 24
-            elif encrypt_method == 1:
-                return 28
-            elif encrypt_method == 2:
-                return 36
-            else:
-                raise SystemError
-        except SystemError:
-            print("Error calculating encrypt header size")
-            return -1
-
-    def __EGG_Dummy_Header_Size__(self, data):
-        try:
-            dummy_size = struct.unpack('<H', data[5:7])[0]
-            return 7 + dummy_size
-        except:
-            print("Error calculating dummy header size")
-            return -1
-
-    def __EGG_Filename_Header__(self, data):
-        size = -1
-        fname = None
-
-        try:
-            fname_size = struct.unpack('<H', data[5:7])[0]
-            fname = data[7:7+fname_size]
-            size = 7 + fname_size
-        except:
-            print("Error reading filename header")
-            pass
-
-        return size, fname.decode('utf-8')
-
-    def __EGG_Block_Header_Size__(self, data):
-        try:
-            block_size = 18 + 4
-            compress_size = struct.unpack('<I', data[10:14])[0]
-            size = block_size + compress_size
-            return size
-        except:
-            print("Error calculating block header size")
-            return -1
+            raise SystemError
+        return egg_pos + SIZE_EGG_HEADER
+
+    def __EGG_File_Header__(self, egg_pos):
+        # magic(4) + file id(4) + file length(8)
+        return egg_pos + 16
+
+    def __EGG_Block_Header__(self, egg_pos):
+        _, method, _, uncompress_size, compress_size, crc = \
+            STRUCT_BLOCK_HEADER.unpack_from(self.mm, egg_pos)
+        if self.current_info is not None:
+            # 블록 헤더 + End of Header 다음부터 압축 데이터
+            self.current_info.add_block(egg_pos + SIZE_BLOCK_HEADER, method,
+                                        compress_size, uncompress_size, crc)
+        return egg_pos + SIZE_BLOCK_HEADER + compress_size
+
+    def __EGG_Encrypt_Header__(self, egg_pos):
+        if self.current_info is not None:
+            self.current_info.encrypted = True
+        encrypt_method = self.mm[egg_pos+7]
+        if encrypt_method == 0:
+            return egg_pos + 24
+        elif encrypt_method == 1:
+            return egg_pos + 28
+        elif encrypt_method == 2:
+            return egg_pos + 36
+        print("Error calculating encrypt header size")
+        raise SystemError
+
+    def __EGG_Windows_File_Info__(self, egg_pos):
+        return egg_pos + 16
+
+    def __EGG_Posix_File_Info__(self, egg_pos):
+        return egg_pos + 27
+
+    def __EGG_Dummy_Header__(self, egg_pos):
+        _, _, dummy_size = STRUCT_EXTRA_HEADER.unpack_from(self.mm, egg_pos)
+        return egg_pos + STRUCT_EXTRA_HEADER.size + dummy_size
+
+    def __EGG_Filename_Header__(self, egg_pos):
+        _, bit_flag, fname_size = STRUCT_EXTRA_HEADER.unpack_from(
+            self.mm, egg_pos)
+        name_pos = egg_pos + STRUCT_EXTRA_HEADER.size
+        encoding = 'utf-8'
+        if bit_flag & FILENAME_FLAG_AREA_CODE:
+            # 지역 코드(2바이트)가 있으면 UTF-8 이 아닌 로컬 코드페이지
+            name_pos += 2
+            encoding = 'cp949'
+        if bit_flag & FILENAME_FLAG_RELATIVE_PATH:
+            name_pos += 4  # 상위 경로 ID
+        fname = self.mm[name_pos:name_pos+fname_size].decode(encoding, 'replace')
+
+        info = EggInfo(fname)
+        self.filelist.append(info)
+        self.name_to_info[fname] = info
+        self.current_info = info
+        return name_pos + fname_size
+
+    def __EGG_Split_Header__(self, egg_pos):
+        return egg_pos + 15
+
+    def __EGG_Solid_Header__(self, egg_pos):
+        return egg_pos + 7
+
+    def __EGG_End_Of_Header__(self, egg_pos):
+        return egg_pos + 4
 
 
 def get_all_files(egg_file, base_path):
@@ -277,17 +405,19 @@ def get_all_files(egg_file, base_path):
     return file_paths
 
 
-# 사용 예시
-egg_file_path = '/Users/nannada4/Downloads/test.egg'  # EGG 파일 경로를 여기에 설정하세요
-egg_file = EggFile(egg_file_path)
+if __name__ == '__main__':
+    # 사용 예시
+    # EGG 파일 경로를 인자로 주거나 여기에 설정하세요 (synthetic_corpus.py 로 만든 파일도 사용 가능)
+    egg_file_path = sys.argv[1] if len(sys.argv) > 1 else '/Users/nannada4/Downloads/test.egg'
+    egg_file = EggFile(egg_file_path)
 
-# EGG 파일 이름을 기반으로 시작 경로를 설정
-base_path = os.path.basename(egg_file_path).replace('.egg', '')
+    # EGG 파일 이름을 기반으로 시작 경로를 설정
+    base_path = os.path.basename(egg_file_path).replace('.egg', '')
 
-# 모든 파일 경로를 리스트로 가져오기
-file_paths = get_all_files(egg_file, base_path)
+    # 모든 파일 경로를 리스트로 가져오기
+    file_paths = get_all_files(egg_file, base_path)
 
-for path in file_paths:
-    print(path)
+    for path in file_paths:
+        print(path)
 
-egg_file.close()
+    egg_file.close()
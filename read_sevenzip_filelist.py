@@ -0,0 +1,509 @@
+import io
+import bz2
+import lzma
+import zlib
+import struct
+
+# 7z Signature Header
+SIGNATURE_7Z = b'7z\xbc\xaf\x27\x1c'
+STRUCT_SIGNATURE_HEADER = struct.Struct('<6sBBIQQI')  # signature, version(2), start header crc, next header offset/size/crc
+SIZE_SIGNATURE_HEADER = STRUCT_SIGNATURE_HEADER.size
+
+# 헤더 Property ID
+PROPERTY_END = 0x00
+PROPERTY_HEADER = 0x01
+PROPERTY_ARCHIVE_PROPERTIES = 0x02
+PROPERTY_ADDITIONAL_STREAMS_INFO = 0x03
+PROPERTY_MAIN_STREAMS_INFO = 0x04
+PROPERTY_FILES_INFO = 0x05
+PROPERTY_PACK_INFO = 0x06
+PROPERTY_UNPACK_INFO = 0x07
+PROPERTY_SUBSTREAMS_INFO = 0x08
+PROPERTY_SIZE = 0x09
+PROPERTY_CRC = 0x0A
+PROPERTY_FOLDER = 0x0B
+PROPERTY_CODERS_UNPACK_SIZE = 0x0C
+PROPERTY_NUM_UNPACK_STREAM = 0x0D
+PROPERTY_EMPTY_STREAM = 0x0E
+PROPERTY_EMPTY_FILE = 0x0F
+PROPERTY_NAME = 0x11
+PROPERTY_WIN_ATTRIBUTES = 0x15
+PROPERTY_ENCODED_HEADER = 0x17
+PROPERTY_DUMMY = 0x19
+
+# 압축된 헤더를 풀 때 지원하는 코덱 ID
+CODEC_COPY = b'\x00'
+CODEC_LZMA2 = b'\x21'
+CODEC_LZMA = b'\x03\x01\x01'
+CODEC_DEFLATE = b'\x04\x01\x08'
+CODEC_BZIP2 = b'\x04\x02\x02'
+
+FILE_ATTRIBUTE_DIRECTORY = 0x10
+
+# 압축된 헤더의 최대 크기 (손상된 파일에서 과도한 메모리 사용 방지)
+MAX_HEADER_SIZE = 256 * 1024 * 1024
+
+
+class Bad7zFile(Exception):
+    """7z 헤더를 읽을 수 없는 경우 (손상, 지원하지 않는 헤더 압축, 암호화된 헤더 등) 발생합니다."""
+
+
+class SevenZipInfo:
+    """
+    7z 압축 파일 내부 항목 하나의 정보.
+    zipfile.ZipInfo 와 같은 속성 이름을 사용합니다.
+
+    Attributes:
+        filename (str): 압축 파일 내부 경로 ('/' 구분, 폴더는 '/' 로 끝남).
+        file_size (int): 압축 해제 크기.
+    """
+
+    def __init__(self, filename, file_size=0):
+        self.filename = filename
+        self.file_size = file_size
+
+    def is_dir(self):
+        return self.filename.endswith('/')
+
+
+class Folder:
+    """
+    7z 폴더(코더 체인) 정보. 압축된 헤더를 풀 때와 파일 크기 계산에 사용합니다.
+    """
+
+    def __init__(self):
+        self.coders = []  # (codec id, 입력 스트림 수, 출력 스트림 수, properties)
+        self.bind_pairs = []  # (입력 인덱스, 출력 인덱스)
+        self.packed_streams = []
+        self.unpack_sizes = []
+        self.crc_defined = False
+
+    def total_out_streams(self):
+        return sum(coder[2] for coder in self.coders)
+
+    def unpack_size(self):
+        """
+        바인드되지 않은 최종 출력 스트림의 크기를 반환합니다.
+        """
+        bound = {out_index for _, out_index in self.bind_pairs}
+        for out_index, size in enumerate(self.unpack_sizes):
+            if out_index not in bound:
+                return size
+        return 0
+
+
+class HeaderReader:
+    """
+    7z 헤더 바이트를 순서대로 읽는 헬퍼. 7z 가변 길이 정수(NUMBER)를 지원합니다.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+
+    def read_byte(self):
+        if self.pos >= len(self.data):
+            raise Bad7zFile("Truncated header")
+        value = self.data[self.pos]
+        self.pos += 1
+        return value
+
+    def read_bytes(self, size):
+        if self.pos + size > len(self.data):
+            raise Bad7zFile("Truncated header")
+        value = self.data[self.pos:self.pos + size]
+        self.pos += size
+        return value
+
+    def read_uint32(self):
+        return struct.unpack('<I', self.read_bytes(4))[0]
+
+    def read_number(self):
+        first = self.read_byte()
+        mask = 0x80
+        value = 0
+        for i in range(8):
+            if first & mask == 0:
+                return value | ((first & (mask - 1)) << (8 * i))
+            value |= self.read_byte() << (8 * i)
+            mask >>= 1
+        return value
+
+    def read_bits(self, count):
+        """
+        MSB 부터 채워진 비트 벡터를 bool 리스트로 읽습니다.
+        """
+        bits = []
+        byte = 0
+        for i in range(count):
+            if i % 8 == 0:
+                byte = self.read_byte()
+            bits.append(bool(byte & (0x80 >> (i % 8))))
+        return bits
+
+    def read_defined_bits(self, count):
+        """
+        AllAreDefined 바이트와 (필요하면) 비트 벡터를 읽습니다.
+        """
+        if self.read_byte():
+            return [True] * count
+        return self.read_bits(count)
+
+    def expect(self, property_id):
+        if self.read_byte() != property_id:
+            raise Bad7zFile(f"Expected property {property_id:#x}")
+
+
+class SevenZipFile:
+    """
+    7z 압축 파일의 Signature Header 와 파일 끝의 헤더만 읽어 항목 목록을 만드는 목록 전용 리더.
+    LZMA 등으로 압축된 헤더(Encoded Header)는 표준 라이브러리로 풀며, 압축 데이터는 읽지 않습니다.
+    파일 경로 대신 bytes 를 주면 메모리에 있는 7z 를 읽습니다.
+    """
+
+    def __init__(self, filename):
+        self.filelist = []
+        self.name_to_info = {}
+
+        if isinstance(filename, (bytes, bytearray, memoryview)):
+            self.__BuildIndex__(io.BytesIO(filename))
+            return
+        with open(filename, 'rb') as fp:
+            self.__BuildIndex__(fp)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def namelist(self):
+        return [info.filename for info in self.filelist]
+
+    def infolist(self):
+        return list(self.filelist)
+
+    def getinfo(self, filename):
+        info = self.name_to_info.get(filename)
+        if info is None:
+            raise KeyError(f"There is no item named {filename!r} in the archive")
+        return info
+
+    def __BuildIndex__(self, fp):
+        signature_header = fp.read(SIZE_SIGNATURE_HEADER)
+        if len(signature_header) < SIZE_SIGNATURE_HEADER:
+            raise Bad7zFile("File is not a 7z file")
+        signature, _, _, _, next_offset, next_size, next_crc = \
+            STRUCT_SIGNATURE_HEADER.unpack(signature_header)
+        if signature != SIGNATURE_7Z:
+            raise Bad7zFile("File is not a 7z file")
+        if next_size == 0:
+            # 빈 압축 파일
+            return
+        if next_size > MAX_HEADER_SIZE:
+            raise Bad7zFile("Header is too large")
+
+        fp.seek(SIZE_SIGNATURE_HEADER + next_offset)
+        header = fp.read(next_size)
+        if len(header) != next_size or zlib.crc32(header) != next_crc:
+            raise Bad7zFile("Bad header CRC")
+
+        # Encoded Header 는 여러 번 중첩될 수 있음
+        while header[:1] == bytes([PROPERTY_ENCODED_HEADER]):
+            reader = HeaderReader(header)
+            reader.pos = 1
+            header = self.__DecodeHeader__(fp, reader)
+
+        reader = HeaderReader(header)
+        reader.expect(PROPERTY_HEADER)
+        self.__ReadHeader__(reader)
+
+    def __DecodeHeader__(self, fp, reader):
+        pack_pos, pack_sizes, folders, _, _ = self.__ReadStreamsInfo__(reader)
+        if len(folders) != 1 or not pack_sizes:
+            raise Bad7zFile("Unsupported encoded header")
+        folder = folders[0]
+        if len(folder.coders) != 1:
+            raise Bad7zFile("Unsupported encoded header coders")
+        unpack_size = folder.unpack_size()
+        if pack_sizes[0] > MAX_HEADER_SIZE or unpack_size > MAX_HEADER_SIZE:
+            raise Bad7zFile("Header is too large")
+
+        fp.seek(SIZE_SIGNATURE_HEADER + pack_pos)
+        packed = fp.read(pack_sizes[0])
+        codec_id, _, _, properties = folder.coders[0]
+        return decode_header_stream(codec_id, properties, packed, unpack_size)
+
+    def __ReadHeader__(self, reader):
+        property_id = reader.read_byte()
+        if property_id == PROPERTY_ARCHIVE_PROPERTIES:
+            while reader.read_byte() != PROPERTY_END:
+                reader.read_bytes(reader.read_number())
+            property_id = reader.read_byte()
+        if property_id == PROPERTY_ADDITIONAL_STREAMS_INFO:
+            self.__ReadStreamsInfo__(reader)
+            property_id = reader.read_byte()
+
+        substream_sizes = []
+        if property_id == PROPERTY_MAIN_STREAMS_INFO:
+            substream_sizes = self.__ReadStreamsInfo__(reader)[4]
+            property_id = reader.read_byte()
+        if property_id == PROPERTY_FILES_INFO:
+            self.__ReadFilesInfo__(reader, substream_sizes)
+            property_id = reader.read_byte()
+        if property_id != PROPERTY_END:
+            raise Bad7zFile(f"Unexpected property {property_id:#x} in header")
+
+    def __ReadStreamsInfo__(self, reader):
+        """
+        Returns:
+            tuple: (pack 위치, pack 크기 리스트, Folder 리스트, 폴더별 스트림 수, 파일 스트림 크기 리스트)
+        """
+        pack_pos = 0
+        pack_sizes = []
+        folders = []
+        num_unpack_streams = None
+        substream_sizes = None
+
+        property_id = reader.read_byte()
+        if property_id == PROPERTY_PACK_INFO:
+            pack_pos, pack_sizes = self.__ReadPackInfo__(reader)
+            property_id = reader.read_byte()
+        if property_id == PROPERTY_UNPACK_INFO:
+            folders = self.__ReadUnpackInfo__(reader)
+            property_id = reader.read_byte()
+        if property_id == PROPERTY_SUBSTREAMS_INFO:
+            num_unpack_streams, substream_sizes = self.__ReadSubStreamsInfo__(
+                reader, folders)
+            property_id = reader.read_byte()
+        if property_id != PROPERTY_END:
+            raise Bad7zFile(f"Unexpected property {property_id:#x} in streams info")
+
+        if num_unpack_streams is None:
+            # SubStreamsInfo 가 없으면 폴더마다 파일 하나
+            num_unpack_streams = [1] * len(folders)
+            substream_sizes = [folder.unpack_size() for folder in folders]
+        return pack_pos, pack_sizes, folders, num_unpack_streams, substream_sizes
+
+    def __ReadPackInfo__(self, reader):
+        pack_pos = reader.read_number()
+        num_pack_streams = reader.read_number()
+        pack_sizes = [0] * num_pack_streams
+
+        property_id = reader.read_byte()
+        if property_id == PROPERTY_SIZE:
+            pack_sizes = [reader.read_number() for _ in range(num_pack_streams)]
+            property_id = reader.read_byte()
+        if property_id == PROPERTY_CRC:
+            self.__SkipDigests__(reader, num_pack_streams)
+            property_id = reader.read_byte()
+        if property_id != PROPERTY_END:
+            raise Bad7zFile(f"Unexpected property {property_id:#x} in pack info")
+        return pack_pos, pack_sizes
+
+    def __ReadUnpackInfo__(self, reader):
+        reader.expect(PROPERTY_FOLDER)
+        num_folders = reader.read_number()
+        if reader.read_byte() != 0:
+            raise Bad7zFile("External folders are not supported")
+        folders = [self.__ReadFolder__(reader) for _ in range(num_folders)]
+
+        reader.expect(PROPERTY_CODERS_UNPACK_SIZE)
+        for folder in folders:
+            folder.unpack_sizes = [reader.read_number()
+                                   for _ in range(folder.total_out_streams())]
+
+        property_id = reader.read_byte()
+        if property_id == PROPERTY_CRC:
+            defined = self.__SkipDigests__(reader, num_folders)
+            for folder, crc_defined in zip(folders, defined):
+                folder.crc_defined = crc_defined
+            property_id = reader.read_byte()
+        if property_id != PROPERTY_END:
+            raise Bad7zFile(f"Unexpected property {property_id:#x} in unpack info")
+        return folders
+
+    def __ReadFolder__(self, reader):
+        folder = Folder()
+        num_coders = reader.read_number()
+        num_in_streams_total = 0
+        num_out_streams_total = 0
+        for _ in range(num_coders):
+            flag = reader.read_byte()
+            codec_id = reader.read_bytes(flag & 0x0F)
+            num_in_streams = num_out_streams = 1
+            if flag & 0x10:
+                num_in_streams = reader.read_number()
+                num_out_streams = reader.read_number()
+            properties = b''
+            if flag & 0x20:
+                properties = reader.read_bytes(reader.read_number())
+            if flag & 0x80:
+                raise Bad7zFile("Alternative coder methods are not supported")
+            folder.coders.append((codec_id, num_in_streams, num_out_streams, properties))
+            num_in_streams_total += num_in_streams
+            num_out_streams_total += num_out_streams
+
+        for _ in range(num_out_streams_total - 1):
+            folder.bind_pairs.append((reader.read_number(), reader.read_number()))
+
+        num_packed_streams = num_in_streams_total - len(folder.bind_pairs)
+        if num_packed_streams > 1:
+            folder.packed_streams = [reader.read_number()
+                                     for _ in range(num_packed_streams)]
+        return folder
+
+    def __ReadSubStreamsInfo__(self, reader, folders):
+        num_unpack_streams = [1] * len(folders)
+
+        property_id = reader.read_byte()
+        if property_id == PROPERTY_NUM_UNPACK_STREAM:
+            num_unpack_streams = [reader.read_number() for _ in folders]
+            property_id = reader.read_byte()
+
+        # 폴더마다 마지막 스트림 크기는 폴더 전체 크기에서 나머지를 빼서 계산
+        substream_sizes = []
+        has_sizes = property_id == PROPERTY_SIZE
+        for folder, num_streams in zip(folders, num_unpack_streams):
+            if num_streams == 0:
+                continue
+            remaining = folder.unpack_size()
+            for _ in range(num_streams - 1):
+                size = reader.read_number() if has_sizes else 0
+                substream_sizes.append(size)
+                remaining -= size
+            substream_sizes.append(remaining)
+        if has_sizes:
+            property_id = reader.read_byte()
+
+        if property_id == PROPERTY_CRC:
+            # 폴더 CRC 가 있는 단일 스트림 폴더는 여기에 CRC 가 없음
+            num_digests = sum(num_streams for folder, num_streams in zip(folders, num_unpack_streams)
+                              if not (num_streams == 1 and folder.crc_defined))
+            self.__SkipDigests__(reader, num_digests)
+            property_id = reader.read_byte()
+        if property_id != PROPERTY_END:
+            raise Bad7zFile(f"Unexpected property {property_id:#x} in substreams info")
+        return num_unpack_streams, substream_sizes
+
+    def __SkipDigests__(self, reader, count):
+        """
+        CRC 목록을 건너뛰고, 항목별 CRC 존재 여부 리스트를 반환합니다.
+        """
+        defined = reader.read_defined_bits(count)
+        reader.read_bytes(4 * sum(defined))
+        return defined
+
+    def __ReadFilesInfo__(self, reader, substream_sizes):
+        num_files = reader.read_number()
+        empty_streams = [False] * num_files
+        empty_files = []
+        names = []
+        attributes = [None] * num_files
+
+        while True:
+            property_id = reader.read_number()
+            if property_id == PROPERTY_END:
+                break
+            size = reader.read_number()
+            data = HeaderReader(reader.read_bytes(size))
+
+            if property_id == PROPERTY_EMPTY_STREAM:
+                empty_streams = data.read_bits(num_files)
+            elif property_id == PROPERTY_EMPTY_FILE:
+                empty_files = data.read_bits(sum(empty_streams))
+            elif property_id == PROPERTY_NAME:
+                if data.read_byte() != 0:
+                    raise Bad7zFile("External names are not supported")
+                names = data.data[1:].decode('utf-16-le').split('\x00')[:num_files]
+            elif property_id == PROPERTY_WIN_ATTRIBUTES:
+                defined = data.read_defined_bits(num_files)
+                if data.read_byte() != 0:
+                    raise Bad7zFile("External attributes are not supported")
+                for index, is_defined in enumerate(defined):
+                    if is_defined:
+                        attributes[index] = data.read_uint32()
+            # 시간 정보, kDummy 등은 목록에 필요 없으므로 건너뜀
+
+        if len(names) != num_files:
+            raise Bad7zFile("File names are missing")
+
+        stream_sizes = iter(substream_sizes)
+        empty_index = 0
+        for index, name in enumerate(names):
+            name = name.replace('\\', '/')
+            if empty_streams[index]:
+                is_empty_file = empty_index < len(empty_files) and empty_files[empty_index]
+                empty_index += 1
+                is_dir = not is_empty_file
+                file_size = 0
+            else:
+                is_dir = False
+                file_size = next(stream_sizes, 0)
+            if attributes[index] is not None and attributes[index] & FILE_ATTRIBUTE_DIRECTORY:
+                is_dir = True
+            if is_dir and not name.endswith('/'):
+                name += '/'
+
+            info = SevenZipInfo(name, file_size)
+            self.filelist.append(info)
+            self.name_to_info[name] = info
+
+
+def lzma_filter(codec_id, properties):
+    """
+    7z 코더 정보를 lzma 모듈의 raw 필터로 변환합니다.
+    """
+    if codec_id == CODEC_LZMA:
+        if len(properties) < 5:
+            raise Bad7zFile("Bad LZMA properties")
+        lc_lp_pb = properties[0]
+        return {'id': lzma.FILTER_LZMA1,
+                'lc': lc_lp_pb % 9,
+                'lp': (lc_lp_pb // 9) % 5,
+                'pb': lc_lp_pb // 45,
+                'dict_size': struct.unpack_from('<I', properties, 1)[0]}
+    if len(properties) < 1:
+        raise Bad7zFile("Bad LZMA2 properties")
+    dict_bits = properties[0]
+    if dict_bits > 40:
+        raise Bad7zFile("Bad LZMA2 properties")
+    dict_size = 0xFFFFFFFF if dict_bits == 40 else (2 | (dict_bits & 1)) << (dict_bits // 2 + 11)
+    return {'id': lzma.FILTER_LZMA2, 'dict_size': dict_size}
+
+
+def decode_header_stream(codec_id, properties, packed, unpack_size):
+    """
+    압축된 헤더 스트림을 풉니다. (Copy, LZMA, LZMA2, Deflate, BZip2)
+    """
+    try:
+        if codec_id == CODEC_COPY:
+            data = packed
+        elif codec_id in (CODEC_LZMA, CODEC_LZMA2):
+            decompressor = lzma.LZMADecompressor(
+                format=lzma.FORMAT_RAW, filters=[lzma_filter(codec_id, properties)])
+            data = decompressor.decompress(packed, unpack_size)
+        elif codec_id == CODEC_DEFLATE:
+            data = zlib.decompressobj(-15).decompress(packed, unpack_size)
+        elif codec_id == CODEC_BZIP2:
+            data = bz2.BZ2Decompressor().decompress(packed, unpack_size)
+        else:
+            # 7zAES 로 암호화된 헤더 등
+            raise Bad7zFile(f"Unsupported header coder {codec_id.hex()}")
+    except (lzma.LZMAError, zlib.error, OSError, ValueError) as e:
+        raise Bad7zFile(f"Error decoding header: {e}")
+
+    if len(data) < unpack_size:
+        raise Bad7zFile("Truncated encoded header")
+    return data[:unpack_size]
+
+
+if __name__ == '__main__':
+    # 사용 예시
+    sevenzip_file_path = '/Users/nannada4/Downloads/test.7z'  # 7z 파일 경로를 여기에 설정하세요
+    with SevenZipFile(sevenzip_file_path) as sevenzip_file:
+        for info in sevenzip_file.infolist():
+            print(info.filename, info.file_size)
@@ -0,0 +1,286 @@
+import os
+import mmap
+import struct
+import zipfile
+from bisect import bisect_right
+
+import chardet
+
+# UTF-8 플래그가 없는 zip 항목 이름을 해석할 때 시도하는 순서
+# (한글 UTF-8 바이트는 cp949 로도 해석되는 경우가 많으므로 UTF-8 을 먼저 시도)
+STRICT_NAME_ENCODINGS = ('utf-8', 'cp949')
+DEFAULT_NAME_ENCODING = 'cp949'
+
+FLAG_UTF8 = 0x800
+
+# ZIP 레코드 시그니처
+MAGIC_CENTRAL_DIR = b'PK\x01\x02'
+MAGIC_END_OF_CENTRAL_DIR = b'PK\x05\x06'
+MAGIC_ZIP64_END_OF_CENTRAL_DIR = b'PK\x06\x06'
+MAGIC_ZIP64_LOCATOR = b'PK\x06\x07'
+
+# 미리 컴파일한 레코드 구조체 (시그니처 포함)
+# signature, 디스크 번호, 중앙 디렉터리 시작 디스크, 이 디스크의 항목 수, 전체 항목 수, 중앙 디렉터리 크기, 오프셋, 주석 길이
+STRUCT_END_OF_CENTRAL_DIR = struct.Struct('<4sHHHHIIH')
+# signature, zip64 EOCD 가 있는 디스크, zip64 EOCD 오프셋, 전체 디스크 수
+STRUCT_ZIP64_LOCATOR = struct.Struct('<4sIQI')
+# signature, 레코드 크기, 버전(만든/필요), 디스크 번호, 중앙 디렉터리 시작 디스크, 이 디스크의 항목 수, 전체 항목 수, 크기, 오프셋
+STRUCT_ZIP64_END_OF_CENTRAL_DIR = struct.Struct('<4sQHHIIQQQQ')
+# 중앙 디렉터리 항목에서 필요한 필드만: signature, ..., bit flag(8), ..., 이름/extra/주석 길이(28, 30, 32)
+STRUCT_CENTRAL_DIR = struct.Struct('<4s4xH18xHHH12x')
+
+MAX_COMMENT_SIZE = 0xFFFF
+
+
+def detect_name_encoding(raw_names):
+    """
+    압축 파일 하나의 UTF-8 플래그가 없는 항목 이름들에 공통으로 사용할 인코딩을 정합니다.
+    모든 이름이 엄격하게 해석되는 인코딩을 먼저 찾고, 없으면 이름 바이트를 합쳐 한 번만 chardet 으로 감지합니다.
+
+    Args:
+        raw_names (list): 항목 이름 바이트 리스트.
+
+    Returns:
+        str: 인코딩 이름.
+    """
+    for encoding in STRICT_NAME_ENCODINGS:
+        try:
+            for raw_name in raw_names:
+                raw_name.decode(encoding)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+
+    return chardet.detect(b'\n'.join(raw_names))['encoding'] or DEFAULT_NAME_ENCODING
+
+
+def decode_member_names(entries):
+    """
+    zip 항목 이름 리스트를 반환합니다. UTF-8 플래그가 없는 항목은 압축 파일마다 한 번 정한 인코딩으로 해석합니다.
+
+    Args:
+        entries (list): (이름 바이트, bit flag) 튜플 리스트.
+
+    Returns:
+        list: entries 와 같은 순서의 파일 이름 리스트.
+
+    Raises:
+        UnicodeDecodeError: UTF-8 플래그가 있는 이름이 UTF-8 이 아닌 경우.
+    """
+    legacy_names = [raw_name for raw_name, flag_bits in entries
+                    if flag_bits & FLAG_UTF8 == 0]
+    encoding = None
+    if legacy_names:
+        encoding = detect_name_encoding(legacy_names)
+
+    names = []
+    for raw_name, flag_bits in entries:
+        if flag_bits & FLAG_UTF8:
+            names.append(raw_name.decode('utf-8'))
+        else:
+            names.append(raw_name.decode(encoding, 'replace'))
+    return names
+
+
+def zipinfo_member_names(infolist):
+    """
+    zipfile.ZipFile 의 ZipInfo 리스트를 ZipFileList 와 같은 방식으로 해석한 이름 리스트를 반환합니다.
+    (zipfile 은 UTF-8 플래그가 없는 이름을 cp437 로 해석하므로 원래 바이트로 되돌려 다시 해석)
+    """
+    entries = []
+    for info in infolist:
+        if info.flag_bits & FLAG_UTF8:
+            entries.append((info.orig_filename.encode('utf-8'), info.flag_bits))
+        else:
+            entries.append((info.orig_filename.encode('cp437'), info.flag_bits))
+    return decode_member_names(entries)
+
+
+def split_volume_paths(filename, disk_count):
+    """
+    분할 압축의 볼륨 경로 리스트를 반환합니다. (이름.z01, 이름.z02, ..., 이름.zip 순서)
+    """
+    stem, extension = os.path.splitext(filename)
+    volume_prefix = '.Z' if extension.isupper() else '.z'
+    return [f'{stem}{volume_prefix}{disk:02d}' for disk in range(1, disk_count)] + [filename]
+
+
+class ZipFileList:
+    """
+    ZIP 중앙 디렉터리만 mmap 으로 읽어 항목 이름을 나열하는 목록 전용 리더.
+    ZipInfo 객체를 만들지 않고 이름 바이트와 bit flag 만 읽으며, Zip64 를 지원합니다.
+    분할 압축(.z01 ... .zNN + .zip)은 볼륨들을 이어 붙인 하나의 파일로 취급합니다.
+    파일 경로 대신 bytes 를 주면 메모리에 있는 zip 을 읽습니다. (압축 파일 안의 압축 파일 등)
+
+    Attributes:
+        volumes (list): 볼륨 파일 경로 리스트 (분할 압축이 아니면 zip 파일 하나).
+        entries (list): (이름 바이트, bit flag) 튜플 리스트.
+    """
+
+    def __init__(self, filename):
+        self.volumes = [filename]
+        self.fps = []
+        self.mms = []
+        # 각 볼륨이 이어 붙인 파일에서 시작하는 위치
+        self.offsets = []
+        self.entries = []
+
+        try:
+            self.__BuildIndex__(filename)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self):
+        for mm in self.mms:
+            if isinstance(mm, mmap.mmap):
+                mm.close()
+        for fp in self.fps:
+            fp.close()
+        self.mms = []
+        self.fps = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def namelist(self):
+        return decode_member_names(self.entries)
+
+    def __OpenVolumes__(self, volumes):
+        self.volumes = volumes
+        offset = 0
+        for volume in volumes:
+            if isinstance(volume, (bytes, bytearray, memoryview)):
+                # 메모리에 있는 zip
+                data = bytes(volume)
+                if not data:
+                    raise zipfile.BadZipFile("File is not a zip file")
+                self.mms.append(data)
+                self.offsets.append(offset)
+                offset += len(data)
+                continue
+            fp = open(volume, 'rb')
+            self.fps.append(fp)
+            size = os.fstat(fp.fileno()).st_size
+            if size == 0:
+                raise zipfile.BadZipFile("File is not a zip file")
+            mm = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            self.mms.append(mm)
+            self.offsets.append(offset)
+            offset += size
+
+    def __Read__(self, pos, size):
+        """
+        이어 붙인 볼륨에서 pos 위치부터 size 바이트를 읽습니다. (볼륨 경계를 넘어도 이어서 읽음)
+        """
+        chunks = []
+        while size > 0:
+            volume_index = bisect_right(self.offsets, pos) - 1
+            if volume_index < 0:
+                raise zipfile.BadZipFile("Bad offset in central directory")
+            mm = self.mms[volume_index]
+            start = pos - self.offsets[volume_index]
+            chunk = mm[start:start + size]
+            if len(chunk) == 0:
+                raise zipfile.BadZipFile("Truncated central directory")
+            chunks.append(chunk)
+            pos += len(chunk)
+            size -= len(chunk)
+        if len(chunks) == 1:
+            return chunks[0]
+        return b''.join(chunks)
+
+    def __FindEndOfCentralDir__(self, mm):
+        eocd_size = STRUCT_END_OF_CENTRAL_DIR.size
+        search_start = max(0, len(mm) - eocd_size - MAX_COMMENT_SIZE)
+        eocd_pos = mm.rfind(MAGIC_END_OF_CENTRAL_DIR, search_start)
+        while eocd_pos >= 0:
+            comment_size = STRUCT_END_OF_CENTRAL_DIR.unpack_from(mm, eocd_pos)[7]
+            if eocd_pos + eocd_size + comment_size <= len(mm):
+                return eocd_pos
+            eocd_pos = mm.rfind(MAGIC_END_OF_CENTRAL_DIR, search_start, eocd_pos)
+        raise zipfile.BadZipFile("File is not a zip file")
+
+    def __BuildIndex__(self, filename):
+        # 마지막 볼륨(.zip)에서 End of Central Directory 를 찾음
+        self.__OpenVolumes__([filename])
+        last_mm = self.mms[0]
+        eocd_pos = self.__FindEndOfCentralDir__(last_mm)
+        (_, disk_number, cd_disk, _, _, cd_size, cd_offset,
+         _) = STRUCT_END_OF_CENTRAL_DIR.unpack_from(last_mm, eocd_pos)
+        disk_count = disk_number + 1
+        zip64_locator = None
+
+        locator_pos = eocd_pos - STRUCT_ZIP64_LOCATOR.size
+        if locator_pos >= 0 and last_mm[locator_pos:locator_pos + 4] == MAGIC_ZIP64_LOCATOR:
+            zip64_locator = STRUCT_ZIP64_LOCATOR.unpack_from(last_mm, locator_pos)
+            disk_count = zip64_locator[3]
+
+        if disk_count > 1:
+            if not isinstance(filename, str):
+                raise zipfile.BadZipFile("Split archive cannot be read from memory")
+            # 분할 압축: .z01 ... .zNN 를 앞에 이어 붙임
+            volumes = split_volume_paths(filename, disk_count)
+            missing = [volume for volume in volumes if not os.path.exists(volume)]
+            if missing:
+                raise zipfile.BadZipFile(f"Missing split volume {missing[0]}")
+            self.close()
+            self.offsets = []
+            self.__OpenVolumes__(volumes)
+
+        concat = 0
+        if zip64_locator is not None:
+            if disk_count == 1:
+                # zipfile 과 같이 locator 바로 앞의 레코드를 읽음 (앞에 붙은 데이터가 있어도 동작)
+                zip64_pos = locator_pos - STRUCT_ZIP64_END_OF_CENTRAL_DIR.size
+            else:
+                zip64_disk, zip64_offset = zip64_locator[1], zip64_locator[2]
+                if zip64_disk >= len(self.offsets):
+                    raise zipfile.BadZipFile("Bad zip64 end of central directory locator")
+                zip64_pos = self.offsets[zip64_disk] + zip64_offset
+            if zip64_pos < 0:
+                raise zipfile.BadZipFile("Bad zip64 end of central directory locator")
+            zip64_record = self.__Read__(zip64_pos, STRUCT_ZIP64_END_OF_CENTRAL_DIR.size)
+            (signature, _, _, _, _, cd_disk, _, _, cd_size,
+             cd_offset) = STRUCT_ZIP64_END_OF_CENTRAL_DIR.unpack(zip64_record)
+            if signature != MAGIC_ZIP64_END_OF_CENTRAL_DIR:
+                raise zipfile.BadZipFile("Bad zip64 end of central directory")
+            if disk_count == 1:
+                concat = zip64_pos - cd_size - cd_offset
+        elif disk_count == 1:
+            # 앞에 다른 데이터가 붙은 파일 (자동 압축 해제 exe 등)
+            concat = eocd_pos - cd_size - cd_offset
+
+        if cd_disk >= len(self.offsets):
+            raise zipfile.BadZipFile("Bad offset for central directory")
+        cd_pos = self.offsets[cd_disk] + cd_offset + concat
+        if cd_pos < 0:
+            raise zipfile.BadZipFile("Bad offset for central directory")
+        central_dir = self.__Read__(cd_pos, cd_size)
+        self.__ReadCentralDir__(central_dir)
+
+    def __ReadCentralDir__(self, central_dir):
+        header_size = STRUCT_CENTRAL_DIR.size
+        pos = 0
+        end = len(central_dir)
+        entries = self.entries
+
+        try:
+            while pos < end:
+                (signature, flag_bits, name_size, extra_size,
+                 comment_size) = STRUCT_CENTRAL_DIR.unpack_from(central_dir, pos)
+                if signature != MAGIC_CENTRAL_DIR:
+                    raise zipfile.BadZipFile("Bad magic number for central directory")
+                name_pos = pos + header_size
+                raw_name = central_dir[name_pos:name_pos + name_size]
+                # zipfile 과 같이 NUL 이후는 무시
+                null_pos = raw_name.find(b'\x00')
+                if null_pos >= 0:
+                    raw_name = raw_name[:null_pos]
+                entries.append((raw_name, flag_bits))
+                pos = name_pos + name_size + extra_size + comment_size
+        except struct.error:
+            raise zipfile.BadZipFile("Truncated central directory")
@@ -0,0 +1,157 @@
+import time
+import threading
+
+# 진행 상황 콜백을 호출하는 최소 간격 (초)
+PROGRESS_INTERVAL = 0.2
+
+# 작업 단계
+STAGE_WALK = '폴더 탐색'
+STAGE_WRITE = '압축파일 목록/기록'
+STAGE_COPY = '파일 복사'
+STAGE_DONE = '완료'
+STAGE_CANCELLED = '취소됨'
+
+
+class RunCancelled(Exception):
+    """
+    사용자가 작업을 취소했을 때 발생합니다.
+    """
+
+
+class RunProgress:
+    """
+    메타데이터 생성/파일 이동 작업의 진행 상황과 취소 요청.
+    작업 스레드와 압축파일 목록 스레드에서 함께 갱신하며, callback 은 PROGRESS_INTERVAL 마다 한 번씩만 호출됩니다.
+
+    Attributes:
+        callback (callable): callback(snapshot 딕셔너리). 호출한 스레드에서 실행됩니다.
+        stage (str): 현재 단계 (STAGE_*).
+        files_walked (int): 탐색한 파일 수.
+        files_total (int): 현재 단계에서 처리할 파일 수.
+        files_done (int): 현재 단계에서 처리한 파일 수.
+        archives_listed (int): 내부 파일 목록을 읽은 압축 파일 수.
+        rows_written (int): 기록한 메타데이터 행 수.
+        bytes_done (int): 읽은 압축 파일과 복사한 파일의 크기 합.
+        current_archives (dict): {목록을 읽고 있는 압축 파일: 시작 시각}
+    """
+
+    def __init__(self, callback=None, interval=PROGRESS_INTERVAL):
+        self.callback = callback
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.cancel_event = threading.Event()
+        self.stage = ''
+        self.files_walked = 0
+        self.files_total = 0
+        self.files_done = 0
+        self.archives_listed = 0
+        self.rows_written = 0
+        self.bytes_done = 0
+        self.current_archives = {}
+        self.started = time.monotonic()
+        self.stage_started = self.started
+        self.last_report = 0.0
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    def check_cancelled(self):
+        """
+        취소 요청이 있으면 RunCancelled 를 발생시킵니다.
+        """
+        if self.cancel_event.is_set():
+            raise RunCancelled()
+
+    def set_stage(self, stage, files_total=0):
+        with self.lock:
+            self.stage = stage
+            self.files_total = files_total
+            self.files_done = 0
+            self.stage_started = time.monotonic()
+        self.report(force=True)
+
+    def walked(self, count):
+        with self.lock:
+            self.files_walked += count
+        self.report()
+
+    def file_done(self, rows=0, size=0):
+        with self.lock:
+            self.files_done += 1
+            self.rows_written += rows
+            self.bytes_done += size
+        self.report()
+
+    def archive_started(self, archive_path):
+        with self.lock:
+            self.current_archives[archive_path] = time.monotonic()
+        self.report()
+
+    def archive_finished(self, archive_path, size=0):
+        with self.lock:
+            self.current_archives.pop(archive_path, None)
+            self.archives_listed += 1
+            self.bytes_done += size
+        self.report()
+
+    def snapshot(self):
+        """
+        현재 진행 상황을 딕셔너리로 반환합니다.
+        bytes_per_second 는 작업 시작 이후 평균, eta 는 현재 단계의 남은 파일 수로 추정한 초 (모르면 None) 입니다.
+        """
+        with self.lock:
+            now = time.monotonic()
+            elapsed = now - self.started
+            stage_elapsed = now - self.stage_started
+            eta = None
+            if self.files_total and self.files_done:
+                eta = stage_elapsed / self.files_done * (self.files_total - self.files_done)
+            # 가장 오래 목록을 읽고 있는 압축 파일 (멈춘 압축 파일 확인용)
+            slowest_archive = None
+            slowest_seconds = 0.0
+            if self.current_archives:
+                slowest_archive, archive_started = min(
+                    self.current_archives.items(), key=lambda item: item[1])
+                slowest_seconds = now - archive_started
+            return {
+                'stage': self.stage,
+                'files_walked': self.files_walked,
+                'files_total': self.files_total,
+                'files_done': self.files_done,
+                'archives_listed': self.archives_listed,
+                'rows_written': self.rows_written,
+                'bytes_done': self.bytes_done,
+                'elapsed': elapsed,
+                'bytes_per_second': self.bytes_done / elapsed if elapsed > 0 else 0.0,
+                'eta': eta,
+                'slowest_archive': slowest_archive,
+                'slowest_seconds': slowest_seconds,
+            }
+
+    def report(self, force=False):
+        if self.callback is None:
+            return
+        now = time.monotonic()
+        if not force and now - self.last_report < self.interval:
+            return
+        self.last_report = now
+        self.callback(self.snapshot())
+
+
+def format_progress(snapshot):
+    """
+    진행 상황 딕셔너리를 한 줄 문자열로 반환합니다.
+    """
+    text = f"{snapshot['stage']} | 탐색 {snapshot['files_walked']}개"
+    if snapshot['files_total']:
+        text += f" | 처리 {snapshot['files_done']}/{snapshot['files_total']}개"
+    text += (f" | 압축파일 {snapshot['archives_listed']}개"
+             f" | {snapshot['rows_written']}행"
+             f" | {snapshot['bytes_per_second'] / (1024 * 1024):.1f} MB/s")
+    if snapshot['eta'] is not None:
+        text += f" | 남은 시간 {int(snapshot['eta'])}초"
+    return text
@@ -0,0 +1,146 @@
+import os
+import json
+import time
+import heapq
+import cProfile
+import threading
+from collections import Counter
+
+# 보고서에 남길 가장 오래 걸린 압축 파일 수
+SLOWEST_ARCHIVES = 20
+
+REPORT_VERSION = 1
+
+
+def report_path_for(output_path):
+    """
+    출력 파일 (엑셀 등) 경로에 대응하는 실행 보고서 경로를 반환합니다.
+    """
+    return output_path + '.report.json'
+
+
+def profile_path_for(output_path):
+    """
+    출력 파일 경로에 대응하는 cProfile 결과 경로를 반환합니다. (python -m pstats 또는 snakeviz 로 확인)
+    """
+    return output_path + '.prof'
+
+
+class RunReport:
+    """
+    메타데이터 생성/파일 이동 작업 한 번의 단계별 시간, 처리량, 오류 수를 모읍니다.
+    작업 스레드와 압축파일 목록 스레드에서 함께 기록하며, 끝나면 JSON 으로 저장합니다.
+    여러 스레드에서 동시에 실행되는 단계 (압축파일 목록 등)의 seconds 는 스레드별 시간의 합입니다.
+
+    Attributes:
+        stages (dict): {단계 이름: {'seconds', 'calls', 'items', 'bytes'}}
+        errors (Counter): {'압축파일 확인필요' 사유 (분할압축, 압축파일 오류, 인코딩 에러 등): 개수}
+        counters (Counter): {이름: 값} 캐시 적중 수 등 단계 시간 외의 수치.
+        slowest_archives (list): 목록을 읽는 데 가장 오래 걸린 압축 파일 (시간, 경로, 크기, 내부 파일 수, 오류) 힙.
+    """
+
+    def __init__(self, slowest_count=SLOWEST_ARCHIVES):
+        self.lock = threading.Lock()
+        self.slowest_count = slowest_count
+        self.stages = {}
+        self.errors = Counter()
+        self.counters = Counter()
+        self.slowest_archives = []
+        self.files = 0
+        self.rows = 0
+        self.bytes_read = 0
+        self.status = 'running'
+        self.profile_path = None
+        self.started_at = time.time()
+        self.started = time.perf_counter()
+        self.seconds = None
+
+    def add(self, stage, seconds, items=0, size=0):
+        """
+        단계 하나의 실행 시간과 처리한 항목 수, 읽은 바이트 수를 더합니다.
+        """
+        with self.lock:
+            stats = self.stages.get(stage)
+            if stats is None:
+                stats = self.stages[stage] = {'seconds': 0.0, 'calls': 0, 'items': 0, 'bytes': 0}
+            stats['seconds'] += seconds
+            stats['calls'] += 1
+            stats['items'] += items
+            stats['bytes'] += size
+            self.bytes_read += size
+
+    def add_archive(self, archive_path, seconds, size, entries, error=None):
+        """
+        압축 파일 하나의 목록 읽기 시간을 기록하고, 가장 오래 걸린 slowest_count 개만 남깁니다.
+        """
+        item = (seconds, archive_path, size, entries, None if error is None else repr(error))
+        with self.lock:
+            if len(self.slowest_archives) < self.slowest_count:
+                heapq.heappush(self.slowest_archives, item)
+            elif seconds > self.slowest_archives[0][0]:
+                heapq.heapreplace(self.slowest_archives, item)
+
+    def count_error(self, category):
+        with self.lock:
+            self.errors[category] += 1
+
+    def count(self, name, value=1):
+        with self.lock:
+            self.counters[name] += value
+
+    def count_file(self, rows):
+        with self.lock:
+            self.files += 1
+            self.rows += rows
+
+    def finish(self, status):
+        self.status = status
+        self.seconds = time.perf_counter() - self.started
+
+    def to_dict(self):
+        seconds = self.seconds if self.seconds is not None else time.perf_counter() - self.started
+        with self.lock:
+            return {
+                'version': REPORT_VERSION,
+                'status': self.status,
+                'started_at': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.started_at)),
+                'seconds': seconds,
+                'totals': {
+                    'files': self.files,
+                    'rows': self.rows,
+                    'bytes_read': self.bytes_read,
+                    'files_per_second': self.files / seconds if seconds > 0 else None,
+                    'bytes_per_second': self.bytes_read / seconds if seconds > 0 else None,
+                },
+                'stages': {stage: dict(stats) for stage, stats in sorted(
+                    self.stages.items(), key=lambda item: -item[1]['seconds'])},
+                'errors': dict(self.errors),
+                'counters': dict(self.counters),
+                'slowest_archives': [
+                    {'path': path, 'seconds': archive_seconds, 'bytes': size, 'entries': entries, 'error': error}
+                    for archive_seconds, path, size, entries, error in sorted(self.slowest_archives, reverse=True)],
+                'profile': self.profile_path,
+            }
+
+    def write(self, path):
+        """
+        임시 파일에 쓴 뒤 교체하여 JSON 보고서를 저장합니다.
+        """
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(self.to_dict(), file, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+
+
+def profile_call(func, profile_path):
+    """
+    func() 를 cProfile 로 실행하고 결과를 profile_path 에 저장합니다.
+    cProfile 은 호출한 스레드만 측정하므로, 스레드 풀에서 실행되는 압축파일 목록 읽기는 보고서의 단계별 시간으로 확인합니다.
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        return func()
+    finally:
+        profiler.disable()
+        profiler.dump_stats(profile_path)
@@ -0,0 +1,299 @@
+import os
+import bz2
+import zlib
+import random
+import struct
+import zipfile
+import argparse
+
+from read_egg_filelist import (
+    COMPRESS_METHOD_STORE, COMPRESS_METHOD_DEFLATE, COMPRESS_METHOD_BZIP2,
+    MAGIC_EGG_HEADER, MAGIC_FILE_HEADER, MAGIC_BLOCK_HEADER, MAGIC_FILENAME_HEADER,
+    MAGIC_WINDOWS_FILE_INFO, MAGIC_END_OF_HEADER, FILENAME_FLAG_AREA_CODE,
+    STRUCT_EGG_HEADER, STRUCT_BLOCK_HEADER, STRUCT_EXTRA_HEADER
+)
+from read_zip_filelist import STRUCT_END_OF_CENTRAL_DIR, MAGIC_END_OF_CENTRAL_DIR, MAGIC_CENTRAL_DIR
+from metadata_generator import MetadataGenerator
+
+# 합성 국정감사 제출자료 폴더 구조 (위원회/피감기관/위원/문서 종류/파일)
+COMMITTEES = ['01 교육위원회', '02 과학기술정보방송통신위원회', '03 행정안전위원회',
+              '04 문화체육관광위원회', '05 보건복지위원회', '06 국토교통위원회']
+DOCUMENT_FOLDERS = ['요구자료', '답변서', '붙임', '공통요구', '질의답변', '기타']
+DOCUMENT_EXTENSIONS = ['.hwp', '.hwp', '.hwp', '.pdf', '.pdf', '.xlsx', '.hwpx', '.docx']
+ARCHIVE_KINDS = ['zip', 'cp949_zip', 'egg', 'split_zip']
+
+STRUCT_FILE_HEADER = struct.Struct('<IIQ')          # magic, 파일 id, 원본 크기
+STRUCT_WINDOWS_FILE_INFO = struct.Struct('<IBHQB')  # magic, bit flag, 크기, 수정 시각, 속성
+STRUCT_END_OF_HEADER = struct.Struct('<I')
+
+# 중앙 디렉터리 항목: 이름/extra/주석 길이, 시작 디스크 번호, local header 상대 오프셋의 위치
+CENTRAL_DIR_HEADER_SIZE = 46
+STRUCT_CENTRAL_DIR_SIZES = struct.Struct('<HHH')   # 오프셋 28
+STRUCT_CENTRAL_DIR_DISK = struct.Struct('<H')      # 오프셋 34
+STRUCT_CENTRAL_DIR_OFFSET = struct.Struct('<I')    # 오프셋 42
+
+
+class EggWriter:
+    """
+    EggFile 로 읽을 수 있는 EGG 압축 파일을 만듭니다. (벤치마크용 합성 데이터, 암호화/분할/solid 없음)
+
+    Attributes:
+        path (str): 만들 EGG 파일 경로.
+        area_code (bool): True 이면 파일명을 지역 코드(cp949)로, False 이면 UTF-8 로 기록합니다.
+    """
+
+    def __init__(self, path, area_code=False):
+        self.path = path
+        self.area_code = area_code
+        self.file_id = 0
+        self.fp = open(path, 'wb')
+        self.fp.write(STRUCT_EGG_HEADER.pack(MAGIC_EGG_HEADER, 0x0100, random.getrandbits(32), 0))
+        self.fp.write(STRUCT_END_OF_HEADER.pack(MAGIC_END_OF_HEADER))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, name, data, method=COMPRESS_METHOD_DEFLATE, block_size=None):
+        """
+        파일 하나를 추가합니다. block_size 를 주면 데이터를 여러 블록으로 나누어 기록합니다.
+        """
+        if self.area_code:
+            raw_name = b'\x00\x00' + name.encode('cp949')
+            bit_flag = FILENAME_FLAG_AREA_CODE
+        else:
+            raw_name = name.encode('utf-8')
+            bit_flag = 0
+        name_size = len(raw_name) - (2 if self.area_code else 0)
+
+        fp = self.fp
+        fp.write(STRUCT_FILE_HEADER.pack(MAGIC_FILE_HEADER, self.file_id, len(data)))
+        fp.write(STRUCT_EXTRA_HEADER.pack(MAGIC_FILENAME_HEADER, bit_flag, name_size) + raw_name)
+        fp.write(STRUCT_WINDOWS_FILE_INFO.pack(MAGIC_WINDOWS_FILE_INFO, 0, 9, 0, 0x20))
+        fp.write(STRUCT_END_OF_HEADER.pack(MAGIC_END_OF_HEADER))
+        self.file_id += 1
+
+        if block_size is None or len(data) <= block_size:
+            chunks = [data]
+        else:
+            chunks = [data[pos:pos + block_size] for pos in range(0, len(data), block_size)]
+        for chunk in chunks:
+            compressed = compress_block(chunk, method)
+            fp.write(STRUCT_BLOCK_HEADER.pack(MAGIC_BLOCK_HEADER, method, 0, len(chunk),
+                                              len(compressed), zlib.crc32(chunk)))
+            fp.write(STRUCT_END_OF_HEADER.pack(MAGIC_END_OF_HEADER))
+            fp.write(compressed)
+
+    def close(self):
+        if self.fp is None:
+            return
+        self.fp.write(STRUCT_END_OF_HEADER.pack(MAGIC_END_OF_HEADER))
+        self.fp.close()
+        self.fp = None
+
+
+def compress_block(data, method):
+    if method == COMPRESS_METHOD_STORE:
+        return data
+    if method == COMPRESS_METHOD_DEFLATE:
+        compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+        return compressor.compress(data) + compressor.flush()
+    if method == COMPRESS_METHOD_BZIP2:
+        return bz2.compress(data)
+    raise ValueError(f"Unsupported EGG compress method {method}")
+
+
+class LegacyZipInfo(zipfile.ZipInfo):
+    """
+    UTF-8 플래그 없이 cp949 로 이름을 기록하는 ZipInfo (한국어 Windows 압축 프로그램이 만든 zip 과 같음).
+    """
+
+    def _encodeFilenameFlags(self):
+        return self.filename.encode('cp949'), self.flag_bits
+
+
+def write_zip(path, members, legacy_names=False, compression=zipfile.ZIP_DEFLATED):
+    """
+    members ((이름, 데이터) 리스트)로 zip 파일을 만듭니다.
+    legacy_names 가 True 이면 이름을 UTF-8 플래그 없이 cp949 로 기록합니다.
+    """
+    with zipfile.ZipFile(path, 'w', compression) as zip_file:
+        for name, data in members:
+            if legacy_names:
+                info = LegacyZipInfo(name, date_time=(2023, 10, 1, 0, 0, 0))
+                info.compress_type = compression
+                zip_file.writestr(info, data)
+            else:
+                zip_file.writestr(name, data)
+
+
+def split_zip(path, volume_size):
+    """
+    zip 파일을 분할 압축 볼륨(이름.z01, 이름.z02, ..., 이름.zip)으로 나눕니다. (Zip64 는 지원하지 않음)
+    압축 데이터는 volume_size 바이트씩 나누고, 중앙 디렉터리는 마지막 볼륨(.zip)에 둡니다.
+
+    Returns:
+        list: 볼륨 경로 리스트.
+    """
+    with open(path, 'rb') as file:
+        data = file.read()
+    eocd_pos = data.rfind(MAGIC_END_OF_CENTRAL_DIR)
+    (_, _, _, _, entry_count, cd_size, cd_offset,
+     comment_size) = STRUCT_END_OF_CENTRAL_DIR.unpack_from(data, eocd_pos)
+
+    disk_count = (cd_offset + volume_size - 1) // volume_size + 1
+    last_disk = disk_count - 1
+
+    # 중앙 디렉터리 항목마다 local header 가 있는 볼륨과 볼륨 안의 오프셋으로 수정
+    central_dir = bytearray(data[cd_offset:cd_offset + cd_size])
+    pos = 0
+    while pos < len(central_dir):
+        if central_dir[pos:pos + 4] != MAGIC_CENTRAL_DIR:
+            raise zipfile.BadZipFile("Bad magic number for central directory")
+        name_size, extra_size, comment_len = STRUCT_CENTRAL_DIR_SIZES.unpack_from(central_dir, pos + 28)
+        header_offset = STRUCT_CENTRAL_DIR_OFFSET.unpack_from(central_dir, pos + 42)[0]
+        STRUCT_CENTRAL_DIR_DISK.pack_into(central_dir, pos + 34, header_offset // volume_size)
+        STRUCT_CENTRAL_DIR_OFFSET.pack_into(central_dir, pos + 42, header_offset % volume_size)
+        pos += CENTRAL_DIR_HEADER_SIZE + name_size + extra_size + comment_len
+
+    end_of_central_dir = STRUCT_END_OF_CENTRAL_DIR.pack(
+        MAGIC_END_OF_CENTRAL_DIR, last_disk, last_disk, entry_count, entry_count,
+        cd_size, 0, comment_size) + data[eocd_pos + STRUCT_END_OF_CENTRAL_DIR.size:]
+
+    stem = os.path.splitext(path)[0]
+    volumes = []
+    for disk in range(last_disk):
+        volume = f'{stem}.z{disk + 1:02d}'
+        with open(volume, 'wb') as file:
+            file.write(data[disk * volume_size:min((disk + 1) * volume_size, cd_offset)])
+        volumes.append(volume)
+    with open(path, 'wb') as file:
+        file.write(bytes(central_dir) + end_of_central_dir)
+    volumes.append(path)
+    return volumes
+
+
+class CorpusBuilder:
+    """
+    국정감사 제출자료와 비슷한 폴더 구조의 합성 데이터를 만듭니다.
+    위원회/피감기관/'이름 위원'/문서 종류 폴더 아래에 문서 파일과 압축 파일(zip, cp949 이름 zip, 분할 zip, egg)을 둡니다.
+    같은 seed 이면 같은 폴더 구조를 만듭니다.
+
+    Attributes:
+        root (str): 만들 폴더 경로.
+        file_count (int): 만들 파일 수 (압축 파일 포함, 분할 볼륨은 하나로 셈).
+        archive_ratio (float): 파일 중 압축 파일의 비율.
+        archive_entries (int): 압축 파일 하나의 평균 내부 파일 수.
+        files_per_folder (int): 폴더 하나의 평균 파일 수.
+    """
+
+    def __init__(self, root, file_count=1000, archive_ratio=0.05, archive_entries=200,
+                 files_per_folder=20, seed=0):
+        self.root = root
+        self.file_count = file_count
+        self.archive_ratio = archive_ratio
+        self.archive_entries = archive_entries
+        self.files_per_folder = files_per_folder
+        self.random = random.Random(seed)
+        keywords = MetadataGenerator()
+        self.organizations = keywords.organizations
+        self.names_21 = keywords.names_21
+        self.file_keywords = keywords.file_attach + keywords.file_answer + keywords.file_require
+        self.stats = {'files': 0, 'documents': 0, 'archives': 0, 'archive_entries': 0, 'bytes': 0}
+
+    def build(self):
+        """
+        폴더를 만들고 통계 딕셔너리를 반환합니다.
+        """
+        rng = self.random
+        while self.stats['files'] < self.file_count:
+            folder = os.path.join(
+                self.root, rng.choice(COMMITTEES), rng.choice(self.organizations),
+                f'{rng.choice(self.names_21)} 위원', rng.choice(DOCUMENT_FOLDERS))
+            os.makedirs(folder, exist_ok=True)
+            count = min(rng.randint(1, self.files_per_folder * 2 - 1),
+                        self.file_count - self.stats['files'])
+            for _ in range(count):
+                if rng.random() < self.archive_ratio:
+                    self.write_archive(folder, rng.choice(ARCHIVE_KINDS))
+                else:
+                    self.write_document(folder)
+        return self.stats
+
+    def document_name(self, extension):
+        rng = self.random
+        prefix = rng.choice(['', '[붙임] ', '(별첨) ', ''])
+        return f'{prefix}{rng.choice(self.file_keywords)} {rng.randint(1, 99999)}{extension}'
+
+    def document_data(self):
+        # Random.randbytes 는 Python 3.9 부터 지원
+        size = self.random.randint(16, 2048)
+        return bytes(self.random.getrandbits(8) for _ in range(size))
+
+    def unused_path(self, folder, extension):
+        while True:
+            path = os.path.join(folder, self.document_name(extension))
+            if not os.path.exists(path):
+                return path
+
+    def write_document(self, folder):
+        path = self.unused_path(folder, self.random.choice(DOCUMENT_EXTENSIONS))
+        data = self.document_data()
+        with open(path, 'wb') as file:
+            file.write(data)
+        self.stats['files'] += 1
+        self.stats['documents'] += 1
+        self.stats['bytes'] += len(data)
+
+    def archive_members(self):
+        rng = self.random
+        entry_count = max(1, int(rng.gauss(self.archive_entries, self.archive_entries / 4)))
+        subfolders = ['', '1. 요구자료/', '2. 답변서/', '붙임/']
+        members = {}
+        while len(members) < entry_count:
+            name = rng.choice(subfolders) + self.document_name(rng.choice(DOCUMENT_EXTENSIONS))
+            # 압축이 되는 반복 내용
+            members[name] = rng.choice(self.file_keywords).encode('utf-8') * rng.randint(1, 64)
+        return list(members.items())
+
+    def write_archive(self, folder, kind):
+        rng = self.random
+        members = self.archive_members()
+        if kind == 'egg':
+            path = self.unused_path(folder, '.egg')
+            method = rng.choice([COMPRESS_METHOD_STORE, COMPRESS_METHOD_DEFLATE, COMPRESS_METHOD_BZIP2])
+            with EggWriter(path, area_code=rng.random() < 0.5) as egg_file:
+                for name, data in members:
+                    egg_file.write(name, data, method)
+            volumes = [path]
+        else:
+            path = self.unused_path(folder, '.zip')
+            write_zip(path, members, legacy_names=kind == 'cp949_zip')
+            volumes = [path]
+            if kind == 'split_zip':
+                volumes = split_zip(path, max(1024, os.path.getsize(path) // 3))
+        for volume in volumes:
+            self.stats['bytes'] += os.path.getsize(volume)
+        self.stats['files'] += 1
+        self.stats['archives'] += 1
+        self.stats['archive_entries'] += len(members)
+
+
+def build_corpus(root, file_count=1000, archive_ratio=0.05, archive_entries=200, seed=0):
+    """
+    CorpusBuilder 로 root 아래에 합성 데이터를 만들고 통계 딕셔너리를 반환합니다.
+    """
+    return CorpusBuilder(root, file_count, archive_ratio, archive_entries, seed=seed).build()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='국정감사 제출자료 합성 데이터 생성')
+    parser.add_argument('root', help='만들 폴더 경로')
+    parser.add_argument('--files', type=int, default=1000, help='파일 수 (기본 1000)')
+    parser.add_argument('--archive-ratio', type=float, default=0.05, help='압축 파일 비율 (기본 0.05)')
+    parser.add_argument('--archive-entries', type=int, default=200, help='압축 파일 평균 내부 파일 수 (기본 200)')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    print(build_corpus(args.root, args.files, args.archive_ratio, args.archive_entries, args.seed))